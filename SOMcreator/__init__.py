@@ -7,4 +7,3 @@ from .util.project import merge_projects
 from .exporter.excel.core import export as export_excel
 
 __version__ = "1.8.2"
-active_project = None
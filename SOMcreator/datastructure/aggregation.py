@@ -2,10 +2,12 @@ from __future__ import annotations
 from uuid import uuid4
 import SOMcreator
 from .base import Hirarchy
+from . import events
 
 
 class Aggregation(Hirarchy):
-    _registry: set[Aggregation] = set()
+    __slots__ = ("object", "_parent_connection", "_identity_text", "_identity_cache", "_identity_prefix_cache",
+                 "_ancestor_objects_cache")
 
     def __str__(self):
         return self.name
@@ -15,8 +17,10 @@ class Aggregation(Hirarchy):
                  description: None | str = None,
                  optional: None | bool = None, filter_matrix: list[list[bool]] = None,identity_text = None):
 
+        self._identity_cache: str | None = None
+        self._identity_prefix_cache: str | None = None
+        self._ancestor_objects_cache: frozenset[SOMcreator.Object] | None = None
         super(Aggregation, self).__init__(obj.name, description, optional, obj.project, filter_matrix)
-        self._registry.add(self)
         if uuid is None:
             self.uuid = str(uuid4())
         else:
@@ -48,6 +52,8 @@ class Aggregation(Hirarchy):
     @parent_connection.setter
     def parent_connection(self, value):
         self._parent_connection = value
+        self._inheritance_changed()
+        self._notify(events.MODIFIED)
 
     @property
     def parent(self) -> Aggregation:
@@ -58,29 +64,42 @@ class Aggregation(Hirarchy):
             return False
         self._parent = value
         self._parent_connection = connection_type
+        self._inheritance_changed()
+        self._notify(events.REPARENTED)
         return True
 
+    def _clear_inheritance_cache(self) -> bool:
+        cached = super(Aggregation, self)._clear_inheritance_cache()
+        cached = cached or self._identity_cache is not None or self._identity_prefix_cache is not None
+        cached = cached or self._ancestor_objects_cache is not None
+        self._identity_cache = None
+        self._identity_prefix_cache = None
+        self._ancestor_objects_cache = None
+        return cached
+
+    def get_ancestor_objects(self) -> frozenset[SOMcreator.Object]:
+        """returns the Objects of all parent Aggregations. Cached until the parent chain changes"""
+        if self._ancestor_objects_cache is None:
+            parent = self.parent
+            if parent is None:
+                self._ancestor_objects_cache = frozenset()
+            else:
+                self._ancestor_objects_cache = parent.get_ancestor_objects() | {parent.object}
+        return self._ancestor_objects_cache
+
     def add_child(self, child: Aggregation, connection_type: int = SOMcreator.value_constants.AGGREGATION) -> bool:
         """returns if adding child is allowed"""
 
-        def loop_parents(element, search_value):
-            if element.parent is None:
-                return True
-            if element.parent.object == search_value:
-                return False
-            else:
-                return loop_parents(element.parent, search_value)
-
         if child.object == self.object:
             return False
 
-        if not loop_parents(self, child.object):
+        if child.object in self.get_ancestor_objects():
             return False
 
         if not child.set_parent(self, connection_type):
             return False
 
-        self._children.add(child)
+        self._add_to_children(child)
         child.parent_connection = connection_type
         return True
 
@@ -98,18 +117,31 @@ class Aggregation(Hirarchy):
         hierarchy of the current aggregation object. It includes the abbreviation
         of each parent object and its identity text, if available. The identifier
         is built in a reversed order, starting from the root to the current object.
+        The result is cached until the parent chain, a connection, an abbreviation or an identity text changes.
 
         Returns:
             str: A unique identifier string for the aggregation group.
         """
 
-        element = self
-        while element.parent_connection == SOMcreator.value_constants.INHERITANCE:
-            element = element.parent
+        if self._identity_cache is None:
+            identity_text = self._get_identity_prefix()
+            own_text = f"{self.object.abbreviation}_{{{self.get_identity_text() or SOMcreator.value_constants.IDENTITY_PLACEHOLDER}}}"
+            self._identity_cache = "_".join((identity_text, own_text)) if identity_text else own_text
+        return self._identity_cache
 
-        identity_text = element.parent.identity() if not element.is_root else ""
-        own_text = f"{self.object.abbreviation}_{{{self.get_identity_text() or SOMcreator.value_constants.IDENTITY_PLACEHOLDER}}}"
-        return "_".join((identity_text, own_text)) if identity_text else own_text
+    def _get_identity_prefix(self) -> str:
+        """
+        identity of the first parent that isn't connected by inheritance.
+        Identities are cached per node, so building the identities of a whole tree visits every node once
+        """
+        if self._identity_prefix_cache is None:
+            if self.is_root:
+                self._identity_prefix_cache = ""
+            elif self.parent_connection == SOMcreator.value_constants.INHERITANCE:
+                self._identity_prefix_cache = self.parent._get_identity_prefix()
+            else:
+                self._identity_prefix_cache = self.parent.identity()
+        return self._identity_prefix_cache
 
     
     def get_identity_text(self) -> str:
@@ -122,4 +154,6 @@ class Aggregation(Hirarchy):
         Args:
             text (str): The identity text to be set.
         """
-        self._identity_text = text
\ No newline at end of file
+        self._identity_text = text
+        self._inheritance_changed()
+        self._notify(events.MODIFIED)
\ No newline at end of file
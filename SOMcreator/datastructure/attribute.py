@@ -1,12 +1,25 @@
 from __future__ import annotations
 from uuid import uuid4
 import SOMcreator
-from .base import Hirarchy
+from .base import Hirarchy, intern_string
+from . import events
 import copy as cp
 
 
+def _value_key(value):
+    """Range values are stored as lists, which aren't hashable"""
+    if isinstance(value, list):
+        return tuple(_value_key(v) for v in value)
+    return value
+
+
+def _value_keys(values: list) -> set:
+    return {_value_key(v) for v in values}
+
+
 class Attribute(Hirarchy):
-    _registry: set[Attribute] = set()
+    __slots__ = ("_value_cache", "_value_keys_cache", "_is_inheriting_cache", "_value", "_property_set",
+                 "_value_type", "_data_type", "_revit_name", "_child_inherits_values")
 
     def __init__(self, property_set: SOMcreator.PropertySet | None = None, name: str = "undef", value: list = None, value_type:str|None=None,
                  data_type: str = SOMcreator.value_constants.LABEL,
@@ -15,22 +28,23 @@ class Attribute(Hirarchy):
                  project: SOMcreator.Project | None = None,
                  filter_matrix: list[list[bool]] = None):
 
+        if project is None and property_set is not None:
+            project = property_set.project
         super(Attribute, self).__init__(name, description, optional, project, filter_matrix)
+        self._value_cache: list | None = None
+        self._value_keys_cache: set | None = None
+        self._is_inheriting_cache: bool | None = None
         self._value = value
         self._property_set = property_set
-        self._value_type = value_type
-        self._data_type = data_type
-        self._registry.add(self)
+        self._value_type = intern_string(value_type)
+        self._data_type = intern_string(data_type)
         if revit_mapping is None:
-            self._revit_name = name
+            self._revit_name = self._name
         else:
-            self._revit_name = revit_mapping
+            self._revit_name = intern_string(revit_mapping)
 
         self._child_inherits_values = child_inherits_values
-        self.uuid = uuid
-
-        if self.uuid is None:
-            self.uuid = str(uuid4())
+        self.uuid = str(uuid4()) if uuid is None else uuid
         if value is None:
             self.value = list()
         if value_type is None:
@@ -54,7 +68,7 @@ class Attribute(Hirarchy):
                                uuid=str(uuid4()),
                                description=self.description, optional=self.is_optional(ignore_hirarchy=True),
                                revit_mapping=self.revit_name,
-                               project=self.project, filter_matrix=self._filter_matrix)
+                               project=self.project, filter_matrix=self.get_filter_matrix())
 
         if self.parent is not None:
             self.parent.add_child(new_attrib)
@@ -73,6 +87,7 @@ class Attribute(Hirarchy):
     @revit_name.setter
     def revit_name(self, value: str) -> None:
         self._revit_name = value
+        self._notify(events.MODIFIED)
 
     @property
     def child_inherits_values(self) -> bool:
@@ -81,6 +96,41 @@ class Attribute(Hirarchy):
     @child_inherits_values.setter
     def child_inherits_values(self, value: bool) -> None:
         self._child_inherits_values = value
+        self._values_changed()
+
+    @property
+    def parent(self) -> Attribute:
+        return super(Attribute, self).parent
+
+    @parent.setter
+    def parent(self, parent: Attribute) -> None:
+        Hirarchy.parent.fset(self, parent)
+        self._values_changed()
+
+    def remove_parent(self) -> None:
+        super(Attribute, self).remove_parent()
+        self._values_changed()
+
+    def _values_changed(self) -> None:
+        """gets called if the (inherited) values of this Attribute might have changed"""
+        self._value_cache = None
+        self._value_keys_cache = None
+        self._is_inheriting_cache = None
+        for child in self._children:
+            child._values_changed()
+        if self.project is not None and self.is_identifier():
+            self.project.reset_ident_dict()
+        self._notify(events.VALUE_CHANGED)
+
+    def is_identifier(self) -> bool:
+        """True if this Attribute is the ident_attrib of the Object its PropertySet belongs to"""
+        obj = self._property_set.object if self._property_set is not None else None
+        return obj is not None and obj._ident_attrib is self
+
+    def _name_changed(self) -> None:
+        super(Attribute, self)._name_changed()
+        if self._property_set is not None:
+            self._property_set._reset_attribute_name_dict()
 
     @property
     def name(self) -> str:
@@ -89,40 +139,53 @@ class Attribute(Hirarchy):
     @name.setter
     def name(self, value: str) -> None:
         # ToDo: add request for unlink
-        self._name = value
+        self._name = intern_string(value)
+        self._name_changed()
         for child in self.get_children(filter=False):
             child.name = value
 
     @property
     def is_inheriting_values(self) -> bool:
-        if self.parent is None:
-            return False
-        if self.parent.is_inheriting_values or self.parent.child_inherits_values:
-            return True
-        return False
+        if self._is_inheriting_cache is None:
+            parent = self.parent
+            self._is_inheriting_cache = parent is not None and (
+                    parent.is_inheriting_values or parent.child_inherits_values)
+        return self._is_inheriting_cache
 
     def get_own_values(self):
         """returns values without inherited values"""
         if not self.parent:
             return self._value
-        return [v for v in self._value if v not in self.parent.value]
+        parent_values = self.parent._get_value_keys()
+        return [v for v in self._value if _value_key(v) not in parent_values]
+
+    def _get_value_keys(self) -> set:
+        """hashable version of value for fast membership tests"""
+        if self._value_keys_cache is None:
+            self._value_keys_cache = _value_keys(self.value)
+        return self._value_keys_cache
 
     @property
     def value(self) -> list:
-        if self.is_inheriting_values:
-            return self.parent.value + self.get_own_values()
-        return self._value
+        """
+        values are cached, the cache gets reset if the values of the Attribute or one of its parents change.
+        Don't modify the returned list, use the setter instead
+        """
+        if self._value_cache is None:
+            if self.is_inheriting_values:
+                self._value_cache = self.parent.value + self.get_own_values()
+            else:
+                self._value_cache = self._value
+        return self._value_cache
 
     @value.setter
     def value(self, values: list) -> None:
         if self.is_inheriting_values:
-            own_values = list()
-            for value in values:
-                if value not in self.parent.value:
-                    own_values.append(value)
-            self._value = own_values
+            parent_values = self.parent._get_value_keys()
+            self._value = [v for v in values if _value_key(v) not in parent_values]
         else:
             self._value = values
+        self._values_changed()
 
     @property
     def value_type(self) -> str:
@@ -130,13 +193,15 @@ class Attribute(Hirarchy):
 
     @value_type.setter
     def value_type(self, value: str):
-
+        value = intern_string(value)
         if not self.is_child:
             self._value_type = value
 
         if self.is_parent:
             for child in self.get_children(filter=False):
                 child._value_type = value
+                child._notify(events.MODIFIED)
+        self._notify(events.MODIFIED)
 
     @property
     def data_type(self) -> str:
@@ -149,12 +214,15 @@ class Attribute(Hirarchy):
 
     @data_type.setter
     def data_type(self, value: str) -> None:
+        value = intern_string(value)
         if not self.is_child:
             self._data_type = value
 
         if self.is_parent:
             for child in self.get_children(filter=False):
                 child._data_type = value
+                child._notify(events.MODIFIED)
+        self._notify(events.MODIFIED)
 
     @property
     def property_set(self) -> SOMcreator.PropertySet:
@@ -167,9 +235,10 @@ class Attribute(Hirarchy):
                 return
             self._property_set.remove_attribute(self)
             return
-        if self not in value.get_attributes(filter=False):
+        if self not in value._attributes:
             value.add_attribute(self)
         self._property_set = value
+        self._notify(events.MODIFIED)
     def is_equal(self, attribute: Attribute) -> bool:
         equal = True
 
@@ -1,14 +1,27 @@
 from __future__ import annotations
 
-import copy
-
 from SOMcreator.constants import value_constants
 import SOMcreator
 from typing import Iterator, Callable
 import logging
+import sys
 import SOMcreator.datastructure.som_json
+from .som_json import IFC_MAPPING
+from . import events
 
 FILTER_KEYWORD = "filter"
+FilterMatrix = tuple[tuple[bool, ...], ...]
+DEFAULT_MAPPING_DICT = {
+    value_constants.SHARED_PARAMETERS: True,
+    IFC_MAPPING:                       True
+}
+
+
+def intern_string(value):
+    """names and datatypes repeat a lot, interned strings are stored only once"""
+    if type(value) is str:
+        return sys.intern(value)
+    return value
 
 
 def filterable(func: Callable):
@@ -33,39 +46,46 @@ def filterable(func: Callable):
 
 
 class IterRegistry(type):
-    _registry = set()
-    """ Helper for Iteration"""
+    """ Announces new entities to their Project. Use Project.get_items_sorted_by_name to iterate over them"""
 
-    def __iter__(self) -> Iterator[
-        SOMcreator.PropertySet | SOMcreator.Object | SOMcreator.Attribute | SOMcreator.Aggregation]:
-        return iter(sorted(list(self._registry), key=lambda x: x.name))
-
-    def __len__(self) -> int:
-        return len(self._registry)
+    def __call__(cls, *args, **kwargs):
+        """announces new entities after they are fully constructed"""
+        instance = super().__call__(*args, **kwargs)
+        instance._constructed = True
+        project = instance._project
+        if project is not None and project._pending_items is None:
+            project.notify(events.CREATED, instance)
+        return instance
 
 
 class Hirarchy(object, metaclass=IterRegistry):
+    # __dict__ is only allocated if somebody attaches additional attributes (e.g. the GUI)
+    __slots__ = ("_project", "_uuid", "_dirty", "_constructed", "_filter_slot", "_parent", "_children", "_name",
+                 "_mapping_dict", "_description", "_optional", "_description_cache", "_optional_cache", "__dict__",
+                 "__weakref__")
 
     def __init__(self, name: str, description: str | None = None, optional: bool | None = None,
                  project: SOMcreator.Project | None = None,
-                 filter_matrix: list[list[bool]] = None) -> None:
+                 filter_matrix: list[list[bool]] | FilterMatrix = None) -> None:
         if project is None:
-            project = SOMcreator.active_project
+            raise ValueError(f"{type(self).__name__} '{name}' needs a Project")
 
         self._project = project
+        self._uuid: str | None = None
+        self._dirty = False
+        self._constructed = False
         project.add_item(self)
 
         if filter_matrix is None:
             filter_matrix = project.create_filter_matrix(True)
 
-        self._filter_matrix = copy.deepcopy(filter_matrix)
+        self._filter_slot: int = project._use_filter_slot(filter_matrix)
         self._parent = None
-        self._children = set()
-        self._name = name
-        self._mapping_dict = {
-            value_constants.SHARED_PARAMETERS:  True,
-            SOMcreator.datastructure.som_json.IFC_MAPPING: True
-        }
+        self._children: set | tuple = ()  # replaced by a set once the first child gets added
+        self._description_cache: str | None = None
+        self._optional_cache: bool | None = None
+        self._name = intern_string(name)
+        self._mapping_dict: dict[str, bool] | None = None  # allocated on first access
         self._description = ""
         if description is not None:
             self.description = description
@@ -78,10 +98,29 @@ class Hirarchy(object, metaclass=IterRegistry):
         if self.parent is not None:
             if self in self.parent._children:
                 self.parent.remove_child(self)
-        self._parent = None
+        if self._parent is not None:
+            self._parent = None
+            self._inheritance_changed()
+            self._notify(events.REPARENTED)
 
-    def get_filter_matrix(self):
-        return copy.deepcopy(self._filter_matrix)
+    def _notify(self, event_type: str) -> None:
+        if self._project is not None and self._constructed:
+            self._project.notify(event_type, self)
+
+    @property
+    def is_dirty(self) -> bool:
+        """returns if the entity was created or changed since the Project was loaded or saved"""
+        return self._dirty
+
+    def get_filter_matrix(self) -> FilterMatrix:
+        """returns the immutable (shared) filter matrix [Phase][Usecase] = State"""
+        return self._project.get_filter_matrix_by_slot(self._filter_slot)
+
+    def set_filter_matrix(self, matrix: list[list[bool]] | FilterMatrix) -> None:
+        slot = self.project._use_filter_slot(matrix)
+        self.project._release_filter_slot(self._filter_slot)
+        self._filter_slot = slot
+        self._notify(events.FILTER_CHANGED)
 
     def get_filter_state(self, phase: SOMcreator.Phase, usecase: SOMcreator.UseCase) -> bool | None:
         if self.project:
@@ -98,29 +137,14 @@ class Hirarchy(object, metaclass=IterRegistry):
             usecase_index = self.project.get_usecase_index(usecase)
         if phase_index is None or usecase_index is None:
             return None
-        return bool(self._filter_matrix[phase_index][usecase_index])
+        return bool(self.get_filter_matrix()[phase_index][usecase_index])
 
     def set_filter_state(self, phase: SOMcreator.Phase, usecase: SOMcreator.UseCase, value: bool) -> None:
         phase_index = self.project.get_phase_index(phase)
         usecase_index = self.project.get_usecase_index(usecase)
-        self._filter_matrix[phase_index][usecase_index] = value
-
-    def remove_phase(self, phase: SOMcreator.Phase) -> None:
-        phase_index = self.project.get_phase_index(phase)
-        self.get_filter_matrix().pop(phase_index)
-
-    def remove_usecase(self, usecase: SOMcreator.UseCase) -> None:
-        usecase_index = self.project.get_usecase_index(usecase)
-        for usecase_list in self._filter_matrix:
-            usecase_list.pop(usecase_index)
-
-    def add_phase(self) -> None:
-        usecases = self.project.get_usecases()
-        self._filter_matrix.append([True for _ in usecases])
-
-    def add_usecase(self) -> None:
-        for usecase_list in self._filter_matrix:
-            usecase_list.append(True)
+        matrix = [list(usecase_list) for usecase_list in self.get_filter_matrix()]
+        matrix[phase_index][usecase_index] = value
+        self.set_filter_matrix(matrix)
 
     def is_active(self) -> bool:
         """
@@ -129,46 +153,76 @@ class Hirarchy(object, metaclass=IterRegistry):
         """
         if not self.project:
             return True
-        for phase in self.project.active_phases:
-            for usecase in self.project.active_usecases:
-                if self.get_filter_state(phase, usecase):
-                    return True
-        return False
+        return self.project.is_filter_slot_active(self._filter_slot)
 
     @property
     def project(self):
         return self._project
 
+    @property
+    def uuid(self) -> str | None:
+        return self._uuid
+
+    @uuid.setter
+    def uuid(self, value: str | None) -> None:
+        old_uuid = self._uuid
+        self._uuid = value
+        if self._project is not None:
+            self._project.update_uuid(self, old_uuid)
+        self._notify(events.MODIFIED)
+
+    def _inheritance_changed(self) -> None:
+        """gets called if the parent chain or a value that is inherited by the children changed"""
+        if not self._clear_inheritance_cache():
+            return  # children only cache values that depend on this entity if it has cached them itself
+        for child in self._children:
+            child._inheritance_changed()
+
+    def _clear_inheritance_cache(self) -> bool:
+        """clears all values resolved through the parent chain. Returns if anything was cached"""
+        cached = self._description_cache is not None or self._optional_cache is not None
+        self._description_cache = None
+        self._optional_cache = None
+        return cached
+
     def is_optional(self, ignore_hirarchy=False) -> bool:
         if ignore_hirarchy:
             return self._optional
-        if self.parent is not None:
-            if self.parent.is_optional():
-                return True
-        return self._optional
+        if self._optional_cache is None:
+            parent = self.parent
+            self._optional_cache = True if parent is not None and parent.is_optional() else self._optional
+        return self._optional_cache
 
     def set_optional(self, optional: bool) -> None:
         self._optional = optional
+        self._inheritance_changed()
+        self._notify(events.MODIFIED)
 
     @property
     def description(self):
-        if self.parent is None:
-            return self._description
-        if self._description:
-            return self._description
-        return self.parent.description
+        if self._description_cache is None:
+            if self.parent is None or self._description:
+                self._description_cache = self._description
+            else:
+                self._description_cache = self.parent.description
+        return self._description_cache
 
     @description.setter
     def description(self, value):
         self._description = value
+        self._inheritance_changed()
+        self._notify(events.MODIFIED)
 
     @property
     def mapping_dict(self) -> dict[str, bool]:
+        if self._mapping_dict is None:
+            self._mapping_dict = dict(DEFAULT_MAPPING_DICT)
         return self._mapping_dict
 
     @mapping_dict.setter
     def mapping_dict(self, value: dict[str, bool]) -> None:
         self._mapping_dict = value
+        self._notify(events.MODIFIED)
 
     @property
     def name(self) -> str:
@@ -176,10 +230,16 @@ class Hirarchy(object, metaclass=IterRegistry):
 
     @name.setter
     def name(self, value: str):
-        self._name = value
+        self._name = intern_string(value)
+        self._name_changed()
         for child in self.get_children(filter=False):
             child.name = value
 
+    def _name_changed(self) -> None:
+        if self.project is not None:
+            self.project.reset_sorted_items()
+        self._notify(events.RENAMED)
+
     @property
     def parent(self) -> SOMcreator.PropertySet | SOMcreator.Object | SOMcreator.Attribute | SOMcreator.Aggregation:
         return self._parent
@@ -191,7 +251,9 @@ class Hirarchy(object, metaclass=IterRegistry):
             self.parent._children.remove(self)
         self._parent = parent
         if parent is not None:
-            self._parent._children.add(self)
+            self._parent._add_to_children(self)
+        self._inheritance_changed()
+        self._notify(events.REPARENTED)
 
     @property
     def is_parent(self) -> bool:
@@ -207,13 +269,21 @@ class Hirarchy(object, metaclass=IterRegistry):
     @filterable
     def get_children(self) -> Iterator[
         SOMcreator.PropertySet | SOMcreator.Object | SOMcreator.Attribute | SOMcreator.Aggregation]:
+        if self._project is not None and self._project._lazy_store is not None:
+            # children can be part of Objects that weren't loaded yet
+            self._project._lazy_store.load_children(self)
         return iter(self._children)
 
     def add_child(self,
                   child: SOMcreator.PropertySet | SOMcreator.Object | SOMcreator.Attribute | SOMcreator.Aggregation) -> None:
-        self._children.add(child)
+        self._add_to_children(child)
         child.parent = self
 
+    def _add_to_children(self, child: Hirarchy) -> None:
+        if not self._children:
+            self._children = set()
+        self._children.add(child)
+
     def remove_child(self,
                      child: SOMcreator.PropertySet | SOMcreator.Object | SOMcreator.Attribute | SOMcreator.Aggregation | Hirarchy) -> None:
         if child in self._children:
@@ -225,9 +295,6 @@ class Hirarchy(object, metaclass=IterRegistry):
         if self.parent is not None:
             self.parent.remove_child(self)
 
-        if self in self._registry:
-            self._registry.remove(self)
-
         if recursive:
             for child in list(self.get_children(filter=False)):
                 child.delete(recursive)
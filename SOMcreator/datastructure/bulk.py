@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from typing import Iterable, TYPE_CHECKING
+
+import SOMcreator
+from SOMcreator.util.misc import pause_gc, resume_gc
+
+if TYPE_CHECKING:
+    from .base import Hirarchy, FilterMatrix
+
+
+class BulkBuilder(object):
+    """
+    Creates many entities at once. Use via Project.bulk():
+
+        with project.bulk() as builder:
+            obj = builder.create_object("Wall", abbreviation="W")
+            pset = builder.create_property_set("Pset_WallCommon", obj=obj)
+            builder.create_attribute(pset, "LoadBearing", data_type=BOOLEAN)
+
+    While the context is open the new entities aren't indexed by the Project (get_objects etc. won't return them)
+    and parent links aren't set. Both is done once when the context is left.
+    If the context is left by an exception, the new entities get dropped instead.
+    Parents can be passed as entity or as uuid of an existing entity.
+    The garbage collector is paused while the context is open because it would scan the growing graph repeatedly
+    (see SOMcreator.util.misc.pause_gc).
+    """
+
+    def __init__(self, project: SOMcreator.Project):
+        self._project = project
+        self._filter_matrix: FilterMatrix | None = None
+        self._parent_links: list[tuple[Hirarchy, Hirarchy | str]] = list()
+        self._gc_paused = False
+
+    def __enter__(self) -> BulkBuilder:
+        self._project._begin_bulk()
+        pause_gc()
+        self._gc_paused = True
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.commit()
+        else:
+            self.rollback()
+
+    def _restore_gc(self) -> None:
+        if self._gc_paused:
+            resume_gc()
+            self._gc_paused = False
+
+    def _set_default_filter_matrix(self, kwargs: dict) -> None:
+        """all new entities share the default matrix, it gets interned once the first entity needs it"""
+        if "filter_matrix" in kwargs:
+            return
+        if self._filter_matrix is None:
+            self._filter_matrix = self._project.intern_filter_matrix(self._project.create_filter_matrix(True))
+        kwargs["filter_matrix"] = self._filter_matrix
+
+    def _add_parent_link(self, entity: Hirarchy, parent: Hirarchy | str | None) -> None:
+        if parent is not None:
+            self._parent_links.append((entity, parent))
+
+    def create_object(self, name: str, ident_attrib: SOMcreator.Attribute | str | None = None,
+                      parent: SOMcreator.Object | str | None = None, **kwargs) -> SOMcreator.Object:
+        self._set_default_filter_matrix(kwargs)
+        obj = SOMcreator.Object(name, ident_attrib, project=self._project, **kwargs)
+        self._add_parent_link(obj, parent)
+        return obj
+
+    def create_property_set(self, name: str, obj: SOMcreator.Object | None = None,
+                            parent: SOMcreator.PropertySet | str | None = None, **kwargs) -> SOMcreator.PropertySet:
+        self._set_default_filter_matrix(kwargs)
+        pset = SOMcreator.PropertySet(name, obj, project=self._project, **kwargs)
+        self._add_parent_link(pset, parent)
+        return pset
+
+    def create_attribute(self, property_set: SOMcreator.PropertySet | None, name: str, value: list | None = None,
+                         parent: SOMcreator.Attribute | str | None = None, **kwargs) -> SOMcreator.Attribute:
+        self._set_default_filter_matrix(kwargs)
+        attribute = SOMcreator.Attribute(None, name, value, project=self._project, **kwargs)
+        if property_set is not None:
+            if property_set.is_parent:
+                property_set.add_attribute(attribute)
+            else:
+                # nothing to propagate to child PropertySets, skip the checks of add_attribute
+                property_set._attach_attribute(attribute)
+        self._add_parent_link(attribute, parent)
+        return attribute
+
+    def create_objects(self, records: Iterable[dict]) -> list[SOMcreator.Object]:
+        """records contain the keyword arguments of create_object"""
+        return [self.create_object(**record) for record in records]
+
+    def create_property_sets(self, records: Iterable[dict]) -> list[SOMcreator.PropertySet]:
+        """records contain the keyword arguments of create_property_set"""
+        return [self.create_property_set(**record) for record in records]
+
+    def create_attributes(self, records: Iterable[dict]) -> list[SOMcreator.Attribute]:
+        """records contain the keyword arguments of create_attribute"""
+        return [self.create_attribute(**record) for record in records]
+
+    def commit(self) -> None:
+        """indexes all new entities and links them to their parents"""
+        self._restore_gc()
+        self._project._end_bulk()
+        parent_links, self._parent_links = self._parent_links, list()
+        for entity, parent in parent_links:
+            if isinstance(parent, str):
+                parent = self._project.get_element_by_uuid(parent)
+            if parent is not None:
+                parent.add_child(entity)
+
+    def rollback(self) -> None:
+        """drops all new entities and removes them from the existing Objects and PropertySets"""
+        self._restore_gc()
+        self._parent_links = list()
+        self._project._abort_bulk()
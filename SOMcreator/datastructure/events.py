@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .base import Hirarchy
+
+CREATED = "created"
+DELETED = "deleted"
+RENAMED = "renamed"
+REPARENTED = "reparented"
+VALUE_CHANGED = "value_changed"
+FILTER_CHANGED = "filter_changed"
+MODIFIED = "modified"  # any other change of an entity (description, mapping, data_type ...)
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """
+    describes a single change of the datastructure.
+    entity is None if the change concerns the Project itself (e.g. Phases, UseCases or the project filter)
+    """
+    event_type: str
+    entity: Hirarchy | None = None
+
+
+Listener = Callable[[list[ChangeEvent]], None]
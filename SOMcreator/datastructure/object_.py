@@ -2,21 +2,26 @@ from __future__ import annotations
 import SOMcreator
 from uuid import uuid4
 from typing import Iterator
-from .base import filterable, Hirarchy
+from .base import filterable, Hirarchy, intern_string
+from . import events
 import copy as cp
 
 
 class Object(Hirarchy):
-    _registry: set[Object] = set()
+    __slots__ = ("_property_sets", "_property_set_name_dict", "_inherited_property_sets_cache", "_ident_attrib",
+                 "_aggregations", "custom_attribues", "_abbreviation", "_ifc_mapping")
 
     def __init__(self, name: str, ident_attrib: [SOMcreator.Attribute, str], uuid: str = None,
                  ifc_mapping: set[str] | None = None, description: None | str = None,
                  optional: None | bool = None, abbreviation: None | str = None,
                  project: None | SOMcreator.Project = None,
                  filter_matrix: list[list[bool]] = None) -> None:
+        self._inherited_property_sets_cache: dict[Object, list[SOMcreator.PropertySet]] | None = None
+        if project is None and isinstance(ident_attrib, SOMcreator.Attribute):
+            project = ident_attrib.project
         super(Object, self).__init__(name, description, optional, project, filter_matrix)
-        self._registry.add(self)
         self._property_sets: list[SOMcreator.PropertySet] = list()
+        self._property_set_name_dict: dict[str, SOMcreator.PropertySet] | None = None
         self._ident_attrib = ident_attrib
         self._aggregations: set[SOMcreator.Aggregation] = set()
         self.custom_attribues = {}
@@ -29,9 +34,7 @@ class Object(Hirarchy):
         if ifc_mapping is None:
             self._ifc_mapping = {"IfcBuildingElementProxy"}
 
-        self.uuid = uuid
-        if uuid is None:
-            self.uuid = str(uuid4())
+        self.uuid = str(uuid4()) if uuid is None else uuid
 
     def __str__(self):
         return f"Object {self.name}"
@@ -61,7 +64,7 @@ class Object(Hirarchy):
                             ifc_mapping=self.ifc_mapping,
                             description=self.description, optional=self.is_optional(ignore_hirarchy=True),
                             abbreviation=self.abbreviation,
-                            project=self.project, filter_matrix=self._filter_matrix)
+                            project=self.project, filter_matrix=self.get_filter_matrix())
 
         for pset in new_property_sets:
             new_object.add_property_set(pset)
@@ -82,6 +85,9 @@ class Object(Hirarchy):
     @abbreviation.setter
     def abbreviation(self, value) -> None:
         self._abbreviation = value
+        for aggregation in self._aggregations:
+            aggregation._inheritance_changed()  # abbreviation is part of the identity
+        self._notify(events.MODIFIED)
 
     @property
     def ifc_mapping(self) -> set[str]:
@@ -94,12 +100,15 @@ class Object(Hirarchy):
             if not (item == "" or item is None):
                 value_set.add(item)
         self._ifc_mapping = value_set
+        self._notify(events.MODIFIED)
 
     def add_ifc_map(self, value: str) -> None:
         self._ifc_mapping.add(value)
+        self._notify(events.MODIFIED)
 
     def remove_ifc_map(self, value: str) -> None:
         self._ifc_mapping.remove(value)
+        self._notify(events.MODIFIED)
 
     @property
     def aggregations(self) -> set[SOMcreator.Aggregation]:
@@ -107,30 +116,34 @@ class Object(Hirarchy):
 
     def add_aggregation(self, node: SOMcreator.Aggregation) -> None:
         self._aggregations.add(node)
+        self._notify(events.MODIFIED)
 
     def remove_aggregation(self, node: SOMcreator.Aggregation) -> None:
         self._aggregations.remove(node)
+        self._notify(events.MODIFIED)
 
     @property
     def inherited_property_sets(self) -> dict[Object, list[SOMcreator.PropertySet]]:
-        def recursion(recursion_property_sets, recursion_obj: Object):
-            psets = recursion_obj.get_property_sets(filter=False)
-
-            if psets:
-                recursion_property_sets[recursion_obj] = psets
-
-            parent = recursion_obj.parent
-            if parent is not None:
-                recursion_property_sets = recursion(recursion_property_sets, parent)
-            return recursion_property_sets
-
-        property_sets = dict()
-        if self.parent is not None:
-            inherited_property_sets = recursion(property_sets, self.parent)
-        else:
+        """
+        returns {ancestor: property_sets} starting with the parent.
+        The result is cached until the parent chain or the PropertySets of an ancestor change. Don't modify it
+        """
+        if self._inherited_property_sets_cache is None:
             inherited_property_sets = dict()
-
-        return inherited_property_sets
+            parent = self.parent
+            if parent is not None:
+                psets = list(parent.get_property_sets(filter=False))
+                if psets:
+                    inherited_property_sets[parent] = psets
+                inherited_property_sets.update(parent.inherited_property_sets)
+            self._inherited_property_sets_cache = inherited_property_sets
+        return self._inherited_property_sets_cache
+
+    def _clear_inheritance_cache(self) -> bool:
+        cached = super(Object, self)._clear_inheritance_cache()
+        cached = cached or self._inherited_property_sets_cache is not None
+        self._inherited_property_sets_cache = None
+        return cached
 
     @property
     def is_concept(self) -> bool:
@@ -141,11 +154,15 @@ class Object(Hirarchy):
 
     @property
     def ident_attrib(self) -> SOMcreator.Attribute | str:
+        self._materialize()
         return self._ident_attrib
 
     @ident_attrib.setter
     def ident_attrib(self, value: SOMcreator.Attribute) -> None:
         self._ident_attrib = value
+        if self.project is not None:
+            self.project.reset_ident_dict()
+        self._notify(events.MODIFIED)
 
     # override name setter because of intheritance
     @property
@@ -154,18 +171,33 @@ class Object(Hirarchy):
 
     @name.setter
     def name(self, value: str):
-        self._name = value
+        self._name = intern_string(value)
+        self._name_changed()
+
+    def _materialize(self) -> None:
+        """loads the PropertySets if the Project was opened lazily"""
+        if self._project is not None and self._project._lazy_store is not None:
+            self._project._lazy_store.load_object(self)
 
     def add_property_set(self, property_set: SOMcreator.PropertySet) -> None:
+        self._materialize()
         self._property_sets.append(property_set)
+        self._reset_property_set_name_dict()
+        self._inheritance_changed()
         property_set.object = self
+        self._notify(events.MODIFIED)
 
     def remove_property_set(self, property_set: SOMcreator.PropertySet) -> None:
+        self._materialize()
         if property_set in self._property_sets:
             self._property_sets.remove(property_set)
+            self._reset_property_set_name_dict()
+            self._inheritance_changed()
+            self._notify(events.MODIFIED)
 
     @filterable
     def get_property_sets(self) -> Iterator[SOMcreator.PropertySet]:
+        self._materialize()
         return iter(self._property_sets)
 
     @filterable
@@ -180,17 +212,25 @@ class Object(Hirarchy):
     def delete(self, recursive: bool = False) -> None:
         super(Object, self).delete(recursive)
 
-        for pset in self.get_property_sets(filter=False):
+        # PropertySet.delete removes the PropertySet from the list
+        for pset in list(self.get_property_sets(filter=False)):
             pset.delete(recursive, override_ident_deletion=True)
 
         for aggregation in self.aggregations.copy():
             aggregation.delete(recursive)
 
     def get_property_set_by_name(self, property_set_name: str) -> SOMcreator.PropertySet | None:
-        for property_set in self.get_property_sets(filter=False):
-            if property_set.name == property_set_name:
-                return property_set
-        return None
+        """The name index is rebuilt lazily after PropertySets got added, removed or renamed"""
+        self._materialize()  # loading adds PropertySets, which resets the index
+        if self._property_set_name_dict is None:
+            name_dict = dict()
+            for property_set in self.get_property_sets(filter=False):
+                name_dict.setdefault(property_set.name, property_set)
+            self._property_set_name_dict = name_dict
+        return self._property_set_name_dict.get(property_set_name)
+
+    def _reset_property_set_name_dict(self) -> None:
+        self._property_set_name_dict = None
 
     @property
     def ident_value(self) -> str:
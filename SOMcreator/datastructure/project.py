@@ -1,12 +1,23 @@
 from __future__ import annotations
 
+import inspect
+import itertools
 import os
-from typing import Iterator
+import weakref
+from contextlib import contextmanager
+from typing import Callable, Iterator
 
 import SOMcreator
 import SOMcreator.exporter.som_json
+import SOMcreator.exporter.som_json.journal
 import SOMcreator.importer.som_json
-from .base import Hirarchy, filterable
+import SOMcreator.exporter.som_sqlite
+import SOMcreator.importer.som_sqlite
+from .base import Hirarchy, filterable, FilterMatrix
+from .bulk import BulkBuilder
+from . import events, som_sqlite
+from .events import ChangeEvent, Listener
+from .snapshot import ProjectSnapshot, SnapshotHistory, capture_state, get_owners
 
 
 class Project(object):
@@ -15,8 +26,37 @@ class Project(object):
         """
         filter_matrix: list[phase_index][usecase_index] = bool
         """
-        SOMcreator.active_project = self
+        self._listeners: list[Callable[[], Listener | None]] = list()
+        self._batch_depth = 0
+        self._mute_depth = 0
+        self._change_count = 0  # number of reported changes, snapshots remember it
+        self._pending_events: dict[ChangeEvent, None] = dict()
+        self._dirty = False
+        self._dirty_items: set[Hirarchy] = set()
+        self._deleted_items: set[Hirarchy] = set()
+        self._filter_layout_changed = False
+        self._snapshot_history: SnapshotHistory | None = None  # None until the first snapshot gets taken
+        self._source_path: str | None = None
+        self._source_hash: str | None = None  # hash of the SOM JSON file at _source_path, the base of the journal
+        self._saved_plugin_data: bytes | None = None
+        self._stale_snapshot_items: set[Hirarchy] = set()
         self._items = set()
+        self._typed_items: dict[type[Hirarchy], set[Hirarchy]] = {
+            SOMcreator.Object:      set(),
+            SOMcreator.PropertySet: set(),
+            SOMcreator.Attribute:   set(),
+            SOMcreator.Aggregation: set(),
+        }
+        self._sorted_items: dict[type[Hirarchy], list[Hirarchy]] = dict()
+        self._pending_items: list[Hirarchy] | None = None
+        self._uuid_dict: dict[str, Hirarchy] = dict()
+        self._ident_dict: dict[str, SOMcreator.Object] | None = None
+        self._filter_matrices: list[FilterMatrix] = list()  # filter slot -> filter matrix
+        self._filter_slots: dict[FilterMatrix, int] = dict()  # filter matrix -> filter slot
+        self._filter_slot_users: list[int] = list()  # filter slot -> number of items using it
+        self._free_filter_slots: list[int] = list()  # slots without users, their matrix is None
+        self._active_filter_cache: dict[int, bool] = dict()
+        self._lazy_store: SOMcreator.importer.som_sqlite.LazyStore | None = None
         self._name = ""
         self._author = author
         self._version = "1.0.0"
@@ -33,7 +73,7 @@ class Project(object):
         else:
             self._phases = phases
 
-        self.active_phases = [0]
+        self._active_phases = [0]
 
         if not usecase:
             self._usecases = [SOMcreator.UseCase("Stand", "Standard", "Auto-Generated. Please Rename")]
@@ -42,15 +82,256 @@ class Project(object):
         if filter_matrix is None:
             self._filter_matrix = self.create_filter_matrix(True)
 
-        self.active_usecases = [0]
+        self._active_usecases = [0]
         self.change_log = list()
+        self._dirty = False
+
+    # Change Notification
+
+    def add_listener(self, listener: Listener) -> None:
+        """
+        listener gets called with a list of ChangeEvents after every change (or once per batch).
+        Bound methods are referenced weakly, so listeners don't keep GUI objects alive
+        """
+        if inspect.ismethod(listener):
+            self._listeners.append(weakref.WeakMethod(listener))
+        else:
+            self._listeners.append(lambda: listener)
+
+    def remove_listener(self, listener: Listener) -> None:
+        self._listeners = [ref for ref in self._listeners if ref() not in (listener, None)]
+
+    @contextmanager
+    def batch(self):
+        """
+        collects all change notifications inside the context and hands them to the listeners at once.
+        Duplicate events get merged
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._pending_events:
+                pending_events, self._pending_events = list(self._pending_events), dict()
+                self._dispatch(pending_events)
+
+    @contextmanager
+    def _muted(self):
+        """changes inside the context aren't reported. Used by loaders, the loaded state equals the file"""
+        self._mute_depth += 1
+        try:
+            yield self
+        finally:
+            self._mute_depth -= 1
+
+    def notify(self, event_type: str, entity: Hirarchy | None = None) -> None:
+        """gets called by the datastructure after every change. entity is None for changes of the Project itself"""
+        if self._mute_depth:
+            return
+        self._dirty = True
+        self._change_count += 1
+        if entity is not None:
+            if self._snapshot_history is not None:
+                self._stale_snapshot_items.add(entity)
+            if event_type == events.DELETED:
+                self._dirty_items.discard(entity)
+                self._deleted_items.add(entity)
+            elif not entity._dirty:
+                entity._dirty = True
+                self._dirty_items.add(entity)
+        if not self._listeners:
+            return
+        event = ChangeEvent(event_type, entity)
+        if self._batch_depth:
+            self._pending_events[event] = None
+            return
+        self._dispatch([event])
+
+    def _dispatch(self, change_events: list[ChangeEvent]) -> None:
+        for ref in list(self._listeners):
+            listener = ref()
+            if listener is None:
+                self._listeners.remove(ref)
+                continue
+            listener(change_events)
+
+    def snapshot(self) -> ProjectSnapshot:
+        """
+        returns an immutable view of the current state that can be read by background jobs while editing continues.
+        The captured entity states are shared between snapshots,
+        only entities that changed since the last snapshot get captured again (see SnapshotHistory)
+        """
+        self._load_lazy_items()
+        history = self._snapshot_history
+        if history is None:
+            history = SnapshotHistory()
+            states = {item: capture_state(item) for item in self.get_hirarchy_items(filter=False)}
+        else:
+            states = dict()
+            stale_items, self._stale_snapshot_items = self._stale_snapshot_items, set()
+            # containers (children, attributes, property sets) can change without a notification of their owner
+            owners = set()
+            for item in stale_items:
+                old_state = history.get_state(item)
+                if old_state is not None:
+                    owners.update(get_owners(old_state))
+                states[item] = capture_state(item) if item in self._items else None
+                if states[item] is not None:
+                    owners.update(get_owners(states[item]))
+            for owner in owners:
+                if owner is not None and owner in self._items and owner not in states:
+                    states[owner] = capture_state(owner)
+        version = history.add_version(states)
+        self._snapshot_history = history
+        return ProjectSnapshot(self, history, version)
+
+    def is_dirty(self) -> bool:
+        """returns if anything changed since the Project was loaded or saved"""
+        return self._dirty
+
+    def get_dirty_items(self) -> set[Hirarchy]:
+        """returns all items that were created or changed since the Project was loaded or saved"""
+        return set(self._dirty_items)
+
+    def get_deleted_items(self) -> set[Hirarchy]:
+        """returns all items that were deleted since the Project was loaded or saved"""
+        return set(self._deleted_items)
+
+    def mark_saved(self, snapshot: ProjectSnapshot) -> bool:
+        """
+        gets called after a snapshot was saved (e.g. in the background).
+        Clears the dirty state if nothing changed since the snapshot was taken. Returns if it was cleared
+        """
+        if snapshot.change_count != self._change_count:
+            return False
+        self.clear_dirty()
+        return True
+
+    def is_filter_layout_changed(self) -> bool:
+        """returns if Phases or UseCases were added or removed since the Project was loaded or saved"""
+        return self._filter_layout_changed
+
+    def clear_dirty(self) -> None:
+        for item in self._dirty_items:
+            item._dirty = False
+        self._dirty_items = set()
+        self._deleted_items = set()
+        self._filter_layout_changed = False
+        self._dirty = False
 
     def add_item(self, item: Hirarchy):
+        if self._pending_items is not None:
+            self._pending_items.append(item)
+            return
+        self._register_item(item)
+        self.reset_sorted_items()
+        if isinstance(item, SOMcreator.Object):
+            self.reset_ident_dict()
+
+    def _register_item(self, item: Hirarchy):
         self._items.add(item)
+        items = self._typed_items.get(type(item))
+        if items is not None:
+            items.add(item)
+        else:
+            for item_type, items in self._typed_items.items():
+                if isinstance(item, item_type):
+                    items.add(item)
+        if item.uuid is not None:
+            self._uuid_dict[item.uuid] = item
+
+    def bulk(self) -> BulkBuilder:
+        """
+        context manager for creating many entities at once.
+        Indexing and inheritance linking are deferred until the context is left
+        """
+        return BulkBuilder(self)
+
+    def _begin_bulk(self) -> None:
+        if self._pending_items is None:
+            self._pending_items = list()
+
+    def _end_bulk(self) -> None:
+        pending_items, self._pending_items = self._pending_items, None
+        if pending_items is None:
+            return
+        with self.batch():
+            for item in pending_items:
+                self._register_item(item)
+                self.notify(events.CREATED, item)
+        self.reset_sorted_items()
+        self.reset_ident_dict()
+
+    def _abort_bulk(self) -> None:
+        pending_items, self._pending_items = self._pending_items, None
+        if pending_items is None:
+            return
+        pending = set(pending_items)
+        for item in reversed(pending_items):
+            if isinstance(item, SOMcreator.Attribute):
+                if item.property_set is not None and item.property_set not in pending:
+                    item.property_set.remove_attribute(item)
+            elif isinstance(item, SOMcreator.PropertySet):
+                if item.object is not None and item.object not in pending:
+                    item.object.remove_property_set(item)
+            if self._uuid_dict.get(item.uuid) is item:
+                self._uuid_dict.pop(item.uuid)
+            self._dirty_items.discard(item)
+            self._release_filter_slot(item._filter_slot)
 
     def remove_item(self, item: Hirarchy):
+        registered = False
+        if self._pending_items is not None and item in self._pending_items:
+            self._pending_items.remove(item)
+            registered = True
         if item in self._items:
             self._items.remove(item)
+            registered = True
+        if registered:
+            self._release_filter_slot(item._filter_slot)
+        for items in self._typed_items.values():
+            items.discard(item)
+        self.reset_sorted_items()
+        if self._uuid_dict.get(item.uuid) is item:
+            self._uuid_dict.pop(item.uuid)
+        if isinstance(item, SOMcreator.Object):
+            self.reset_ident_dict()
+        self.notify(events.DELETED, item)
+
+    def get_items_sorted_by_name(self, item_type: type[Hirarchy]) -> list[Hirarchy]:
+        """
+        returns all items of the given type (unfiltered) sorted by name.
+        The list is cached until an item gets added, removed or renamed. Don't modify the returned list
+        """
+        if item_type not in self._sorted_items:
+            if item_type is not SOMcreator.Object:
+                self._load_lazy_items()
+            items = self._typed_items.get(item_type)
+            if items is None:
+                items = [item for item in self.get_hirarchy_items(filter=False) if isinstance(item, item_type)]
+            self._sorted_items[item_type] = sorted(items, key=lambda x: x.name)
+        return self._sorted_items[item_type]
+
+    def reset_sorted_items(self) -> None:
+        if self._sorted_items:
+            self._sorted_items = dict()
+
+    def update_uuid(self, item: Hirarchy, old_uuid: str | None):
+        """keeps the uuid index in sync if the uuid of an item gets reassigned"""
+        if old_uuid is not None and self._uuid_dict.get(old_uuid) is item:
+            self._uuid_dict.pop(old_uuid)
+        if item.uuid is not None and item in self._items:
+            self._uuid_dict[item.uuid] = item
+
+    def _load_lazy_items(self) -> None:
+        """creates all PropertySets and Attributes that weren't loaded yet if the Project was opened lazily"""
+        if self._lazy_store is not None:
+            self._lazy_store.load_all()
+
+    def is_lazy(self) -> bool:
+        """True while parts of the Project are still stored in the database it was opened from"""
+        return self._lazy_store is not None
 
     @filterable
     def get_root_objects(self) -> Iterator[SOMcreator.Object]:
@@ -60,28 +341,31 @@ class Project(object):
     @filterable
     def get_hirarchy_items(self) -> Iterator[
         SOMcreator.Object, SOMcreator.PropertySet, SOMcreator.Attribute, SOMcreator.Aggregation, Hirarchy]:
-        return filter(lambda i: isinstance(i, (
-            SOMcreator.Object, SOMcreator.PropertySet, SOMcreator.Attribute, SOMcreator.Aggregation)), self._items)
+        self._load_lazy_items()
+        return itertools.chain.from_iterable(self._typed_items.values())
 
     @filterable
     def get_objects(self) -> Iterator[SOMcreator.Object]:
-        return filter(lambda item: isinstance(item, SOMcreator.Object), self._items)
+        return iter(self._typed_items[SOMcreator.Object])
 
     @filterable
     def get_property_sets(self) -> Iterator[SOMcreator.PropertySet]:
-        return filter(lambda item: isinstance(item, SOMcreator.PropertySet), self._items)
+        self._load_lazy_items()
+        return iter(self._typed_items[SOMcreator.PropertySet])
 
     @filterable
     def get_attributes(self) -> Iterator[SOMcreator.Attribute]:
-        return filter(lambda item: isinstance(item, SOMcreator.Attribute), self._items)
+        self._load_lazy_items()
+        return iter(self._typed_items[SOMcreator.Attribute])
 
     @filterable
     def get_aggregations(self) -> Iterator[SOMcreator.Aggregation]:
-        return filter(lambda item: isinstance(item, SOMcreator.Aggregation), self._items)
+        return iter(self._typed_items[SOMcreator.Aggregation])
 
     @filterable
     def get_predefined_psets(self) -> Iterator[SOMcreator.PropertySet]:
-        return filter(lambda p: p.is_predefined, self.get_property_sets(filter=False))
+        # predefined PropertySets are always loaded, the copy allows lazy loading while iterating
+        return filter(lambda p: p.is_predefined, list(self._typed_items[SOMcreator.PropertySet]))
 
     def get_main_attribute(self) -> tuple[str, str]:
         ident_attributes = dict()
@@ -105,34 +389,89 @@ class Project(object):
         else:
             return "", ""
 
+    def get_ident_dict(self) -> dict[str, SOMcreator.Object]:
+        """
+        returns {ident_value: Object} for all Objects (unfiltered).
+        The index is rebuilt lazily after an identifier changed. Don't modify the returned dict
+        """
+        if self._ident_dict is None:
+            self._ident_dict = {obj.ident_value: obj for obj in self.get_objects(filter=False)}
+        return self._ident_dict
+
+    def reset_ident_dict(self) -> None:
+        """gets called if the ident_value of any Object might have changed"""
+        self._ident_dict = None
+
     def get_object_by_identifier(self, identifier: str) -> SOMcreator.Object | None:
-        return {obj.ident_value: obj for obj in self.get_objects(filter=False)}.get(identifier)
-
-    def get_uuid_dict(self):
-        pset_dict = {pset.uuid: pset for pset in self.get_property_sets(filter=False)}
-        object_dict = {obj.uuid: obj for obj in self.get_objects(filter=False)}
-        attribute_dict = {attribute.uuid: attribute for attribute in self.get_attributes(filter=False)}
-        aggregation_dict = {aggreg.uuid: aggreg for aggreg in self.get_aggregations(filter=False)}
-        full_dict = pset_dict | object_dict | attribute_dict | aggregation_dict
-        if None in full_dict:
-            full_dict.pop(None)
-        return full_dict
+        return self.get_ident_dict().get(identifier)
+
+    def get_uuid_dict(self) -> dict[str, Hirarchy]:
+        """returns a copy of the uuid index. Use get_element_by_uuid for single lookups"""
+        self._load_lazy_items()
+        return dict(self._uuid_dict)
 
     def get_element_by_uuid(self,
                             uuid: str) -> SOMcreator.Attribute | SOMcreator.PropertySet | SOMcreator.Object | SOMcreator.Aggregation | None:
-        """warnging: don't use in iterations will slow down code substantially"""
         if uuid is None:
             return None
-        return self.get_uuid_dict().get(uuid)
+        element = self._uuid_dict.get(uuid)
+        if element is None and self._lazy_store is not None:
+            self._lazy_store.load_uuid(uuid)
+            element = self._uuid_dict.get(uuid)
+        return element
 
     @classmethod
-    def open(cls, path: str | os.PathLike) -> Project:
-        return SOMcreator.importer.som_json.open_json(cls, path)
-
-    def save(self, path: str | os.PathLike) -> dict:
-        json_dict = SOMcreator.exporter.som_json.export_json(self, path)
+    def open(cls, path: str | os.PathLike, stream: bool = False) -> Project:
+        """opens SOM JSON files and SQLite databases written by save. Databases get loaded lazily"""
+        if SOMcreator.importer.som_sqlite.is_sqlite_file(path):
+            proj = SOMcreator.importer.som_sqlite.open_sqlite(cls, path)
+        else:
+            proj = SOMcreator.importer.som_json.open_json(cls, path, stream)
+        proj._set_source(path)
+        return proj
+
+    def save(self, path: str | os.PathLike, stream: bool = False) -> dict | None:
+        """writes a SQLite database if the path ends with .somdb, SOM JSON otherwise"""
+        if os.path.splitext(path)[1].lower() == som_sqlite.SUFFIX:
+            self._load_lazy_items()
+            SOMcreator.exporter.som_sqlite.export_sqlite(self, path)
+            self.clear_dirty()
+            self._set_source(path)
+            return None
+        json_dict = SOMcreator.exporter.som_json.export_json(self, path, stream)
+        SOMcreator.exporter.som_json.journal.remove_journal(path)
+        self.clear_dirty()
+        self._set_source(path)
         return json_dict
 
+    def save_changes(self, path: str | os.PathLike) -> bool:
+        """
+        appends the changes since the last save to the journal next to the SOM JSON file (path + .journal)
+        instead of rewriting the file. Project.open replays the journal.
+        Does a full save (which removes the journal) if the Project wasn't opened from or last saved to path,
+        the journal can't be used or got too big.
+        Returns True if only the journal was written
+        """
+        if os.path.abspath(path) != self._source_path or os.path.splitext(path)[1].lower() == som_sqlite.SUFFIX:
+            self.save(path)
+            return False
+        if SOMcreator.exporter.som_json.journal.append(self, path):
+            self.clear_dirty()
+            return True
+        self.save(path, stream=True)
+        return False
+
+    @property
+    def source_path(self) -> str | None:
+        """absolute path of the file the Project was opened from or last saved to"""
+        return self._source_path
+
+    def _set_source(self, path: str | os.PathLike) -> None:
+        self._source_path = os.path.abspath(path)
+        is_json = not SOMcreator.importer.som_sqlite.is_sqlite_file(path)
+        self._source_hash = SOMcreator.exporter.som_json.journal.get_file_hash(path) if is_json else None
+        self._saved_plugin_data = SOMcreator.exporter.som_json.journal.get_plugin_data(self)
+
     @property
     def name(self) -> str:
         return self._name
@@ -140,6 +479,7 @@ class Project(object):
     @name.setter
     def name(self, value: str):
         self._name = value
+        self.notify(events.MODIFIED)
 
     @property
     def author(self) -> str:
@@ -148,6 +488,7 @@ class Project(object):
     @author.setter
     def author(self, value: str):
         self._author = value
+        self.notify(events.MODIFIED)
 
     @property
     def version(self) -> str:
@@ -156,6 +497,7 @@ class Project(object):
     @version.setter
     def version(self, value: str):
         self._version = value
+        self.notify(events.MODIFIED)
 
     @property
     def description(self):
@@ -164,6 +506,7 @@ class Project(object):
     @description.setter
     def description(self, value: str):
         self._description = value
+        self.notify(events.MODIFIED)
 
     # SOMcreator.UseCase / ProjectPhase Handling
 
@@ -176,6 +519,108 @@ class Project(object):
     def create_filter_matrix(self, default_state: bool = True):
         return [[default_state for __ in range(len(self.get_usecases()))] for _ in range(len(self.get_phases()))]
 
+    def get_filter_slot(self, matrix: list[list[bool]] | FilterMatrix) -> int:
+        """
+        Filter matrices are stored once per distinct state in a project-level table.
+        Items only hold the index (slot) of their matrix in this table,
+        so structural changes (add/remove Phase or UseCase) only touch the distinct matrices
+        """
+        slot = self._filter_slots.get(matrix) if isinstance(matrix, tuple) else None
+        if slot is not None:
+            return slot
+        key = tuple(tuple(usecase_list) for usecase_list in matrix)
+        slot = self._filter_slots.get(key)
+        if slot is None:
+            if self._free_filter_slots:
+                slot = self._free_filter_slots.pop()
+                self._filter_matrices[slot] = key
+            else:
+                slot = len(self._filter_matrices)
+                self._filter_matrices.append(key)
+                self._filter_slot_users.append(0)
+            self._filter_slots[key] = slot
+        return slot
+
+    def _use_filter_slot(self, matrix: list[list[bool]] | FilterMatrix) -> int:
+        """returns the slot of the matrix and counts the calling item as its user"""
+        slot = self.get_filter_slot(matrix)
+        self._filter_slot_users[slot] += 1
+        return slot
+
+    def _release_filter_slot(self, slot: int) -> None:
+        """the slot gets freed for reuse after its last user released it"""
+        self._filter_slot_users[slot] -= 1
+        if self._filter_slot_users[slot] > 0:
+            return
+        matrix = self._filter_matrices[slot]
+        self._filter_matrices[slot] = None
+        self._free_filter_slots.append(slot)
+        self._active_filter_cache.pop(slot, None)
+        if self._filter_slots.get(matrix) != slot:
+            return
+        self._filter_slots.pop(matrix)
+        # another slot might hold an equal matrix since a Phase or UseCase got removed
+        for other_slot, other_matrix in enumerate(self._filter_matrices):
+            if other_matrix == matrix:
+                self._filter_slots[matrix] = other_slot
+                break
+
+    def get_filter_matrix_by_slot(self, slot: int) -> FilterMatrix:
+        return self._filter_matrices[slot]
+
+    def intern_filter_matrix(self, matrix: list[list[bool]] | FilterMatrix) -> FilterMatrix:
+        """returns an immutable version of the matrix. Equal matrices share the same object"""
+        return self._filter_matrices[self.get_filter_slot(matrix)]
+
+    def _change_filter_matrices(self, func: Callable[[FilterMatrix], FilterMatrix]) -> None:
+        """applies func to every distinct filter matrix. Slots stay valid, so the items don't need to be touched"""
+        matrices = [None if matrix is None else func(matrix) for matrix in self._filter_matrices]
+        self._filter_slots = dict()
+        for slot, matrix in enumerate(matrices):
+            if matrix is not None:
+                self._filter_slots.setdefault(matrix, slot)
+        # matrices might be equal after a removal, equal matrices share the same object
+        self._filter_matrices = [None if matrix is None else matrices[self._filter_slots[matrix]] for matrix in
+                                 matrices]
+        self.reset_active_filter_cache()
+
+    def is_filter_slot_active(self, slot: int) -> bool:
+        """
+        checks if a filter matrix matches the active phases & usecases.
+        The result is cached per slot until the active selection or the project filter changes
+        """
+        state = self._active_filter_cache.get(slot)
+        if state is None:
+            matrix = self._filter_matrices[slot]
+            state = any(self._filter_matrix[phase][usecase] and matrix[phase][usecase]
+                        for phase in self._active_phases if phase is not None
+                        for usecase in self._active_usecases if usecase is not None)
+            self._active_filter_cache[slot] = state
+        return state
+
+    def reset_active_filter_cache(self) -> None:
+        self._active_filter_cache = dict()
+
+    @property
+    def active_phases(self) -> list[int]:
+        return self._active_phases
+
+    @active_phases.setter
+    def active_phases(self, value: list[int]):
+        self._active_phases = value
+        self.reset_active_filter_cache()
+        self.notify(events.FILTER_CHANGED)
+
+    @property
+    def active_usecases(self) -> list[int]:
+        return self._active_usecases
+
+    @active_usecases.setter
+    def active_usecases(self, value: list[int]):
+        self._active_usecases = value
+        self.reset_active_filter_cache()
+        self.notify(events.FILTER_CHANGED)
+
     def get_filter_matrix(self) -> list[list[bool]]:
         """
         [Phase][Usecase] = State
@@ -184,6 +629,8 @@ class Project(object):
 
     def set_filter_matrix(self, matrix: list[list[bool]]):
         self._filter_matrix = matrix
+        self.reset_active_filter_cache()
+        self.notify(events.FILTER_CHANGED)
 
     def get_filter_state(self, phase: SOMcreator.Phase, usecase: SOMcreator.UseCase):
         if phase is None or usecase is None:
@@ -196,6 +643,8 @@ class Project(object):
 
     def set_filter_state(self, phase: SOMcreator.Phase, usecase: SOMcreator.UseCase, value: bool):
         self._filter_matrix[self.get_phase_index(phase)][self.get_usecase_index(usecase)] = value
+        self.reset_active_filter_cache()
+        self.notify(events.FILTER_CHANGED)
 
     def get_phase_index(self, phase: SOMcreator.Phase) -> int | None:
         if phase in self._phases:
@@ -216,18 +665,23 @@ class Project(object):
     def add_phase(self, phase: SOMcreator.Phase):
         if phase not in self._phases:
             self._phases.append(phase)
-            for item in self.get_hirarchy_items(filter=False):
-                item.add_phase()
+            self._filter_layout_changed = True
+            new_phase = (tuple(True for _ in self._usecases),)
+            self._change_filter_matrices(lambda matrix: matrix + new_phase)
             self._filter_matrix.append([True for _ in self._usecases])
+            self.reset_active_filter_cache()
+            self.notify(events.FILTER_CHANGED)
         return self._phases.index(phase)
 
     def add_usecase(self, usecase: SOMcreator.UseCase):
         if usecase not in self._usecases:
             self._usecases.append(usecase)
-            for item in self.get_hirarchy_items(filter=False):
-                item.add_usecase()
+            self._filter_layout_changed = True
+            self._change_filter_matrices(lambda matrix: tuple(usecase_list + (True,) for usecase_list in matrix))
             for usecase_list in self._filter_matrix:
                 usecase_list.append(True)
+            self.reset_active_filter_cache()
+            self.notify(events.FILTER_CHANGED)
         return self._usecases.index(usecase)
 
     def get_phase_by_name(self, name: str):
@@ -245,9 +699,9 @@ class Project(object):
             return
         index = self.get_phase_index(phase)
         new_active_phases = [self.get_phase_by_index(i) for i in self.active_phases if i != index]
-        for item in self.get_hirarchy_items(filter=False):
-            item.remove_phase(phase)
+        self._change_filter_matrices(lambda matrix: matrix[:index] + matrix[index + 1:])
         self._phases.remove(phase)
+        self._filter_layout_changed = True
         self._filter_matrix.pop(index)
         self.active_phases = [self.get_phase_index(ph) for ph in new_active_phases]
 
@@ -260,10 +714,11 @@ class Project(object):
         new_active_usecases = [self.get_usecase_by_index(i) for i in self.active_usecases if i != index]
 
 
-        for item in self.get_hirarchy_items(filter=False):
-            item.remove_usecase(usecase)
+        self._change_filter_matrices(
+            lambda matrix: tuple(usecase_list[:index] + usecase_list[index + 1:] for usecase_list in matrix))
 
         self._usecases.remove(usecase)
+        self._filter_layout_changed = True
         for usecase_list in self._filter_matrix:
             usecase_list.pop(index)
         self.active_usecases = [self.get_usecase_index(uc) for uc in new_active_usecases]
@@ -2,26 +2,27 @@ from __future__ import annotations
 import SOMcreator
 from uuid import uuid4
 from .base import filterable, Hirarchy
+from . import events
 import copy as cp
 from typing import Iterator
 import logging
 
 
 class PropertySet(Hirarchy):
-    _registry: set[PropertySet] = set()
+    __slots__ = ("_attributes", "_object", "_attribute_name_dict")
 
     def __init__(self, name: str, obj: SOMcreator.Object = None, uuid: str = None, description: None | str = None,
                  optional: None | bool = None, project: None | SOMcreator.Project = None,
                  filter_matrix: list[list[bool]] = None) -> None:
+        if project is None and obj is not None:
+            project = obj.project
         super(PropertySet, self).__init__(name, description, optional, project, filter_matrix)
         self._attributes = set()
+        self._attribute_name_dict: dict[str, SOMcreator.Attribute] | None = None
         self._object = None
         if obj is not None:
             obj.add_property_set(self)  # adds Pset to Object and sets pset.object = obj
-        self._registry.add(self)
-        self.uuid = uuid
-        if self.uuid is None:
-            self.uuid = str(uuid4())
+        self.uuid = str(uuid4()) if uuid is None else uuid
 
     def __lt__(self, other):
         if isinstance(other, PropertySet):
@@ -35,7 +36,7 @@ class PropertySet(Hirarchy):
     def __copy__(self) -> PropertySet:
         new_pset = PropertySet(name=self.name, obj=None, uuid=str(uuid4()), description=self.description,
                                optional=self.is_optional(ignore_hirarchy=True), project=self.project,
-                               filter_matrix=self._filter_matrix)
+                               filter_matrix=self.get_filter_matrix())
 
         for attribute in self.get_attributes(filter=False):
             new_attribute = cp.copy(attribute)
@@ -67,6 +68,8 @@ class PropertySet(Hirarchy):
             self.remove_parent()
             return
         self._parent = parent
+        self._inheritance_changed()
+        self._notify(events.REPARENTED)
 
     def remove_child(self, child: PropertySet) -> None:
         super().remove_child(child)
@@ -101,6 +104,7 @@ class PropertySet(Hirarchy):
     @object.setter
     def object(self, value: SOMcreator.Object):
         self._object = value
+        self._notify(events.MODIFIED)
 
     @filterable
     def get_attributes(self) -> Iterator[SOMcreator.Attribute]:
@@ -114,17 +118,27 @@ class PropertySet(Hirarchy):
 
         if value not in self._attributes:
             self._attributes.add(value)
+            self._reset_attribute_name_dict()
         else:
             return
+        self._notify(events.MODIFIED)
         value.property_set = self
         for child in self.get_children(filter=False):
             attrib: SOMcreator.Attribute = cp.copy(value)
             value.add_child(attrib)
             child.add_attribute(attrib)
 
+    def _attach_attribute(self, value: SOMcreator.Attribute) -> None:
+        """adds the Attribute without creating copies in the child PropertySets. Used by loaders"""
+        self._attributes.add(value)
+        self._reset_attribute_name_dict()
+        value._property_set = self
+
     def remove_attribute(self, value: SOMcreator.Attribute, recursive=False) -> None:
         if value in self.get_attributes(filter=False):
             self._attributes.remove(value)
+            self._reset_attribute_name_dict()
+            self._notify(events.MODIFIED)
             if recursive:
                 for child in value.get_children(filter=False):
                     child.property_set.remove_attribute(child)
@@ -132,14 +146,24 @@ class PropertySet(Hirarchy):
             logging.warning(f"{self.name} -> {value} not in SOMcreator.Attributes")
 
     def get_attribute_by_name(self, name: str):
-        for attribute in self.get_attributes(filter=False):
-            if attribute.name.lower() == name.lower():
-                return attribute
-        return None
+        """case-insensitive lookup. The name index is rebuilt lazily after Attributes got added, removed or renamed"""
+        if self._attribute_name_dict is None:
+            self._attribute_name_dict = dict()
+            for attribute in self.get_attributes(filter=False):
+                self._attribute_name_dict.setdefault(attribute.name.lower(), attribute)
+        return self._attribute_name_dict.get(name.lower())
+
+    def _reset_attribute_name_dict(self) -> None:
+        self._attribute_name_dict = None
+
+    def _name_changed(self) -> None:
+        super(PropertySet, self)._name_changed()
+        if self._object is not None:
+            self._object._reset_property_set_name_dict()
 
     def create_child(self, name) -> PropertySet:
         child = PropertySet(name=name, project=self.project)
-        self._children.add(child)
+        self._add_to_children(child)
         child.parent = self
         for attribute in self.get_attributes(filter=False):
             new_attrib = attribute.create_child()
@@ -0,0 +1,473 @@
+from __future__ import annotations
+
+import copy as cp
+import weakref
+from typing import Iterator, TYPE_CHECKING
+
+import SOMcreator
+from .aggregation import Aggregation
+from .attribute import Attribute
+from .base import Hirarchy
+from .object_ import Object
+from .propertyset import PropertySet
+
+if TYPE_CHECKING:
+    from .base import FilterMatrix
+
+FILTER_KEYWORD = "filter"
+
+
+def capture_state(entity: Hirarchy) -> dict:
+    """
+    returns the own (not inherited) state of an entity. The returned dict and its containers are never modified,
+    so it can be shared by all snapshots as long as the entity doesn't change
+    """
+    state = {
+        "name":        entity._name,
+        "uuid":        entity._uuid,
+        "description": entity._description,
+        "optional":    entity._optional,
+        "filter_slot": entity._filter_slot,
+        "parent":      entity._parent,
+        "children":    frozenset(entity._children),
+    }
+    if isinstance(entity, SOMcreator.Object):
+        state["property_sets"] = tuple(entity._property_sets)
+        state["ident_attrib"] = entity._ident_attrib
+        state["aggregations"] = frozenset(entity._aggregations)
+        state["abbreviation"] = entity._abbreviation
+        state["ifc_mapping"] = frozenset(entity._ifc_mapping)
+    elif isinstance(entity, SOMcreator.PropertySet):
+        state["attributes"] = frozenset(entity._attributes)
+        state["object"] = entity._object
+    elif isinstance(entity, SOMcreator.Attribute):
+        state["value"] = [cp.copy(value) for value in entity._value]
+        state["property_set"] = entity._property_set
+        state["value_type"] = entity._value_type
+        state["data_type"] = entity._data_type
+        state["revit_name"] = entity._revit_name
+        state["child_inherits_values"] = entity._child_inherits_values
+    elif isinstance(entity, SOMcreator.Aggregation):
+        state["object"] = entity.object
+        state["parent_connection"] = entity._parent_connection
+        state["identity_text"] = entity._identity_text
+    return state
+
+
+def get_owners(state: dict) -> list[Hirarchy | None]:
+    """returns the entities whose containers reference the entity of the given state"""
+    return [state.get("parent"), state.get("property_set"), state.get("object")]
+
+
+class SnapshotHistory(object):
+    """
+    The captured states of the entities of a Project. Every entity has a list of (version, state) entries,
+    a snapshot reads the last entry that isn't newer than the snapshot, so a new snapshot only adds entries for the
+    entities that changed since the previous one.
+    Entry lists are only appended to or replaced, so snapshots can be read by other threads while the Project takes the
+    next one. Entries that no living snapshot can read are dropped when the next snapshot is taken.
+    Without living snapshots only the latest state of every entity is kept
+    """
+
+    def __init__(self):
+        self.version = 0
+        self._entries: dict[Hirarchy, list[tuple[int, dict | None]]] = dict()
+        self._outdated: set[Hirarchy] = set()  # entities with more than one entry
+        self._snapshots: weakref.WeakSet[ProjectSnapshot] = weakref.WeakSet()
+
+    def get_state(self, entity: Hirarchy, version: int | None = None) -> dict | None:
+        """returns the state the snapshot with the given version sees, the latest state by default"""
+        entries = self._entries.get(entity, ())
+        if version is None:
+            return entries[-1][1] if entries else None
+        for entry_version, state in reversed(entries):
+            if entry_version <= version:
+                return state
+        return None
+
+    def get_entities(self, version: int) -> list[Hirarchy]:
+        """returns the entities that existed when the snapshot with the given version was taken"""
+        return [entity for entity in list(self._entries) if self.get_state(entity, version) is not None]
+
+    def add_version(self, states: dict[Hirarchy, dict | None]) -> int:
+        """adds the new states (None for deleted entities) as the next version and returns it"""
+        self._drop_unreadable_entries()
+        version = self.version + 1
+        for entity, state in states.items():
+            entries = self._entries.get(entity)
+            if entries is None:
+                if state is not None:
+                    self._entries[entity] = [(version, state)]
+            elif entries[-1][1] is not state:
+                entries.append((version, state))
+                self._outdated.add(entity)
+        self.version = version
+        return version
+
+    def register(self, snapshot: ProjectSnapshot) -> None:
+        self._snapshots.add(snapshot)
+
+    def _drop_unreadable_entries(self) -> None:
+        """keeps the latest entry and the entries the living snapshots read"""
+        live_versions = {snapshot._history_version for snapshot in self._snapshots}
+        for entity in list(self._outdated):
+            entries = self._entries[entity]
+            kept = [entry for entry, next_entry in zip(entries, entries[1:])
+                    if any(entry[0] <= version < next_entry[0] for version in live_versions)]
+            kept.append(entries[-1])
+            if len(kept) == len(entries):
+                continue
+            if len(kept) == 1:
+                self._outdated.discard(entity)
+                if kept[0][1] is None:
+                    self._entries.pop(entity)
+                    continue
+            self._entries[entity] = kept
+
+
+def _filter(views: Iterator[EntityView], kwargs: dict) -> Iterator[EntityView]:
+    if not kwargs.get(FILTER_KEYWORD, True):
+        return views
+    return filter(lambda v: v.is_active(), views)
+
+
+class ProjectSnapshot(object):
+    """
+    Immutable view of a Project, created by Project.snapshot().
+    Background jobs can read it while the Project keeps getting edited.
+    The entities of the snapshot are read-only views (ObjectView, PropertySetView ...) that mirror the reading API of
+    the datastructure. view.entity returns the live entity.
+    """
+
+    def __init__(self, project: SOMcreator.Project, history: SnapshotHistory, history_version: int):
+        self._history = history
+        self._history_version = history_version
+        self._entities: list[Hirarchy] | None = None
+        self._views: dict[Hirarchy, EntityView] = dict()
+        self._typed_views: dict[type[Hirarchy], list[EntityView]] = dict()
+        self._uuid_dict: dict[str, EntityView] | None = None
+        self._ident_dict: dict[str, ObjectView] | None = None
+        self._active_filter_cache: dict[int, bool] = dict()
+        self.change_count = project._change_count
+        self.name = project.name
+        self.author = project.author
+        self.version = project.version
+        self.description = project.description
+        self.aggregation_pset = project.aggregation_pset
+        self.aggregation_attribute = project.aggregation_attribute
+        self.plugin_dict = cp.deepcopy(project.plugin_dict)  # plugins may keep editing their sections
+        self._phases = tuple(project.get_phases())
+        self._usecases = tuple(project.get_usecases())
+        self._filter_matrix = tuple(tuple(usecase_list) for usecase_list in project.get_filter_matrix())
+        self._filter_matrices: tuple[FilterMatrix, ...] = tuple(project._filter_matrices)
+        self.active_phases = tuple(project.active_phases)
+        self.active_usecases = tuple(project.active_usecases)
+        history.register(self)
+
+    def get_view(self, entity: Hirarchy | None) -> EntityView | None:
+        """returns the read-only view of a live entity. None if the entity didn't exist when the snapshot was taken"""
+        if entity is None:
+            return None
+        view = self._views.get(entity)
+        if view is None:
+            state = self._history.get_state(entity, self._history_version)
+            if state is None:
+                return None
+            view = self._views.setdefault(entity, _get_view_class(entity)(self, entity, state))
+        return view
+
+    def _get_entities(self) -> list[Hirarchy]:
+        if self._entities is None:
+            self._entities = self._history.get_entities(self._history_version)
+        return self._entities
+
+    def _get_views(self, entities) -> list[EntityView]:
+        return [view for view in (self.get_view(entity) for entity in entities) if view is not None]
+
+    def _get_typed_views(self, item_type: type[Hirarchy]) -> list[EntityView]:
+        if item_type not in self._typed_views:
+            self._typed_views[item_type] = self._get_views(e for e in self._get_entities() if isinstance(e, item_type))
+        return self._typed_views[item_type]
+
+    def get_hirarchy_items(self, **kwargs) -> Iterator[EntityView]:
+        return _filter(iter(self._get_views(self._get_entities())), kwargs)
+
+    def get_objects(self, **kwargs) -> Iterator[ObjectView]:
+        return _filter(iter(self._get_typed_views(SOMcreator.Object)), kwargs)
+
+    def get_property_sets(self, **kwargs) -> Iterator[PropertySetView]:
+        return _filter(iter(self._get_typed_views(SOMcreator.PropertySet)), kwargs)
+
+    def get_attributes(self, **kwargs) -> Iterator[AttributeView]:
+        return _filter(iter(self._get_typed_views(SOMcreator.Attribute)), kwargs)
+
+    def get_aggregations(self, **kwargs) -> Iterator[AggregationView]:
+        return _filter(iter(self._get_typed_views(SOMcreator.Aggregation)), kwargs)
+
+    def get_root_objects(self, **kwargs) -> Iterator[ObjectView]:
+        return _filter((o for o in self._get_typed_views(SOMcreator.Object) if o.parent is None), kwargs)
+
+    def get_predefined_psets(self, **kwargs) -> Iterator[PropertySetView]:
+        return _filter((p for p in self._get_typed_views(SOMcreator.PropertySet) if p.is_predefined), kwargs)
+
+    def get_element_by_uuid(self, uuid: str) -> EntityView | None:
+        if self._uuid_dict is None:
+            self._uuid_dict = {view.uuid: view for view in self._get_views(self._get_entities())}
+        return self._uuid_dict.get(uuid)
+
+    def get_ident_dict(self) -> dict[str, ObjectView]:
+        """returns {ident_value: ObjectView} for all Objects (unfiltered). Don't modify the returned dict"""
+        if self._ident_dict is None:
+            self._ident_dict = {obj.ident_value: obj for obj in self.get_objects(filter=False)}
+        return self._ident_dict
+
+    def get_object_by_identifier(self, identifier: str) -> ObjectView | None:
+        return self.get_ident_dict().get(identifier)
+
+    def get_phases(self) -> list[SOMcreator.Phase]:
+        return list(self._phases)
+
+    def get_usecases(self) -> list[SOMcreator.UseCase]:
+        return list(self._usecases)
+
+    def get_filter_matrix(self) -> FilterMatrix:
+        return self._filter_matrix
+
+    def get_filter_matrix_by_slot(self, slot: int) -> FilterMatrix:
+        return self._filter_matrices[slot]
+
+    def is_filter_slot_active(self, slot: int) -> bool:
+        state = self._active_filter_cache.get(slot)
+        if state is None:
+            matrix = self._filter_matrices[slot]
+            state = any(self._filter_matrix[phase][usecase] and matrix[phase][usecase]
+                        for phase in self.active_phases if phase is not None
+                        for usecase in self.active_usecases if usecase is not None)
+            self._active_filter_cache[slot] = state
+        return state
+
+
+class EntityView(object):
+    """
+    read-only view of an entity at the time the snapshot was taken.
+    The views reuse the reading functions of the datastructure, the private names they read are backed by the state
+    """
+    __slots__ = ("_snapshot", "_entity", "_state", "_description_cache", "_optional_cache")
+
+    def __init__(self, snapshot: ProjectSnapshot, entity: Hirarchy, state: dict):
+        self._snapshot = snapshot
+        self._entity = entity
+        self._state = state
+        self._description_cache: str | None = None
+        self._optional_cache: bool | None = None
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.name})"
+
+    @property
+    def entity(self) -> Hirarchy:
+        """the live entity"""
+        return self._entity
+
+    @property
+    def project(self) -> ProjectSnapshot:
+        return self._snapshot
+
+    @property
+    def name(self) -> str:
+        return self._state["name"]
+
+    @property
+    def uuid(self) -> str:
+        return self._state["uuid"]
+
+    @property
+    def _description(self) -> str:
+        return self._state["description"]
+
+    @property
+    def _optional(self) -> bool:
+        return self._state["optional"]
+
+    description = property(Hirarchy.description.fget)
+    is_optional = Hirarchy.is_optional
+
+    def get_filter_matrix(self) -> FilterMatrix:
+        return self._snapshot.get_filter_matrix_by_slot(self._state["filter_slot"])
+
+    def is_active(self) -> bool:
+        return self._snapshot.is_filter_slot_active(self._state["filter_slot"])
+
+    @property
+    def parent(self) -> EntityView | None:
+        return self._snapshot.get_view(self._state["parent"])
+
+    @property
+    def is_parent(self) -> bool:
+        return bool(self._state["children"])
+
+    @property
+    def is_child(self) -> bool:
+        return self._state["parent"] is not None
+
+    def get_children(self, **kwargs) -> Iterator[EntityView]:
+        return _filter(iter(self._snapshot._get_views(self._state["children"])), kwargs)
+
+
+class ObjectView(EntityView):
+    __slots__ = ()
+
+    def __str__(self):
+        return f"Object {self.name}"
+
+    @property
+    def abbreviation(self) -> str:
+        return self._state["abbreviation"]
+
+    @property
+    def ifc_mapping(self) -> frozenset[str]:
+        return self._state["ifc_mapping"]
+
+    @property
+    def aggregations(self) -> set[AggregationView]:
+        return set(self._snapshot._get_views(self._state["aggregations"]))
+
+    @property
+    def ident_attrib(self) -> AttributeView | str:
+        ident_attrib = self._state["ident_attrib"]
+        if isinstance(ident_attrib, Attribute):
+            return self._snapshot.get_view(ident_attrib)
+        return ident_attrib
+
+    @property
+    def is_concept(self) -> bool:
+        return not isinstance(self.ident_attrib, AttributeView)
+
+    ident_value = property(Object.ident_value.fget)
+
+    def get_property_sets(self, **kwargs) -> Iterator[PropertySetView]:
+        return _filter(iter(self._snapshot._get_views(self._state["property_sets"])), kwargs)
+
+    def get_property_set_by_name(self, property_set_name: str) -> PropertySetView | None:
+        for property_set in self.get_property_sets(filter=False):
+            if property_set.name == property_set_name:
+                return property_set
+        return None
+
+    def get_attributes(self, inherit: bool = False, **kwargs) -> Iterator[AttributeView]:
+        attributes = list()
+        for property_set in self.get_property_sets(filter=False):
+            attributes += property_set.get_attributes(filter=False)
+        if inherit and self.parent is not None:
+            attributes += self.parent.get_attributes(inherit=True, filter=False)
+        return _filter(iter(attributes), kwargs)
+
+
+class PropertySetView(EntityView):
+    __slots__ = ("_attribute_name_dict",)
+
+    def __init__(self, snapshot: ProjectSnapshot, entity: Hirarchy, state: dict):
+        super(PropertySetView, self).__init__(snapshot, entity, state)
+        self._attribute_name_dict: dict[str, AttributeView] | None = None
+
+    def __str__(self):
+        return f"PropertySet: {self.name}"
+
+    @property
+    def object(self) -> ObjectView | None:
+        return self._snapshot.get_view(self._state["object"])
+
+    @property
+    def is_predefined(self) -> bool:
+        return self._state["object"] is None
+
+    def get_attributes(self, **kwargs) -> Iterator[AttributeView]:
+        return _filter(iter(self._snapshot._get_views(self._state["attributes"])), kwargs)
+
+    get_attribute_by_name = PropertySet.get_attribute_by_name
+
+
+class AttributeView(EntityView):
+    __slots__ = ("_value_cache", "_value_keys_cache", "_is_inheriting_cache")
+
+    def __init__(self, snapshot: ProjectSnapshot, entity: Hirarchy, state: dict):
+        super(AttributeView, self).__init__(snapshot, entity, state)
+        self._value_cache: list | None = None
+        self._value_keys_cache: set | None = None
+        self._is_inheriting_cache: bool | None = None
+
+    def __str__(self) -> str:
+        return f"{self.property_set.name} : {self.name} = {self.value}"
+
+    @property
+    def property_set(self) -> PropertySetView | None:
+        return self._snapshot.get_view(self._state["property_set"])
+
+    @property
+    def value_type(self) -> str:
+        return self._state["value_type"]
+
+    @property
+    def data_type(self) -> str:
+        return self._state["data_type"]
+
+    @property
+    def revit_name(self) -> str:
+        return self._state["revit_name"]
+
+    @property
+    def child_inherits_values(self) -> bool:
+        return self._state["child_inherits_values"]
+
+    @property
+    def _value(self) -> list:
+        return self._state["value"]
+
+    is_inheriting_values = property(Attribute.is_inheriting_values.fget)
+    get_own_values = Attribute.get_own_values
+    _get_value_keys = Attribute._get_value_keys
+    value = property(Attribute.value.fget, doc="Don't modify the returned list")
+
+
+class AggregationView(EntityView):
+    __slots__ = ("_identity_cache", "_identity_prefix_cache", "_ancestor_objects_cache")
+
+    def __init__(self, snapshot: ProjectSnapshot, entity: Hirarchy, state: dict):
+        super(AggregationView, self).__init__(snapshot, entity, state)
+        self._identity_cache: str | None = None
+        self._identity_prefix_cache: str | None = None
+        self._ancestor_objects_cache: frozenset[ObjectView] | None = None
+
+    def __str__(self):
+        return self.name
+
+    @property
+    def object(self) -> ObjectView:
+        return self._snapshot.get_view(self._state["object"])
+
+    @property
+    def _parent_connection(self):
+        return self._state["parent_connection"]
+
+    @property
+    def _identity_text(self) -> str:
+        return self._state["identity_text"]
+
+    parent_connection = property(Aggregation.parent_connection.fget)
+    is_root = property(Aggregation.is_root.fget)
+    get_ancestor_objects = Aggregation.get_ancestor_objects
+    get_identity_text = Aggregation.get_identity_text
+    identity = Aggregation.identity
+    _get_identity_prefix = Aggregation._get_identity_prefix
+
+
+def _get_view_class(entity: Hirarchy) -> type[EntityView]:
+    if isinstance(entity, Object):
+        return ObjectView
+    if isinstance(entity, PropertySet):
+        return PropertySetView
+    if isinstance(entity, Attribute):
+        return AttributeView
+    if isinstance(entity, Aggregation):
+        return AggregationView
+    return EntityView
@@ -104,3 +104,12 @@ ACTIVE_PHASES = "active_phases"
 ACTIVE_USECASES = "active_usecases"
 NODES = "Nodes"
 INHERITED_TEXT = "Predefined Pset"
+
+# change journal (Project.save_changes)
+JOURNAL_SUFFIX = ".journal"
+JOURNAL_VERSION = 2
+JOURNAL = "Journal"
+BASE_HASH = "base_hash"
+PROPERTY_SET = "PropertySet"
+DELETED = "Deleted"
+PLUGINS = "Plugins"
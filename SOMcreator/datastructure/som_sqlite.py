@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+# SOM projects stored as SQLite database. Values that aren't scalars (lists, matrixes) are stored as JSON text
+
+SUFFIX = ".somdb"
+HEADER = b"SQLite format 3\x00"
+SCHEMA_VERSION = 1
+
+SCHEMA = """
+CREATE TABLE project (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE plugin_sections (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE phases (position INTEGER PRIMARY KEY, name TEXT, long_name TEXT, description TEXT);
+CREATE TABLE usecases (position INTEGER PRIMARY KEY, name TEXT, long_name TEXT, description TEXT);
+CREATE TABLE filter_matrixes (id INTEGER PRIMARY KEY, matrix TEXT);
+CREATE TABLE objects (uuid TEXT PRIMARY KEY, name TEXT, description TEXT, optional INTEGER, filter_matrix INTEGER,
+                      parent TEXT, abbreviation TEXT, ident_attribute TEXT);
+CREATE TABLE ifc_mappings (object TEXT, ifc_mapping TEXT);
+CREATE TABLE property_sets (uuid TEXT PRIMARY KEY, object TEXT, name TEXT, description TEXT, optional INTEGER,
+                            filter_matrix INTEGER, parent TEXT);
+CREATE TABLE attributes (uuid TEXT PRIMARY KEY, property_set TEXT, name TEXT, description TEXT, optional INTEGER,
+                         filter_matrix INTEGER, parent TEXT, data_type TEXT, value_type TEXT,
+                         child_inherits_value INTEGER, revit_mapping TEXT);
+CREATE TABLE attribute_values (attribute TEXT, position INTEGER, value TEXT);
+CREATE TABLE aggregations (uuid TEXT PRIMARY KEY, object TEXT, parent TEXT, connection INTEGER, identity_text TEXT,
+                           description TEXT, optional INTEGER, filter_matrix INTEGER);
+CREATE INDEX ifc_mappings_object ON ifc_mappings (object);
+CREATE INDEX property_sets_object ON property_sets (object);
+CREATE INDEX property_sets_parent ON property_sets (parent);
+CREATE INDEX attributes_property_set ON attributes (property_set);
+CREATE INDEX attributes_parent ON attributes (parent);
+CREATE INDEX attribute_values_attribute ON attribute_values (attribute);
+"""
+
+# keys of the project table
+NAME = "name"
+AUTHOR = "author"
+VERSION = "version"
+DESCRIPTION = "description"
+AGGREGATION_PSET = "aggregation_pset"
+AGGREGATION_ATTRIBUTE = "aggregation_attribute"
+ACTIVE_PHASES = "active_phases"
+ACTIVE_USECASES = "active_usecases"
+FILTER_MATRIX = "filter_matrix"
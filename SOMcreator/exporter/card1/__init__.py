@@ -20,13 +20,10 @@ def create_mapping(src_path: str, dest_path: str, project: SOMcreator.Project) -
     wb = load_workbook(src_path)
     sheet = wb.active
     important_rows = [row for i, row in enumerate(sheet.rows) if row[2].value is not None and i != 0]
-    object_dict = {obj.ident_attrib.value[0]: obj for obj in project.get_objects(filter=True) if
-                   not obj.is_concept}
-
     for row in important_rows:
         bauteil_bez_card, bauteil_bez_2, bauteilklass = map(lambda x: x.value, row)
-        obj = object_dict.get(bauteilklass)
-        if obj is None:
+        obj = project.get_object_by_identifier(bauteilklass)
+        if obj is None or obj.is_concept or not obj.is_active():
             logging.warning(f"identifier '{bauteilklass}' not found")
             continue
         _create_sheet(obj, export_wb, bauteil_bez_card)
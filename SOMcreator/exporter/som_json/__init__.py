@@ -2,28 +2,22 @@ from __future__ import annotations
 
 import logging
 import os
-import json
+import tempfile
 import time
 
 import SOMcreator
-from SOMcreator.datastructure.som_json import MainDict
-from typing import TYPE_CHECKING
+from SOMcreator.datastructure.som_json import AGGREGATIONS, FILTER_MATRIXES, MainDict, OBJECTS, PREDEFINED_PSETS, \
+    PROJECT
+from typing import Any, BinaryIO, Callable, Iterator, TYPE_CHECKING
 from . import core, project, predefined_pset, property_set, object_, aggregation
 from SOMcreator.templates import HOME_DIR, MAPPING_TEMPLATE
-from SOMcreator.util import xml
+from SOMcreator.util import xml, json_backend
+from SOMcreator.util.misc import get_file_mode
 import jinja2
 
 if TYPE_CHECKING:
-    from SOMcreator import Project, UseCase, Phase
-parent_dict = dict()
-aggregation_dict = dict()
-phase_list: list[Phase] = list()
-use_case_list: list[UseCase] = list()
-plugin_dict = dict()
-object_uuid_dict: dict[str, SOMcreator.Object] = dict()
-property_set_uuid_dict: dict[str, SOMcreator.PropertySet] = dict()
-attribute_uuid_dict: dict[str, SOMcreator.Attribute] = dict()
-filter_matrixes = list()
+    from SOMcreator import Project
+    from SOMcreator.datastructure.snapshot import ProjectSnapshot
 
 
 def create_mapping_script(project: SOMcreator.Project, pset_name: str, path: str):
@@ -52,28 +46,102 @@ def create_mapping_script(project: SOMcreator.Project, pset_name: str, path: str
     pass
 
 
-def reset_uuid_dicts():
-    SOMcreator.exporter.som_json.object_uuid_dict = dict()
-    SOMcreator.exporter.som_json.property_set_uuid_dict = dict()
-    SOMcreator.exporter.som_json.attribute_uuid_dict = dict()
-    SOMcreator.exporter.som_json.filter_matrixes = list()
-
-def export_json(proj: Project, path: str) -> dict:
+def export_json(proj: Project | ProjectSnapshot, path: str, stream: bool = False,
+                progress: Callable[[int], None] | None = None) -> dict | None:
+    """
+    :param proj: Project or a snapshot of it. Snapshots can be exported by a background thread
+    :param stream: write the file section by section and object by object instead of building the whole
+    document first. The output is byte identical but the document isn't returned
+    :param progress: only used while streaming. Gets called with the written share of the entities in percent
+    """
     start_time = time.time()
-    main_dict = create_export_dict(proj)
-    with open(path, "w") as file:
-        json.dump(project.order_dict(main_dict), file)
+    main_dict = None if stream else create_export_dict(proj)
+    # write to a unique temporary file, so an exception while writing doesn't destroy the existing file
+    # and parallel saves of the same path don't write into the same file
+    file_descriptor, temp_path = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(os.path.abspath(path)))
+    try:
+        with os.fdopen(file_descriptor, "wb") as file:
+            if stream:
+                write_stream(proj, file, progress)
+            else:
+                file.write(json_backend.dumps(main_dict))
+            file.flush()
+            os.fsync(file.fileno())
+        os.chmod(temp_path, get_file_mode(path))  # mkstemp creates files only readable by the owner
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
 
     end_time = time.time()
     logging.info(f"Export Done. Time: {end_time - start_time}")
     return main_dict
 
 
-def create_export_dict(proj: Project):
+def create_export_dict(proj: Project | ProjectSnapshot):
     main_dict: MainDict = dict()
-    project.write(proj, main_dict)
-    predefined_pset.write(proj, main_dict)
-    object_.write(proj, main_dict)
-    aggregation.write(proj, main_dict)
+    context = project.write(proj, main_dict)
+    predefined_pset.write(context, proj, main_dict)
+    object_.write(context, proj, main_dict)
+    aggregation.write(context, proj, main_dict)
+    # FilterMatrixes are written after the entities
+    main_dict[FILTER_MATRIXES] = main_dict.pop(FILTER_MATRIXES)
     main_dict.update(proj.plugin_dict)
     return main_dict
+
+
+def _iter_sections(proj: Project | ProjectSnapshot) -> Iterator[tuple[str, Any]]:
+    """sections in the order of create_export_dict. Entity sections are iterators of (uuid, entry)"""
+    head_dict: MainDict = dict()
+    context = project.write(proj, head_dict)
+    sections = [
+        (PROJECT, head_dict[PROJECT]),
+        (PREDEFINED_PSETS, predefined_pset.iter_entries(context, proj)),
+        (OBJECTS, object_.iter_entries(context, proj)),
+        (AGGREGATIONS, aggregation.iter_entries(context, proj)),
+        (FILTER_MATRIXES, head_dict[FILTER_MATRIXES]),
+    ]
+    plugin_dict = proj.plugin_dict
+    for key, value in sections:
+        yield key, plugin_dict[key] if key in plugin_dict else value
+    core_keys = {key for key, _ in sections}
+    for key, value in plugin_dict.items():
+        if key not in core_keys:
+            yield key, value
+
+
+def _count_entries(proj: Project | ProjectSnapshot) -> int:
+    return sum(1 for _ in proj.get_predefined_psets(filter=False)) + sum(1 for _ in proj.get_objects(filter=False)) + \
+        sum(1 for _ in proj.get_aggregations(filter=False))
+
+
+def write_stream(proj: Project | ProjectSnapshot, file: BinaryIO,
+                 progress: Callable[[int], None] | None = None) -> None:
+    """writes the same bytes as json_backend.dumps(create_export_dict(proj)) without building the document"""
+    item_separator, key_separator = json_backend.get_separators()
+    dumps = json_backend.dumps
+    entry_count = max(_count_entries(proj), 1) if progress is not None else 1
+    written_entries, reported_percent = 0, -1
+    file.write(b"{")
+    for section_index, (key, value) in enumerate(_iter_sections(proj)):
+        if section_index:
+            file.write(item_separator)
+        file.write(dumps(key) + key_separator)
+        if not isinstance(value, Iterator):
+            file.write(dumps(value))
+            continue
+        file.write(b"{")
+        for index, (uuid, entry) in enumerate(value):
+            if index:
+                file.write(item_separator)
+            file.write(dumps(uuid) + key_separator + dumps(entry))
+            if progress is None:
+                continue
+            written_entries += 1
+            percent = written_entries * 100 // entry_count
+            if percent != reported_percent:
+                progress(percent)
+                reported_percent = percent
+        file.write(b"}")
+    file.write(b"}")
@@ -4,16 +4,17 @@ import SOMcreator
 from SOMcreator.exporter.som_json import core
 from SOMcreator.datastructure.som_json import OBJECT, CONNECTION, AGGREGATIONS, PARENT,IDENTITY_TEXT, AggregationDict, MainDict
 
-from typing import TYPE_CHECKING
+from typing import Iterator, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from SOMcreator import Project
+    from SOMcreator.exporter.som_json.core import ExportContext
 
 
 ### Export ###
-def _create_entry(element: SOMcreator.Aggregation) -> AggregationDict:
+def write_entry(context: ExportContext, element: SOMcreator.Aggregation) -> AggregationDict:
     aggregation_dict: AggregationDict = dict()
-    core.write_basics(aggregation_dict, element)
+    core.write_basics(context, aggregation_dict, element)
     aggregation_dict[OBJECT] = element.object.uuid
     if element.parent is not None:
         aggregation_dict[PARENT] = element.parent.uuid
@@ -25,7 +26,10 @@ def _create_entry(element: SOMcreator.Aggregation) -> AggregationDict:
     return aggregation_dict
 
 
-def write(proj: Project, main_dict: MainDict):
-    main_dict[AGGREGATIONS] = dict()
+def iter_entries(context: ExportContext, proj: Project) -> Iterator[tuple[str, AggregationDict]]:
     for aggregation in proj.get_aggregations(filter=False):
-        main_dict[AGGREGATIONS][aggregation.uuid] = _create_entry(aggregation)
+        yield aggregation.uuid, write_entry(context, aggregation)
+
+
+def write(context: ExportContext, proj: Project, main_dict: MainDict):
+    main_dict[AGGREGATIONS] = dict(iter_entries(context, proj))
@@ -6,11 +6,12 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from SOMcreator.datastructure.som_json import AttributeDict
+    from SOMcreator.exporter.som_json.core import ExportContext
 
 
-def write(attribute: SOMcreator.Attribute) -> AttributeDict:
+def write(context: ExportContext, attribute: SOMcreator.Attribute) -> AttributeDict:
     attribute_dict: AttributeDict = dict()
-    core.write_basics(attribute_dict, attribute)
+    core.write_basics(context, attribute_dict, attribute)
     attribute_dict[DATA_TYPE] = attribute.data_type
     attribute_dict[VALUE_TYPE] = attribute.value_type
     attribute_dict[CHILD_INHERITS_VALUE] = attribute.child_inherits_values
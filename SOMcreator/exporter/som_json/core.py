@@ -7,27 +7,37 @@ from SOMcreator.util.misc import check_size_eq
 import SOMcreator.datastructure.base
 
 if TYPE_CHECKING:
+    from SOMcreator.datastructure.base import FilterMatrix
     from SOMcreator.datastructure.som_json import ObjectDict, PropertySetDict, AttributeDict, AggregationDict
 
 
 #### Export ######
 
+class ExportContext(object):
+    """
+    State of a single export. Every export gets its own context, so Projects can be exported in parallel
+    """
 
-def write_filter_matrix(element: SOMcreator.datastructure.base.Hirarchy):
+    def __init__(self, filter_matrixes: list[FilterMatrix]):
+        self.filter_matrixes = filter_matrixes
+        # filter matrix -> index in filter_matrixes
+        self.filter_matrix_index_dict = {matrix: index for index, matrix in enumerate(filter_matrixes)}
+
+
+def write_filter_matrix(context: ExportContext, element: SOMcreator.datastructure.base.Hirarchy):
     proj = element.project
     filter_matrix = element.get_filter_matrix()
     if not check_size_eq(filter_matrix, proj.get_filter_matrix()):
         logging.warning(f"Filter List of {element} doesn't match size of project filter list")
-    return SOMcreator.exporter.som_json.filter_matrixes.index(
-        tuple(tuple(use_case_list) for use_case_list in filter_matrix))
+    return context.filter_matrix_index_dict[filter_matrix]
 
 
-def write_basics(entity_dict: ObjectDict | PropertySetDict | AttributeDict | AggregationDict,
+def write_basics(context: ExportContext, entity_dict: ObjectDict | PropertySetDict | AttributeDict | AggregationDict,
                  element: SOMcreator.datastructure.base.Hirarchy) -> None:
     """function gets called from all Entities"""
     entity_dict[NAME] = element.name
     entity_dict[OPTIONAL] = element.is_optional(ignore_hirarchy=True)
-    entity_dict[FILTER_MATRIX] = write_filter_matrix(element)
+    entity_dict[FILTER_MATRIX] = write_filter_matrix(context, element)
     parent = None if element.parent is None else element.parent.uuid
     entity_dict[PARENT] = parent
     entity_dict[DESCRIPTION] = element.description
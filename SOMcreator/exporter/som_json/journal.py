@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import time
+from typing import TYPE_CHECKING
+
+import SOMcreator
+from SOMcreator.datastructure.som_json import ABBREVIATION, AGGREGATIONS, ATTRIBUTES, BASE_HASH, DELETED, \
+    FILTER_MATRIXES, IDENT_ATTRIBUTE, IFC_MAPPINGS, JOURNAL, JOURNAL_SUFFIX, JOURNAL_VERSION, OBJECT, OBJECTS, PLUGINS, \
+    PROJECT, PROPERTY_SET, PROPERTY_SETS
+from SOMcreator.util import json_backend
+from . import aggregation, attribute, core, project
+
+if TYPE_CHECKING:
+    from SOMcreator import Project
+    from SOMcreator.datastructure.som_json import ObjectDict, PropertySetDict, AttributeDict
+
+# the journal gets compacted into a full save once it is bigger than this share of the SOM JSON file
+COMPACT_RATIO = 0.5
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+def get_journal_path(path: str | os.PathLike) -> str:
+    return f"{os.fspath(path)}{JOURNAL_SUFFIX}"
+
+
+def remove_journal(path: str | os.PathLike) -> None:
+    """gets called after a full save, the changes are part of the file now"""
+    journal_path = get_journal_path(path)
+    if os.path.exists(journal_path):
+        os.remove(journal_path)
+
+
+def get_file_hash(path: str | os.PathLike) -> str:
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as file:
+        while chunk := file.read(HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def create_header(file_hash: str) -> dict:
+    """the journal is only valid for the content of the file it was started for"""
+    return {
+        JOURNAL:   JOURNAL_VERSION,
+        BASE_HASH: file_hash,
+    }
+
+
+def read_header(path: str | os.PathLike) -> dict | None:
+    journal_path = get_journal_path(path)
+    if not os.path.exists(journal_path):
+        return None
+    with open(journal_path, "rb") as file:
+        line = file.readline()
+    try:
+        header = json_backend.loads(line)
+    except ValueError:
+        return None
+    return header if isinstance(header, dict) and header.get(JOURNAL) == JOURNAL_VERSION else None
+
+
+def is_valid(header: dict | None, file_hash: str) -> bool:
+    return header is not None and header == create_header(file_hash)
+
+
+def _write_object(context: core.ExportContext, obj: SOMcreator.Object) -> ObjectDict:
+    """like the SOM JSON entry but PropertySets are listed by uuid"""
+    object_dict: ObjectDict = dict()
+    core.write_basics(context, object_dict, obj)
+    object_dict[IFC_MAPPINGS] = list(obj.ifc_mapping)
+    object_dict[ABBREVIATION] = obj.abbreviation
+    ident_attrib = obj.ident_attrib
+    object_dict[IDENT_ATTRIBUTE] = ident_attrib.uuid if isinstance(ident_attrib, SOMcreator.Attribute) else ident_attrib
+    object_dict[PROPERTY_SETS] = [pset.uuid for pset in obj.get_property_sets(filter=False)]
+    return object_dict
+
+
+def _write_property_set(context: core.ExportContext, pset: SOMcreator.PropertySet) -> PropertySetDict:
+    """like the SOM JSON entry but Attributes are listed by uuid"""
+    pset_dict: PropertySetDict = dict()
+    core.write_basics(context, pset_dict, pset)
+    pset_dict[OBJECT] = None if pset.object is None else pset.object.uuid
+    pset_dict[ATTRIBUTES] = [attrib.uuid for attrib in pset.get_attributes(filter=False)]
+    return pset_dict
+
+
+def _write_attribute(context: core.ExportContext, attrib: SOMcreator.Attribute) -> AttributeDict:
+    attribute_dict = attribute.write(context, attrib)
+    attribute_dict[PROPERTY_SET] = None if attrib.property_set is None else attrib.property_set.uuid
+    return attribute_dict
+
+
+def get_plugin_data(proj: Project) -> bytes:
+    """serialized plugin sections, used to detect if they changed since the last save"""
+    return json_backend.dumps(proj.plugin_dict)
+
+
+def create_block(proj: Project, write_plugins: bool = True) -> dict:
+    """
+    collects the changes since the last save. Entities are written flat, containers list their members.
+    The plugin sections are written as a whole, blocks without them keep the previous sections
+    """
+    dirty_items = [item for item in proj.get_dirty_items() if proj.get_element_by_uuid(item.uuid) is item]
+    deleted_items = [item for item in proj.get_deleted_items() if proj.get_element_by_uuid(item.uuid) is not item]
+
+    head_dict = dict()
+    context = project.write(proj, head_dict, list({item.get_filter_matrix() for item in dirty_items}))
+
+    sections = {
+        SOMcreator.Object:      (OBJECTS, _write_object),
+        SOMcreator.PropertySet: (PROPERTY_SETS, _write_property_set),
+        SOMcreator.Attribute:   (ATTRIBUTES, _write_attribute),
+        SOMcreator.Aggregation: (AGGREGATIONS, aggregation.write_entry),
+    }
+    block = {PROJECT: head_dict[PROJECT], FILTER_MATRIXES: head_dict[FILTER_MATRIXES]}
+    for key, _ in sections.values():
+        block[key] = dict()
+    for item in sorted(dirty_items, key=lambda i: i.uuid):
+        key, write_entry = sections[type(item)]
+        block[key][item.uuid] = write_entry(context, item)
+    block[DELETED] = sorted(item.uuid for item in deleted_items)
+    if write_plugins:
+        block[PLUGINS] = dict(proj.plugin_dict)
+    return block
+
+
+def append(proj: Project, path: str | os.PathLike) -> bool:
+    """
+    appends the changes since the last save to the journal of the SOM JSON file.
+    Returns False without writing if a full save is needed instead:
+    the file changed since the Project was opened from it or saved to it, the journal belongs to another state of
+    the file, the journal got too big or Phases or UseCases were added or removed
+    (this changes the filter matrixes of all entities)
+    """
+    start_time = time.time()
+    if not os.path.exists(path) or proj.is_filter_layout_changed():
+        return False
+    file_hash = get_file_hash(path)
+    if file_hash != proj._source_hash:
+        return False
+    journal_path = get_journal_path(path)
+    header = read_header(path)
+    lines = list()
+    if header is None:
+        if os.path.exists(journal_path):
+            return False
+        lines.append(json_backend.dumps(create_header(file_hash)))
+    elif not is_valid(header, file_hash):
+        return False
+    elif os.path.getsize(journal_path) > os.path.getsize(path) * COMPACT_RATIO:
+        return False
+
+    plugin_data = get_plugin_data(proj)
+    lines.append(json_backend.dumps(create_block(proj, plugin_data != proj._saved_plugin_data)))
+    with open(journal_path, "ab") as file:
+        file.write(b"".join(line + b"\n" for line in lines))
+        file.flush()
+        os.fsync(file.fileno())
+    proj._saved_plugin_data = plugin_data
+    logging.info(f"Journal written. Time: {time.time() - start_time}")
+    return True
@@ -1,18 +1,20 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import Iterator, TYPE_CHECKING
 from SOMcreator.datastructure.som_json import IFC_MAPPINGS, ABBREVIATION, PROPERTY_SETS, IDENT_ATTRIBUTE, OBJECTS
 from SOMcreator.exporter.som_json import property_set
 import SOMcreator
 from SOMcreator.exporter.som_json import core
+from SOMcreator.datastructure.snapshot import AttributeView
 
 if TYPE_CHECKING:
     from SOMcreator import Project
     from SOMcreator.datastructure.som_json import ObjectDict, MainDict
+    from SOMcreator.exporter.som_json.core import ExportContext
 
 ### Export ###
-def _write_object(element: SOMcreator.Object) -> ObjectDict:
+def _write_object(context: ExportContext, element: SOMcreator.Object) -> ObjectDict:
     object_dict: ObjectDict = dict()
-    core.write_basics(object_dict, element)
+    core.write_basics(context, object_dict, element)
 
     if isinstance(element.ifc_mapping, set):
         object_dict[IFC_MAPPINGS] = list(element.ifc_mapping)
@@ -21,12 +23,12 @@ def _write_object(element: SOMcreator.Object) -> ObjectDict:
 
     psets_dict = dict()
     for pset in element.get_property_sets(filter=False):
-        psets_dict[pset.uuid] = property_set.write_entry(pset)
+        psets_dict[pset.uuid] = property_set.write_entry(context, pset)
 
     object_dict[PROPERTY_SETS] = psets_dict
     object_dict[ABBREVIATION] = element.abbreviation
 
-    if isinstance(element.ident_attrib, SOMcreator.Attribute):
+    if isinstance(element.ident_attrib, (SOMcreator.Attribute, AttributeView)):
         object_dict[IDENT_ATTRIBUTE] = element.ident_attrib.uuid
     else:
         object_dict[IDENT_ATTRIBUTE] = element.ident_attrib
@@ -34,7 +36,10 @@ def _write_object(element: SOMcreator.Object) -> ObjectDict:
     return object_dict
 
 
-def write(proj: Project, main_dict: MainDict):
-    main_dict[OBJECTS] = dict()
+def iter_entries(context: ExportContext, proj: Project) -> Iterator[tuple[str, ObjectDict]]:
     for obj in sorted(proj.get_objects(filter=False), key=lambda o: o.uuid):
-        main_dict[OBJECTS][obj.uuid] = _write_object(obj)
+        yield obj.uuid, _write_object(context, obj)
+
+
+def write(context: ExportContext, proj: Project, main_dict: MainDict):
+    main_dict[OBJECTS] = dict(iter_entries(context, proj))
@@ -1,13 +1,17 @@
 from __future__ import annotations
 from SOMcreator.datastructure.som_json import PREDEFINED_PSETS
 from SOMcreator.exporter.som_json import property_set
-from typing import TYPE_CHECKING
+from typing import Iterator, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from SOMcreator.datastructure.som_json import MainDict
+    from SOMcreator.datastructure.som_json import MainDict, PropertySetDict
     from SOMcreator import Project
+    from SOMcreator.exporter.som_json.core import ExportContext
 
-def write(proj: Project, main_dict: MainDict):
-    main_dict[PREDEFINED_PSETS] = dict()
+def iter_entries(context: ExportContext, proj: Project) -> Iterator[tuple[str, PropertySetDict]]:
     for predefined_property_set in sorted(proj.get_predefined_psets(filter=False), key=lambda x: x.uuid):
-        main_dict[PREDEFINED_PSETS][predefined_property_set.uuid] = property_set.write_entry(predefined_property_set)
+        yield predefined_property_set.uuid, property_set.write_entry(context, predefined_property_set)
+
+
+def write(context: ExportContext, proj: Project, main_dict: MainDict):
+    main_dict[PREDEFINED_PSETS] = dict(iter_entries(context, proj))
@@ -8,14 +8,19 @@ from SOMcreator.datastructure.som_json import DESCRIPTION, FILTER_MATRIXES, FILT
 from SOMcreator.datastructure.som_json import ProjectDict, FilterDict, MainDict
 import SOMcreator
 from . import core
-from collections import OrderedDict
 
 if TYPE_CHECKING:
     from SOMcreator import Project
 
-def write(project: Project, main_dict: MainDict) -> None:
-    main_dict[FILTER_MATRIXES] = create_existing_filter_states(project)
-    SOMcreator.exporter.som_json.filter_matrixes = main_dict[FILTER_MATRIXES]
+def write(project: Project, main_dict: MainDict, filter_matrixes: list | None = None) -> core.ExportContext:
+    """
+    filter_matrixes: matrixes the entities get written with, default are all existing ones.
+    Returns the context the entities of this export get written with
+    """
+    if filter_matrixes is None:
+        filter_matrixes = create_existing_filter_states(project)
+    main_dict[FILTER_MATRIXES] = filter_matrixes
+    context = core.ExportContext(main_dict[FILTER_MATRIXES])
     main_dict[PROJECT] = dict()
     project_dict: ProjectDict = main_dict[PROJECT]
     project_dict[NAME] = project.name
@@ -31,15 +36,7 @@ def write(project: Project, main_dict: MainDict) -> None:
     project_dict[PROJECT_PHASES] = _write_filter_dict(project.get_phases())
     project_dict[USE_CASES] = _write_filter_dict(project.get_usecases())
     project_dict[FILTER_MATRIX] = project.get_filter_matrix()
-
-
-def order_dict(main_dict: MainDict):
-    order = [PROJECT, PREDEFINED_PSETS, OBJECTS, AGGREGATIONS, FILTER_MATRIXES]
-    ordered_data = [(name, main_dict.get(name)) for name in order]
-    for key, data in main_dict.items():
-        if key not in order:
-            ordered_data.append((key, data))
-    return OrderedDict(ordered_data)
+    return context
 
 
 def _write_filter_dict(filter_list: list[SOMcreator.Phase] | list[SOMcreator.UseCase]) -> list[FilterDict]:
@@ -56,6 +53,5 @@ def _write_filter_dict(filter_list: list[SOMcreator.Phase] | list[SOMcreator.Use
 def create_existing_filter_states(proj: Project):
     filter_matrixes = set()
     for entity in proj.get_hirarchy_items(filter=False):
-        hashable = tuple(tuple(use_case_list) for use_case_list in entity.get_filter_matrix())
-        filter_matrixes.add(hashable)
+        filter_matrixes.add(entity.get_filter_matrix())
     return list(filter_matrixes)
@@ -7,16 +7,17 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from SOMcreator.datastructure.som_json import PropertySetDict
+    from SOMcreator.exporter.som_json.core import ExportContext
 
 
 #### Export ####
 
-def write_entry(pset: SOMcreator.PropertySet) -> PropertySetDict:
+def write_entry(context: ExportContext, pset: SOMcreator.PropertySet) -> PropertySetDict:
     pset_dict: PropertySetDict = dict()
-    core.write_basics(pset_dict, pset)
+    core.write_basics(context, pset_dict, pset)
     attributes_dict = dict()
     for attrib in pset.get_attributes(filter=False):
-        new_dict = attribute.write(attrib)
+        new_dict = attribute.write(context, attrib)
         attributes_dict[attrib.uuid] = new_dict
     pset_dict[ATTRIBUTES] = attributes_dict
     return pset_dict
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import time
+from typing import Iterator, TYPE_CHECKING
+
+import SOMcreator
+from SOMcreator.datastructure import som_sqlite
+from SOMcreator.exporter.som_json.project import create_existing_filter_states
+from SOMcreator.util.misc import get_file_mode
+
+if TYPE_CHECKING:
+    from SOMcreator import Project
+
+
+def _write_project(proj: Project, cursor: sqlite3.Cursor) -> None:
+    project_values = {
+        som_sqlite.NAME:                  proj.name,
+        som_sqlite.AUTHOR:                proj.author,
+        som_sqlite.VERSION:               proj.version,
+        som_sqlite.DESCRIPTION:           proj.description,
+        som_sqlite.AGGREGATION_PSET:      proj.aggregation_pset,
+        som_sqlite.AGGREGATION_ATTRIBUTE: proj.aggregation_attribute,
+        som_sqlite.ACTIVE_PHASES:         proj.active_phases,
+        som_sqlite.ACTIVE_USECASES:       proj.active_usecases,
+        som_sqlite.FILTER_MATRIX:         proj.get_filter_matrix(),
+    }
+    cursor.executemany("INSERT INTO project VALUES (?, ?)",
+                       [(key, json.dumps(value)) for key, value in project_values.items()])
+    cursor.executemany("INSERT INTO plugin_sections VALUES (?, ?)",
+                       [(key, json.dumps(value)) for key, value in proj.plugin_dict.items()])
+    cursor.executemany("INSERT INTO phases VALUES (?, ?, ?, ?)",
+                       [(index, phase.name, phase.long_name, phase.description) for index, phase in
+                        enumerate(proj.get_phases())])
+    cursor.executemany("INSERT INTO usecases VALUES (?, ?, ?, ?)",
+                       [(index, usecase.name, usecase.long_name, usecase.description) for index, usecase in
+                        enumerate(proj.get_usecases())])
+
+
+def _basics(element: SOMcreator.datastructure.base.Hirarchy, filter_matrix_dict: dict) -> tuple:
+    """same values as the SOM JSON export writes"""
+    parent = None if element.parent is None else element.parent.uuid
+    return (element.uuid, element.name, element.description, element.is_optional(ignore_hirarchy=True),
+            filter_matrix_dict[element.get_filter_matrix()], parent)
+
+
+def _iter_property_sets(proj: Project) -> Iterator[tuple[SOMcreator.PropertySet, str | None]]:
+    for property_set in sorted(proj.get_predefined_psets(filter=False), key=lambda p: p.uuid):
+        yield property_set, None
+    for obj in sorted(proj.get_objects(filter=False), key=lambda o: o.uuid):
+        for property_set in obj.get_property_sets(filter=False):
+            yield property_set, obj.uuid
+
+
+def _write_entities(proj: Project, cursor: sqlite3.Cursor) -> None:
+    filter_matrixes = create_existing_filter_states(proj)
+    filter_matrix_dict = {matrix: index for index, matrix in enumerate(filter_matrixes)}
+    cursor.executemany("INSERT INTO filter_matrixes VALUES (?, ?)",
+                       [(index, json.dumps(matrix)) for index, matrix in enumerate(filter_matrixes)])
+
+    object_rows, ifc_mapping_rows = list(), list()
+    for obj in sorted(proj.get_objects(filter=False), key=lambda o: o.uuid):
+        ident_attrib = obj.ident_attrib
+        ident_attribute = ident_attrib.uuid if isinstance(ident_attrib, SOMcreator.Attribute) else ident_attrib
+        object_rows.append(_basics(obj, filter_matrix_dict) + (obj.abbreviation, ident_attribute))
+        ifc_mapping_rows += [(obj.uuid, ifc_mapping) for ifc_mapping in obj.ifc_mapping]
+    cursor.executemany("INSERT INTO objects VALUES (?, ?, ?, ?, ?, ?, ?, ?)", object_rows)
+    cursor.executemany("INSERT INTO ifc_mappings VALUES (?, ?)", ifc_mapping_rows)
+
+    property_set_rows, attribute_rows, value_rows = list(), list(), list()
+    for property_set, object_uuid in _iter_property_sets(proj):
+        property_set_rows.append((object_uuid,) + _basics(property_set, filter_matrix_dict))
+        for attribute in property_set.get_attributes(filter=False):
+            attribute_rows.append(
+                (property_set.uuid,) + _basics(attribute, filter_matrix_dict) + (
+                    attribute.data_type, attribute.value_type, attribute.child_inherits_values,
+                    attribute.revit_name))
+            value_rows += [(attribute.uuid, position, json.dumps(value)) for position, value in
+                           enumerate(attribute.get_own_values())]
+    # column order of the tables is uuid first
+    cursor.executemany("INSERT INTO property_sets (object, uuid, name, description, optional, filter_matrix, parent) "
+                       "VALUES (?, ?, ?, ?, ?, ?, ?)", property_set_rows)
+    cursor.executemany("INSERT INTO attributes (property_set, uuid, name, description, optional, filter_matrix, parent, "
+                       "data_type, value_type, child_inherits_value, revit_mapping) "
+                       "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)", attribute_rows)
+    cursor.executemany("INSERT INTO attribute_values VALUES (?, ?, ?)", value_rows)
+
+    aggregation_rows = list()
+    for aggregation in proj.get_aggregations(filter=False):
+        uuid, _, description, optional, filter_matrix, parent = _basics(aggregation, filter_matrix_dict)
+        aggregation_rows.append((uuid, aggregation.object.uuid, parent, aggregation.parent_connection,
+                                 aggregation.get_identity_text() or None, description, optional, filter_matrix))
+    cursor.executemany("INSERT INTO aggregations VALUES (?, ?, ?, ?, ?, ?, ?, ?)", aggregation_rows)
+
+
+def export_sqlite(proj: Project, path: str) -> None:
+    """writes the Project as SQLite database. The file can be opened lazily by Project.open"""
+    start_time = time.time()
+    # write to a unique temporary file, so an exception while writing doesn't destroy the existing file
+    # and parallel saves of the same path don't write into the same file
+    file_descriptor, temp_path = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(os.path.abspath(path)))
+    os.close(file_descriptor)
+    try:
+        connection = sqlite3.connect(temp_path)
+        try:
+            with connection:
+                connection.executescript(som_sqlite.SCHEMA)
+                connection.execute(f"PRAGMA user_version = {som_sqlite.SCHEMA_VERSION}")
+                cursor = connection.cursor()
+                _write_project(proj, cursor)
+                _write_entities(proj, cursor)
+        finally:
+            connection.close()
+        os.chmod(temp_path, get_file_mode(path))  # mkstemp creates files only readable by the owner
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    logging.info(f"Export Done. Time: {time.time() - start_time}")
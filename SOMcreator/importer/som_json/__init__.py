@@ -2,76 +2,148 @@ from __future__ import annotations
 
 import logging
 import os
-import json
 import time
 
 import SOMcreator
 import SOMcreator.datastructure.som_json
-from SOMcreator.datastructure.som_json import FILTER_MATRIXES, MainDict
+from SOMcreator.util import json_backend, project_cache
+from SOMcreator.datastructure.som_json import AGGREGATIONS, FILTER_MATRIXES, MainDict, OBJECTS, PREDEFINED_PSETS
 from typing import Type, TYPE_CHECKING
-from . import core, project, predefined_pset, property_set, obj, aggregation, inheritance
+from . import core, project, predefined_pset, property_set, obj, aggregation, inheritance, json_stream, journal
+from .core import ImportContext
 
 if TYPE_CHECKING:
-    from SOMcreator import Project, UseCase, Phase
-parent_dict = dict()
-aggregation_dict = dict()
-phase_list: list[Phase] = list()
-use_case_list: list[UseCase] = list()
-plugin_dict = dict()
-object_uuid_dict: dict[str, SOMcreator.Object] = dict()
-property_set_uuid_dict: dict[str, SOMcreator.PropertySet] = dict()
-attribute_uuid_dict: dict[str, SOMcreator.Attribute] = dict()
-filter_matrixes = list()
-
-
-def reset_uuid_dicts():
-    SOMcreator.importer.som_json.object_uuid_dict = dict()
-    SOMcreator.importer.som_json.property_set_uuid_dict = dict()
-    SOMcreator.importer.som_json.attribute_uuid_dict = dict()
-    SOMcreator.importer.som_json.filter_matrixes = list()
-
-
-def open_json(cls: Type[Project], path: str):
+    from SOMcreator import Project
+
+# entity sections that are built while the file is read and the sections they depend on
+STREAM_LOADERS = {
+    PREDEFINED_PSETS: predefined_pset.load_items,
+    OBJECTS:          obj.load_items,
+    AGGREGATIONS:     aggregation.load_items,
+}
+STREAM_DEPENDENCIES = {
+    PREDEFINED_PSETS: set(),
+    OBJECTS:          set(),
+    AGGREGATIONS:     {OBJECTS},
+}
+
+
+def open_json(cls: Type[Project], path: str, stream: bool = False):
+    """
+    :param stream: parse the file incrementally. Objects, PredefinedPropertySets and Aggregations are built
+    while their records are read, only the remaining (plugin) sections are kept in memory
+    In both modes proj.import_dict holds the sections of the file without the entity sections
+    The import doesn't share state with other calls, multiple files can be opened in parallel threads
+    """
     start_time = time.time()
-
-    SOMcreator.importer.som_json.parent_dict = dict()
-    reset_uuid_dicts()
     if not os.path.isfile(path):
         raise FileNotFoundError(f"File '{path}' does not exist!")
 
-    with open(path, "r") as file:
-        main_dict: MainDict = json.load(file)
+    cache_key = project_cache.get_key(cls, path) if project_cache.is_enabled() else None
+    if cache_key is not None:
+        proj = project_cache.load(cls, cache_key)
+        if proj is not None:
+            proj.clear_dirty()
+            logging.info(f"Import Done. Time: {time.time() - start_time}")
+            return proj
+
+    context = ImportContext()
+    if stream:
+        proj, main_dict = _load_stream(context, cls, path)
+    else:
+        with open(path, "rb") as file:
+            main_dict: MainDict = json_backend.loads(file.read())
+        proj = _load_dict(context, cls, main_dict)
+
+    inheritance.calculate(context, proj)
+    logging.debug(f"Inheritance Calculated")
 
-    SOMcreator.importer.som_json.plugin_dict = dict(main_dict)
-    SOMcreator.importer.som_json.filter_matrixes = main_dict.get(FILTER_MATRIXES)
-    core.remove_part_of_dict(FILTER_MATRIXES)
+    aggregation.calculate(context, proj)
+    logging.debug(f"Aggregation Calculated")
 
-    logging.debug(f"Filter Matrixes Read")
+    proj.plugin_dict = context.plugin_dict
+    proj.import_dict = main_dict
+    journal.replay(proj, path)
+    proj.clear_dirty()
+    if cache_key is not None:
+        project_cache.store(proj, cache_key)
+    end_time = time.time()
+    logging.info(f"Import Done. Time: {end_time - start_time}")
+    return proj
+
+
+def _load_project(context: ImportContext, cls: Type[Project], main_dict: MainDict) -> Project:
     project_dict = main_dict.get(SOMcreator.datastructure.som_json.PROJECT)
-    SOMcreator.importer.som_json.phase_list, SOMcreator.importer.som_json.use_case_list = core.get_filter_lists(
-        project_dict)
+    context.phase_list, context.use_case_list = core.get_filter_lists(project_dict)
     logging.debug(f"Filter List Read")
 
-    proj, project_dict = project.load(cls, main_dict)
+    proj, project_dict = project.load(context, cls, main_dict)
     logging.debug(f"Project Read")
+    return proj
 
-    predefined_pset.load(proj, main_dict)
+
+def _load_dict(context: ImportContext, cls: Type[Project], main_dict: MainDict) -> Project:
+    context.plugin_dict = dict(main_dict)
+    context.filter_matrixes = main_dict.get(FILTER_MATRIXES)
+    core.remove_part_of_dict(context, FILTER_MATRIXES)
+    logging.debug(f"Filter Matrixes Read")
+
+    proj = _load_project(context, cls, main_dict)
+
+    predefined_pset.load(context, proj, main_dict)
     logging.debug(f"Predefined Pset Read")
 
-    obj.load(proj, main_dict)
+    obj.load(context, proj, main_dict)
     logging.debug(f"Objects Read")
 
-    aggregation.load(proj, main_dict)
+    aggregation.load(context, proj, main_dict)
     logging.debug(f"Aggregations Read")
 
-    inheritance.calculate(proj)
-    logging.debug(f"Inheritance Calculated")
+    core.load_pending_filter_matrixes(context, proj)
+    for key in STREAM_LOADERS:
+        main_dict.pop(key, None)  # the entities were built, import_dict only keeps the remaining sections
+    return proj
 
-    aggregation.calculate(proj)
-    logging.debug(f"Aggregation Calculated")
 
-    proj.plugin_dict = SOMcreator.importer.som_json.plugin_dict
-    proj.import_dict = main_dict
-    end_time = time.time()
-    logging.info(f"Import Done. Time: {end_time - start_time}")
-    return proj
+def _load_stream(context: ImportContext, cls: Type[Project], path: str) -> tuple[Project, MainDict]:
+    """
+    Sections are handled in file order. Entity sections are only streamed if the sections they depend on
+    were read before (as written by the exporter), otherwise they are read as a whole and loaded afterwards.
+    Filter matrixes referenced by index are resolved once the FilterMatrixes section was read
+    """
+    context.plugin_dict = dict()
+    context.filter_matrixes = None
+    main_dict: MainDict = dict()
+    proj = None
+    loaded_sections = set()
+
+    with open(path, "r", encoding="utf-8") as file:
+        reader = json_stream.JsonStreamReader(file)
+        for key in reader.iter_keys():
+            if key in STREAM_LOADERS and proj is not None and STREAM_DEPENDENCIES[key] <= loaded_sections:
+                STREAM_LOADERS[key](context, proj, reader.iter_items())
+                loaded_sections.add(key)
+                logging.debug(f"{key} Read")
+                continue
+
+            main_dict[key] = reader.read_value()
+            context.plugin_dict[key] = main_dict[key]
+            if key == FILTER_MATRIXES:
+                context.filter_matrixes = main_dict[key]
+                core.remove_part_of_dict(context, FILTER_MATRIXES)
+                logging.debug(f"Filter Matrixes Read")
+            elif key == SOMcreator.datastructure.som_json.PROJECT:
+                proj = _load_project(context, cls, main_dict)
+
+    if proj is None:
+        raise KeyError(f"File '{path}' has no {SOMcreator.datastructure.som_json.PROJECT} section!")
+
+    # sections that couldn't be streamed
+    for key, loader in ((PREDEFINED_PSETS, predefined_pset.load), (OBJECTS, obj.load),
+                        (AGGREGATIONS, aggregation.load)):
+        if key not in loaded_sections:
+            loader(context, proj, main_dict)
+            main_dict.pop(key, None)
+
+    core.load_pending_filter_matrixes(context, proj)
+    return proj, main_dict
@@ -2,16 +2,19 @@ from __future__ import annotations
 import SOMcreator
 from SOMcreator.importer.som_json import core
 from SOMcreator.constants.value_constants import OLD_DATATYPE_DICT
-from SOMcreator.importer import som_json
 from typing import TYPE_CHECKING
 
 from SOMcreator.datastructure.som_json import CHILD_INHERITS_VALUE, DATA_TYPE, REVIT_MAPPING, VALUE, \
     VALUE_TYPE
 
 
-def load(proj: SOMcreator.Project, attribute_dict: dict, identifier: str,
+if TYPE_CHECKING:
+    from SOMcreator.importer.som_json.core import ImportContext
+
+
+def load(context: ImportContext, proj: SOMcreator.Project, attribute_dict: dict, identifier: str,
          property_set: SOMcreator.PropertySet, ) -> None:
-    name, description, optional, parent, filter_matrix = core.get_basics(proj, attribute_dict, identifier)
+    name, description, optional, parent, filter_matrix = core.get_basics(context, proj, attribute_dict, identifier)
     value = attribute_dict[VALUE]
     value_type = attribute_dict[VALUE_TYPE]
     data_type = attribute_dict[DATA_TYPE]
@@ -27,5 +30,5 @@ def load(proj: SOMcreator.Project, attribute_dict: dict, identifier: str,
                                      child_inherits_values=child_inherits_value, uuid=identifier,
                                      description=description, optional=optional, revit_mapping=revit_mapping,
                                      project=proj, filter_matrix=filter_matrix)
-    som_json.parent_dict[attribute] = parent
-    SOMcreator.importer.som_json.attribute_uuid_dict[identifier] = attribute
+    context.parent_dict[attribute] = parent
+    context.attribute_uuid_dict[identifier] = attribute
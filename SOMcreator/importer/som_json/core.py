@@ -8,11 +8,32 @@ import SOMcreator.util.misc
 
 if TYPE_CHECKING:
     from SOMcreator import Project
+    from SOMcreator.datastructure.base import Hirarchy
     from SOMcreator.datastructure.som_json import ProjectDict, StandardDict, ObjectDict, PropertySetDict, \
         AttributeDict, \
         AggregationDict
 
 
+PENDING_FILTER_MATRIX = "pending_filter_matrix"
+
+
+class ImportContext(object):
+    """
+    State of a single import. Every call of open_json gets its own context, so Projects can be imported in parallel
+    """
+
+    def __init__(self, filter_matrixes: list | None = None):
+        self.parent_dict: dict[Hirarchy, str | None] = dict()  # entity -> uuid of parent
+        self.aggregation_dict: dict[SOMcreator.Aggregation, tuple[str | None, int]] = dict()
+        self.phase_list: list[SOMcreator.Phase] = list()
+        self.use_case_list: list[SOMcreator.UseCase] = list()
+        self.plugin_dict = dict()  # sections of the file that aren't loaded by SOMcreator
+        self.object_uuid_dict: dict[str, SOMcreator.Object] = dict()
+        self.property_set_uuid_dict: dict[str, SOMcreator.PropertySet] = dict()
+        self.attribute_uuid_dict: dict[str, SOMcreator.Attribute] = dict()
+        self.filter_matrixes = filter_matrixes  # None until the FilterMatrixes section was read
+
+
 ##### Import #####
 
 def get_filter_lists(project_dict: ProjectDict):
@@ -40,14 +61,18 @@ def get_filter_lists(project_dict: ProjectDict):
     return phase_list, use_case_list
 
 
-def load_filter_matrix(proj: SOMcreator.Project, element_dict: StandardDict, guid: str):
+def load_filter_matrix(context: ImportContext, proj: SOMcreator.Project, element_dict: StandardDict, guid: str):
     matrix: list[list[bool]] = element_dict.get(FILTER_MATRIX)
     if matrix is None:
         logging.warning(
             f"Achtung! Filtermatrix für Element '{guid}' liegt nicht vor. Eventuell verwenden Sie eine alte Dateiversion. Bitte mit SOM-Toolkit 2.11.3 Öffnen und neu speichern!")
         return proj.create_filter_matrix(True)
     if isinstance(matrix, int):
-        return list(SOMcreator.importer.som_json.filter_matrixes[matrix])
+        filter_matrixes = context.filter_matrixes
+        if filter_matrixes is None:
+            # FilterMatrixes weren't read yet (streaming import), resolved by load_pending_filter_matrixes
+            return ((PENDING_FILTER_MATRIX, matrix),)
+        return list(filter_matrixes[matrix])
     if not SOMcreator.util.misc.check_size_eq(matrix, proj.get_filter_matrix()):
         logging.warning(
             f"Achtung! Filtermatrix für  Element '{guid}' hat die falsche Größe! Status wird überall auf True gesetzt!")
@@ -55,13 +80,35 @@ def load_filter_matrix(proj: SOMcreator.Project, element_dict: StandardDict, gui
     return matrix
 
 
-def get_basics(proj: SOMcreator.Project, element_dict: StandardDict, guid: str) -> tuple[
+def load_pending_filter_matrixes(context: ImportContext, proj: SOMcreator.Project):
+    """replaces the placeholders created by load_filter_matrix with the matrixes of the FilterMatrixes section"""
+    filter_matrixes = context.filter_matrixes
+
+    def is_pending(matrix) -> bool:
+        return bool(matrix and matrix[0]) and matrix[0][0] == PENDING_FILTER_MATRIX
+
+    def resolve(matrix):
+        if not is_pending(matrix):
+            return matrix
+        index = matrix[0][1]
+        if filter_matrixes is None or index >= len(filter_matrixes):
+            logging.warning(f"Achtung! Filtermatrix {index} liegt nicht vor. Status wird überall auf True gesetzt!")
+            matrix = proj.create_filter_matrix(True)
+        else:
+            matrix = filter_matrixes[index]
+        return tuple(tuple(usecase_list) for usecase_list in matrix)
+
+    if any(is_pending(matrix) for matrix in proj._filter_matrices):
+        proj._change_filter_matrices(resolve)
+
+
+def get_basics(context: ImportContext, proj: SOMcreator.Project, element_dict: StandardDict, guid: str) -> tuple[
     str, str, bool, str, list[list[bool]]]:
     name = element_dict[NAME]
     description = element_dict[DESCRIPTION]
     optional = element_dict[OPTIONAL]
     parent = element_dict[PARENT]
-    matrix = load_filter_matrix(proj, element_dict, guid)
+    matrix = load_filter_matrix(context, proj, element_dict, guid)
     return name, description, optional, parent, matrix
 
 
@@ -72,11 +119,11 @@ def check_dict(d: dict | None, d_name: str) -> bool:
     return False
 
 
-def remove_part_of_dict(key):
+def remove_part_of_dict(context: ImportContext, key):
     """
     Removes part of plugin dict if its saved in Core
     :param key:
     :return:
     """
-    if key in SOMcreator.importer.som_json.plugin_dict:
-        SOMcreator.importer.som_json.plugin_dict.pop(key)
+    if key in context.plugin_dict:
+        context.plugin_dict.pop(key)
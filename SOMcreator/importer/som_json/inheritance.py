@@ -1,34 +1,50 @@
 from __future__ import annotations
+
+from collections import deque
+from typing import TYPE_CHECKING
+
 import SOMcreator
 
+if TYPE_CHECKING:
+    from SOMcreator.importer.som_json.core import ImportContext
 
-def _find_parent(uuid_dict, element):
-    for test_el, identifier in SOMcreator.importer.som_json.parent_dict.items():
-        if type(test_el) is not type(element):
-            continue
-        if identifier not in uuid_dict:
-            continue
-        if test_el == element:
-            continue
-        if test_el.parent is not None:
-            continue
 
-        if test_el.name != element.name:
+def _build_parent_index(context: ImportContext, proj: SOMcreator.Project) -> dict[tuple[type, str], deque]:
+    """
+    groups all elements with an existing parent by (type, name) in import order.
+    Elements of a group get their parent in this order, so resolved elements are only ever at the front
+    """
+    index = dict()
+    for element, identifier in context.parent_dict.items():
+        if proj.get_element_by_uuid(identifier) is None:
             continue
+        index.setdefault((type(element), element.name), deque()).append(element)
+    return index
+
 
-        if isinstance(test_el, SOMcreator.Attribute):
-            if test_el.value == element.value:
-                return identifier
-        return identifier
+def _find_parent(context: ImportContext, parent_index: dict[tuple[type, str], deque], element):
+    """
+    returns the parent identifier of the first element with the same type and name that has no parent yet
+    """
+    candidates = parent_index.get((type(element), element.name))
+    if not candidates:
+        return None
+    while candidates and candidates[0].parent is not None:
+        candidates.popleft()
+    if not candidates:
+        return None
+    return context.parent_dict[candidates[0]]
 
 
-def calculate(proj: SOMcreator.Project):
-    uuid_dict = proj.get_uuid_dict()
-    for entity, uuid in SOMcreator.importer.som_json.parent_dict.items():
+def calculate(context: ImportContext, proj: SOMcreator.Project):
+    parent_index = None
+    for entity, uuid in context.parent_dict.items():
         if uuid is None:
             continue
-        if uuid not in uuid_dict:
-            uuid = _find_parent(uuid_dict, entity)
+        if proj.get_element_by_uuid(uuid) is None:
+            if parent_index is None:
+                parent_index = _build_parent_index(context, proj)
+            uuid = _find_parent(context, parent_index, entity)
         if uuid is None:
             continue
-        uuid_dict[uuid].add_child(entity)
+        proj.get_element_by_uuid(uuid).add_child(entity)
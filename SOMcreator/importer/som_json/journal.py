@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import logging
+import os
+from typing import TYPE_CHECKING
+
+import SOMcreator
+from SOMcreator.datastructure.som_json import ABBREVIATION, ACTIVE_PHASES, ACTIVE_USECASES, AGGREGATION_ATTRIBUTE, \
+    AGGREGATION_PSET, AGGREGATIONS, ATTRIBUTES, AUTHOR, CHILD_INHERITS_VALUE, CONNECTION, DATA_TYPE, DELETED, \
+    DESCRIPTION, FILTER_MATRIX, FILTER_MATRIXES, IDENT_ATTRIBUTE, IDENTITY_TEXT, IFC_MAPPINGS, NAME, OBJECT, OBJECTS, \
+    PARENT, PLUGINS, PROJECT, PROJECT_PHASES, PROPERTY_SET, PROPERTY_SETS, REVIT_MAPPING, USE_CASES, VALUE, \
+    VALUE_TYPE, VERSION
+from SOMcreator.exporter.som_json import journal as journal_export
+from SOMcreator.util import json_backend
+from . import core
+
+if TYPE_CHECKING:
+    from SOMcreator import Project
+    from SOMcreator.datastructure.base import Hirarchy
+    from SOMcreator.datastructure.som_json import ProjectDict, ObjectDict, PropertySetDict, AttributeDict, \
+        AggregationDict
+
+
+def replay(proj: Project, path: str | os.PathLike) -> int:
+    """
+    applies the journal written by Project.save_changes. Returns the number of applied saves.
+    Raises ValueError if the journal was written for another content of the file
+    """
+    journal_path = journal_export.get_journal_path(path)
+    if not os.path.exists(journal_path):
+        return 0
+    if not journal_export.is_valid(journal_export.read_header(path), journal_export.get_file_hash(path)):
+        raise ValueError(f"Journal '{journal_path}' doesn't belong to the current content of '{path}'. "
+                         f"Remove or rename it to open the file without the changes of the journal")
+    with open(journal_path, "rb") as file:
+        lines = file.read().splitlines()[1:]
+
+    block_count = 0
+    with proj._muted():
+        for line in lines:
+            try:
+                block = json_backend.loads(line)
+            except ValueError:
+                # the last save was interrupted while writing
+                logging.warning(f"Journal '{journal_path}' ends with an incomplete entry")
+                break
+            apply_block(proj, block)
+            block_count += 1
+    logging.debug(f"Journal replayed ({block_count} saves)")
+    return block_count
+
+
+def _load_project_values(proj: Project, project_dict: ProjectDict) -> None:
+    proj.name = project_dict[NAME]
+    proj.author = project_dict[AUTHOR]
+    proj.version = project_dict[VERSION]
+    proj.description = project_dict[DESCRIPTION] or ""
+    proj.aggregation_pset = project_dict[AGGREGATION_PSET]
+    proj.aggregation_attribute = project_dict[AGGREGATION_ATTRIBUTE]
+    proj.active_phases = project_dict[ACTIVE_PHASES]
+    proj.active_usecases = project_dict[ACTIVE_USECASES]
+    proj.set_filter_matrix(project_dict[FILTER_MATRIX])
+    # Phases and UseCases can't be added or removed inside a journal
+    for filter_list, filter_dicts in ((proj.get_phases(), project_dict[PROJECT_PHASES]),
+                                      (proj.get_usecases(), project_dict[USE_CASES])):
+        for project_filter, filter_dict in zip(filter_list, filter_dicts):
+            project_filter.name = filter_dict["name"]
+            project_filter.long_name = filter_dict["long_name"]
+            project_filter.description = filter_dict["description"]
+
+
+def _delete(element: Hirarchy) -> None:
+    """children are deleted by their own entries"""
+    if isinstance(element, SOMcreator.PropertySet):
+        element.delete(False, override_ident_deletion=True)
+    else:
+        element.delete(False)
+
+
+def _update_basics(element: Hirarchy, name: str, description: str, optional: bool, filter_matrix) -> None:
+    element.name = name
+    element.description = description
+    element.set_optional(optional)
+    element.set_filter_matrix(filter_matrix)
+
+
+def _load_object(context: core.ImportContext, proj: Project, object_dict: ObjectDict,
+                 identifier: str) -> SOMcreator.Object:
+    name, description, optional, parent, filter_matrix = core.get_basics(context, proj, object_dict, identifier)
+    obj = proj.get_element_by_uuid(identifier)
+    if obj is None:
+        return SOMcreator.Object(name=name, ident_attrib=None, uuid=identifier,
+                                 ifc_mapping=set(object_dict[IFC_MAPPINGS]), description=description,
+                                 optional=optional, abbreviation=object_dict[ABBREVIATION], project=proj,
+                                 filter_matrix=filter_matrix)
+    _update_basics(obj, name, description, optional, filter_matrix)
+    obj.ifc_mapping = set(object_dict[IFC_MAPPINGS])
+    obj.abbreviation = object_dict[ABBREVIATION]
+    return obj
+
+
+def _load_property_set(context: core.ImportContext, proj: Project, pset_dict: PropertySetDict,
+                       identifier: str) -> SOMcreator.PropertySet:
+    name, description, optional, parent, filter_matrix = core.get_basics(context, proj, pset_dict, identifier)
+    pset = proj.get_element_by_uuid(identifier)
+    if pset is None:
+        return SOMcreator.PropertySet(name=name, obj=None, uuid=identifier, description=description,
+                                      optional=optional, project=proj, filter_matrix=filter_matrix)
+    _update_basics(pset, name, description, optional, filter_matrix)
+    return pset
+
+
+def _load_attribute(context: core.ImportContext, proj: Project, attribute_dict: AttributeDict,
+                    identifier: str) -> SOMcreator.Attribute:
+    name, description, optional, parent, filter_matrix = core.get_basics(context, proj, attribute_dict, identifier)
+    attribute = proj.get_element_by_uuid(identifier)
+    if attribute is None:
+        return SOMcreator.Attribute(property_set=None, name=name, value=attribute_dict[VALUE],
+                                    value_type=attribute_dict[VALUE_TYPE], data_type=attribute_dict[DATA_TYPE],
+                                    child_inherits_values=attribute_dict[CHILD_INHERITS_VALUE], uuid=identifier,
+                                    description=description, optional=optional,
+                                    revit_mapping=attribute_dict[REVIT_MAPPING], project=proj,
+                                    filter_matrix=filter_matrix)
+    _update_basics(attribute, name, description, optional, filter_matrix)
+    attribute.value_type = attribute_dict[VALUE_TYPE]
+    attribute.data_type = attribute_dict[DATA_TYPE]
+    attribute.child_inherits_values = attribute_dict[CHILD_INHERITS_VALUE]
+    attribute.revit_name = attribute_dict[REVIT_MAPPING]
+    attribute.value = attribute_dict[VALUE]
+    return attribute
+
+
+def _load_aggregation(context: core.ImportContext, proj: Project, aggregation_dict: AggregationDict,
+                      identifier: str) -> SOMcreator.Aggregation:
+    name, description, optional, parent, filter_matrix = core.get_basics(context, proj, aggregation_dict, identifier)
+    aggregation = proj.get_element_by_uuid(identifier)
+    if aggregation is None:
+        return SOMcreator.Aggregation(obj=proj.get_element_by_uuid(aggregation_dict[OBJECT]),
+                                      parent_connection=aggregation_dict[CONNECTION], uuid=identifier,
+                                      description=description, optional=optional, filter_matrix=filter_matrix,
+                                      identity_text=aggregation_dict.get(IDENTITY_TEXT))
+    # the name of an Aggregation is the name of its Object
+    aggregation.description = description
+    aggregation.set_optional(optional)
+    aggregation.set_filter_matrix(filter_matrix)
+    aggregation.set_identity_text(aggregation_dict.get(IDENTITY_TEXT) or "")
+    return aggregation
+
+
+def _link_parent(proj: Project, element: Hirarchy, parent_uuid: str | None) -> None:
+    parent = proj.get_element_by_uuid(parent_uuid)
+    if element.parent is parent:
+        return
+    if element.parent is not None:
+        element.parent.remove_child(element)
+    if parent is not None:
+        parent.add_child(element)
+
+
+def _link_aggregation(proj: Project, aggregation: SOMcreator.Aggregation, aggregation_dict: AggregationDict) -> None:
+    parent = proj.get_element_by_uuid(aggregation_dict[PARENT])
+    connection = aggregation_dict[CONNECTION]
+    if aggregation.parent is parent:
+        if parent is not None and aggregation.parent_connection != connection:
+            aggregation.parent_connection = connection
+        return
+    if aggregation.parent is not None:
+        aggregation.parent.remove_child(aggregation)
+    if parent is not None:
+        parent.add_child(aggregation, connection)
+
+
+def apply_block(proj: Project, block: dict) -> None:
+    """
+    Entities are created or updated first, afterward memberships, parents and identifiers are linked,
+    because the entries of a save can reference each other in any order
+    """
+    context = core.ImportContext(block[FILTER_MATRIXES])
+    _load_project_values(proj, block[PROJECT])
+
+    for uuid in block[DELETED]:
+        element = proj.get_element_by_uuid(uuid)
+        if element is not None:
+            _delete(element)
+
+    objects = {uuid: _load_object(context, proj, entry, uuid) for uuid, entry in block[OBJECTS].items()}
+    psets = {uuid: _load_property_set(context, proj, entry, uuid) for uuid, entry in block[PROPERTY_SETS].items()}
+    attributes = {uuid: _load_attribute(context, proj, entry, uuid) for uuid, entry in block[ATTRIBUTES].items()}
+    aggregations = {uuid: _load_aggregation(context, proj, entry, uuid) for uuid, entry in block[AGGREGATIONS].items()}
+
+    # memberships: entries reference their owner, owners list their members
+    for uuid, entry in block[PROPERTY_SETS].items():
+        pset, owner = psets[uuid], proj.get_element_by_uuid(entry[OBJECT])
+        if owner is not None and pset.object is not owner:
+            if pset.object is not None:
+                pset.object.remove_property_set(pset)
+            owner.add_property_set(pset)
+    for uuid, entry in block[ATTRIBUTES].items():
+        attribute, owner = attributes[uuid], proj.get_element_by_uuid(entry[PROPERTY_SET])
+        if owner is not None and attribute.property_set is not owner:
+            if attribute.property_set is not None:
+                attribute.property_set.remove_attribute(attribute)
+            owner._attach_attribute(attribute)  # copies in child PropertySets have their own entries
+    for uuid, entry in block[OBJECTS].items():
+        members = set(entry[PROPERTY_SETS])
+        for pset in [p for p in objects[uuid].get_property_sets(filter=False) if p.uuid not in members]:
+            objects[uuid].remove_property_set(pset)
+    for uuid, entry in block[PROPERTY_SETS].items():
+        members = set(entry[ATTRIBUTES])
+        for attribute in [a for a in psets[uuid].get_attributes(filter=False) if a.uuid not in members]:
+            psets[uuid].remove_attribute(attribute)
+
+    # PropertySets before Attributes, relinking a PropertySet resets the parents of its Attributes
+    for entities, entries in ((objects, block[OBJECTS]), (psets, block[PROPERTY_SETS]),
+                              (attributes, block[ATTRIBUTES])):
+        for uuid, entry in entries.items():
+            _link_parent(proj, entities[uuid], entry[PARENT])
+    for uuid, entry in block[AGGREGATIONS].items():
+        _link_aggregation(proj, aggregations[uuid], entry)
+
+    for uuid, entry in block[OBJECTS].items():
+        ident_attrib = proj.get_element_by_uuid(entry[IDENT_ATTRIBUTE])
+        objects[uuid].ident_attrib = ident_attrib if isinstance(ident_attrib, SOMcreator.Attribute) else None
+
+    if PLUGINS in block:
+        proj.plugin_dict = dict(block[PLUGINS])
+        proj.import_dict.update(block[PLUGINS])
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Iterator, TextIO
+
+CHUNK_SIZE = 1 << 20
+WHITESPACE = " \t\n\r"
+
+
+class JsonStreamReader(object):
+    """
+    incremental reader for a JSON document whose root is an object.
+    Only the currently read value is held in memory, the rest of the file stays on disk.
+    """
+
+    def __init__(self, file: TextIO, chunk_size: int = CHUNK_SIZE):
+        self._file = file
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _read_chunk(self, size: int) -> bool:
+        if self._eof:
+            return False
+        chunk = self._file.read(size)
+        if not chunk:
+            self._eof = True
+            return False
+        # drop everything that was already consumed
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """returns the next non whitespace character without consuming it ("" at the end of the file)"""
+        while True:
+            buffer, pos = self._buffer, self._pos
+            while pos < len(buffer) and buffer[pos] in WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos < len(buffer):
+                return buffer[pos]
+            if not self._read_chunk(self._chunk_size):
+                return ""
+
+    def _expect(self, char: str) -> None:
+        found = self._peek()
+        if found != char:
+            raise json.JSONDecodeError(f"Expecting '{char}'", self._buffer, self._pos)
+        self._pos += 1
+
+    def read_value(self) -> Any:
+        """decodes the next complete value"""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # value is not complete yet, grow the buffer (doubling keeps re-decoding linear)
+                if not self._read_chunk(max(self._chunk_size, len(self._buffer))):
+                    raise
+                continue
+            # numbers and literals might continue in the next chunk
+            if end == len(self._buffer) and self._read_chunk(self._chunk_size):
+                continue
+            self._pos = end
+            return value
+
+    def iter_items(self) -> Iterator[tuple[str, Any]]:
+        """iterates over the key, value pairs of the next object. Values are decoded one at a time"""
+        for key in self.iter_keys():
+            yield key, self.read_value()
+
+    def iter_keys(self) -> Iterator[str]:
+        """
+        iterates over the keys of the next object.
+        After each key the consumer has to read the value (read_value, iter_items or iter_keys)
+        """
+        self._expect("{")
+        if self._peek() == "}":
+            self._pos += 1
+            return
+        while True:
+            key = self.read_value()
+            if not isinstance(key, str):
+                raise json.JSONDecodeError("Expecting property name", self._buffer, self._pos)
+            self._expect(":")
+            yield key
+            char = self._peek()
+            self._pos += 1
+            if char == "}":
+                return
+            if char != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", self._buffer, self._pos - 1)
@@ -1,5 +1,5 @@
 from __future__ import annotations
-from typing import TYPE_CHECKING
+from typing import Iterable, TYPE_CHECKING
 from SOMcreator.datastructure.som_json import IFC_MAPPINGS, ABBREVIATION, PROPERTY_SETS, IDENT_ATTRIBUTE, OBJECTS
 from SOMcreator.importer.som_json import property_set
 import SOMcreator
@@ -8,12 +8,14 @@ from SOMcreator.importer.som_json import core
 if TYPE_CHECKING:
     from SOMcreator import Project
     from SOMcreator.datastructure.som_json import ObjectDict, MainDict
+    from SOMcreator.importer.som_json.core import ImportContext
 
 
 ### Import ###
 
-def _load_object(proj: SOMcreator.Project, object_dict: ObjectDict, identifier: str) -> SOMcreator.Object:
-    name, description, optional, parent, filter_matrix = core.get_basics(proj, object_dict, identifier)
+def _load_object(context: ImportContext, proj: SOMcreator.Project, object_dict: ObjectDict,
+                 identifier: str) -> SOMcreator.Object:
+    name, description, optional, parent, filter_matrix = core.get_basics(context, proj, object_dict, identifier)
     ifc_mapping = object_dict[IFC_MAPPINGS]
     if isinstance(ifc_mapping, list):
         ifc_mapping = set(ifc_mapping)
@@ -25,20 +27,23 @@ def _load_object(proj: SOMcreator.Project, object_dict: ObjectDict, identifier:
                             filter_matrix=filter_matrix)
     property_sets_dict = object_dict[PROPERTY_SETS]
     for ident, pset_dict in property_sets_dict.items():
-        property_set.load(proj, pset_dict, ident, obj)
+        property_set.load(context, proj, pset_dict, ident, obj)
     ident_attrib_id = object_dict[IDENT_ATTRIBUTE]
     if ident_attrib_id is not None:
-        ident_attrib = SOMcreator.importer.som_json.attribute_uuid_dict.get(ident_attrib_id)
+        ident_attrib = context.attribute_uuid_dict.get(ident_attrib_id)
         obj.ident_attrib = ident_attrib
-    SOMcreator.importer.som_json.parent_dict[obj] = parent
-    SOMcreator.importer.som_json.object_uuid_dict[identifier] = obj
+    context.parent_dict[obj] = parent
+    context.object_uuid_dict[identifier] = obj
 
 
-def load(proj: Project, main_dict: dict):
+def load(context: ImportContext, proj: Project, main_dict: dict):
     objects_dict: dict[str, ObjectDict] = main_dict.get(OBJECTS)
-    core.remove_part_of_dict(OBJECTS)
+    core.remove_part_of_dict(context, OBJECTS)
 
     objects_dict = dict() if core.check_dict(objects_dict, OBJECTS) else objects_dict
+    load_items(context, proj, objects_dict.items())
 
-    for uuid_ident, entity_dict in objects_dict.items():
-        _load_object(proj, entity_dict, uuid_ident)
+
+def load_items(context: ImportContext, proj: Project, items: Iterable[tuple[str, ObjectDict]]):
+    for uuid_ident, entity_dict in items:
+        _load_object(context, proj, entity_dict, uuid_ident)
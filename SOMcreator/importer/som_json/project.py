@@ -10,6 +10,7 @@ from . import core
 
 if TYPE_CHECKING:
     from SOMcreator import Project
+    from SOMcreator.importer.som_json.core import ImportContext
 
 
 def _load_filter_matrix(project_dict: ProjectDict, use_case_list: list[SOMcreator.UseCase],
@@ -42,9 +43,9 @@ def _load_single_filter(current_state: str | int | None,
     return current_state, value_list
 
 
-def _load_usecases(project_dict: ProjectDict) -> tuple[list[int], list[SOMcreator.UseCase]]:
+def _load_usecases(context: ImportContext, project_dict: ProjectDict) -> tuple[list[int], list[SOMcreator.UseCase]]:
     active_usecases: list[int] = project_dict.get(ACTIVE_USECASES)
-    use_case_list = SOMcreator.importer.som_json.use_case_list
+    use_case_list = context.use_case_list
 
     if active_usecases is not None:
         return active_usecases, use_case_list
@@ -55,9 +56,9 @@ def _load_usecases(project_dict: ProjectDict) -> tuple[list[int], list[SOMcreato
     return [phase_list.index(usecase)], use_case_list
 
 
-def _load_phases(project_dict: ProjectDict) -> tuple[list[int], list[SOMcreator.Phase]]:
+def _load_phases(context: ImportContext, project_dict: ProjectDict) -> tuple[list[int], list[SOMcreator.Phase]]:
     active_phases: list[int] = project_dict.get(ACTIVE_PHASES)
-    phase_list = SOMcreator.importer.som_json.phase_list
+    phase_list = context.phase_list
 
     if active_phases is not None:
         return active_phases, phase_list
@@ -69,9 +70,9 @@ def _load_phases(project_dict: ProjectDict) -> tuple[list[int], list[SOMcreator.
     return [phase_list.index(phase)], phase_list
 
 
-def load(cls: Type[Project], main_dict: MainDict) -> tuple[Project, dict]:
+def load(context: ImportContext, cls: Type[Project], main_dict: MainDict) -> tuple[Project, dict]:
     project_dict: ProjectDict = main_dict.get(PROJECT)
-    core.remove_part_of_dict(PROJECT)
+    core.remove_part_of_dict(context, PROJECT)
 
     name: str = project_dict.get(NAME)
     author = project_dict.get(AUTHOR)
@@ -80,8 +81,8 @@ def load(cls: Type[Project], main_dict: MainDict) -> tuple[Project, dict]:
     aggregation_pset_name = project_dict.get(AGGREGATION_PSET)
     aggregation_attribute = project_dict.get(AGGREGATION_ATTRIBUTE)
 
-    active_use_cases, use_case_list = _load_usecases(project_dict)
-    active_phases, phase_list = _load_phases(project_dict)
+    active_use_cases, use_case_list = _load_usecases(context, project_dict)
+    active_phases, phase_list = _load_phases(context, project_dict)
     filter_matrix = _load_filter_matrix(project_dict, use_case_list, phase_list)
 
     proj = cls(name, author, phase_list, use_case_list, filter_matrix)
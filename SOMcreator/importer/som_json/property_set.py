@@ -8,14 +8,16 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from SOMcreator.datastructure.som_json import PropertySetDict
     from SOMcreator import Project
+    from SOMcreator.importer.som_json.core import ImportContext
 
 
-def load(proj: Project, pset_dict: PropertySetDict, identifier: str, obj: SOMcreator.Object | None) -> None:
-    name, description, optional, parent, filter_matrix = core.get_basics(proj, pset_dict, identifier)
+def load(context: ImportContext, proj: Project, pset_dict: PropertySetDict, identifier: str,
+         obj: SOMcreator.Object | None) -> None:
+    name, description, optional, parent, filter_matrix = core.get_basics(context, proj, pset_dict, identifier)
     pset = SOMcreator.PropertySet(name=name, obj=obj, uuid=identifier, description=description, optional=optional,
                                   project=proj, filter_matrix=filter_matrix)
     attributes_dict = pset_dict[ATTRIBUTES]
     for ident, attribute_dict in attributes_dict.items():
-        attribute.load(proj, attribute_dict, ident, pset)
-    SOMcreator.importer.som_json.parent_dict[pset] = parent
-    SOMcreator.importer.som_json.property_set_uuid_dict[identifier] = pset
+        attribute.load(context, proj, attribute_dict, ident, pset)
+    context.parent_dict[pset] = parent
+    context.property_set_uuid_dict[identifier] = pset
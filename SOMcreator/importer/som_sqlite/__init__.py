@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import sqlite3
+import time
+from typing import Type, TYPE_CHECKING
+
+import SOMcreator
+from SOMcreator.datastructure import som_sqlite
+from .store import LazyStore
+
+if TYPE_CHECKING:
+    from SOMcreator import Project
+
+
+def is_sqlite_file(path: str | os.PathLike) -> bool:
+    with open(path, "rb") as file:
+        return file.read(len(som_sqlite.HEADER)) == som_sqlite.HEADER
+
+
+def _load_filter_list(connection: sqlite3.Connection, table: str, filter_class):
+    rows = connection.execute(f"SELECT name, long_name, description FROM {table} ORDER BY position")
+    return [filter_class(name, long_name, description) for name, long_name, description in rows]
+
+
+def _load_project(cls: Type[Project], connection: sqlite3.Connection) -> Project:
+    values = {key: json.loads(value) for key, value in connection.execute("SELECT key, value FROM project")}
+    phases = _load_filter_list(connection, "phases", SOMcreator.Phase)
+    usecases = _load_filter_list(connection, "usecases", SOMcreator.UseCase)
+    proj = cls(values.get(som_sqlite.NAME), values.get(som_sqlite.AUTHOR), phases, usecases,
+               values.get(som_sqlite.FILTER_MATRIX))
+    proj.version = values.get(som_sqlite.VERSION)
+    proj.description = values.get(som_sqlite.DESCRIPTION) or ""
+    proj.aggregation_pset = values.get(som_sqlite.AGGREGATION_PSET) or ""
+    proj.aggregation_attribute = values.get(som_sqlite.AGGREGATION_ATTRIBUTE) or ""
+    proj.active_phases = values.get(som_sqlite.ACTIVE_PHASES)
+    proj.active_usecases = values.get(som_sqlite.ACTIVE_USECASES)
+    plugin_dict = {key: json.loads(value) for key, value in connection.execute("SELECT key, value FROM plugin_sections")}
+    proj.plugin_dict = plugin_dict
+    proj.import_dict = dict(plugin_dict)
+    return proj
+
+
+def open_sqlite(cls: Type[Project], path: str | os.PathLike, lazy: bool = True) -> Project:
+    """
+    :param lazy: only Objects, Aggregations and predefined PropertySets are created on open.
+    The PropertySets and Attributes of an Object are loaded from the database on first access.
+    The database stays opened until everything is loaded
+    """
+    start_time = time.time()
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"File '{path}' does not exist!")
+    connection = sqlite3.connect(path)
+    version = connection.execute("PRAGMA user_version").fetchone()[0]
+    if version != som_sqlite.SCHEMA_VERSION:
+        connection.close()
+        raise ValueError(f"File '{path}' has unsupported schema version {version}")
+
+    proj = _load_project(cls, connection)
+    store = LazyStore(proj, connection)
+    store.load_skeleton()
+    if not lazy:
+        store.load_all()
+    proj.clear_dirty()
+    logging.info(f"Import Done. Time: {time.time() - start_time}")
+    return proj
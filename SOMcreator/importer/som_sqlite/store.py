@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+from typing import Iterable, TYPE_CHECKING
+
+import SOMcreator
+
+if TYPE_CHECKING:
+    from SOMcreator import Project
+    from SOMcreator.datastructure.base import Hirarchy
+
+CHUNK_SIZE = 500  # stays below the SQLite limit of host parameters
+
+PROPERTY_SET_QUERY = """SELECT p.uuid, p.object, p.name, p.description, p.optional, p.filter_matrix, p.parent
+FROM property_sets p WHERE {} ORDER BY p.rowid"""
+ATTRIBUTE_QUERY = """SELECT a.uuid, a.property_set, a.name, a.description, a.optional, a.filter_matrix, a.parent,
+a.data_type, a.value_type, a.child_inherits_value, a.revit_mapping
+FROM attributes a JOIN property_sets p ON a.property_set = p.uuid WHERE {} ORDER BY a.rowid"""
+VALUE_QUERY = """SELECT v.attribute, v.value
+FROM attribute_values v JOIN attributes a ON v.attribute = a.uuid JOIN property_sets p ON a.property_set = p.uuid
+WHERE {} ORDER BY v.rowid"""
+CHILD_OWNER_QUERY = """SELECT object FROM property_sets WHERE parent = ? AND object IS NOT NULL
+UNION SELECT p.object FROM attributes a JOIN property_sets p ON a.property_set = p.uuid WHERE a.parent = ?"""
+OWNER_QUERY = """SELECT object FROM property_sets WHERE uuid = ?
+UNION SELECT p.object FROM attributes a JOIN property_sets p ON a.property_set = p.uuid WHERE a.uuid = ?"""
+
+
+class LazyStore(object):
+    """
+    connects a Project to the SQLite file it was opened from.
+    Objects, Aggregations and predefined PropertySets are created on open,
+    the PropertySets and Attributes of an Object when the Object gets touched.
+    Entities whose children live in Objects that aren't loaded yet load those Objects on get_children,
+    so inheritance stays complete for everything that can be reached
+    """
+
+    def __init__(self, project: Project, connection: sqlite3.Connection):
+        self._project = project
+        self._connection = connection
+        self._filter_matrixes = [project.intern_filter_matrix(json.loads(matrix)) for (matrix,) in
+                                 connection.execute("SELECT matrix FROM filter_matrixes ORDER BY id")]
+        self._objects: dict[str, SOMcreator.Object] = dict()
+        self._pending_objects: dict[SOMcreator.Object, str | None] = dict()  # Object -> ident attribute uuid
+        self._loaded_children: set[str] = set()
+        self._loading = False
+
+    def is_pending(self, obj: SOMcreator.Object) -> bool:
+        return obj in self._pending_objects
+
+    def load_skeleton(self) -> None:
+        """creates Objects, Aggregations and the predefined PropertySets"""
+        proj = self._project
+        ifc_mappings: dict[str, set[str]] = dict()
+        for object_uuid, ifc_mapping in self._connection.execute("SELECT object, ifc_mapping FROM ifc_mappings"):
+            ifc_mappings.setdefault(object_uuid, set()).add(ifc_mapping)
+
+        with proj._muted():
+            with proj.bulk() as builder:
+                for uuid, name, description, optional, filter_matrix, parent, abbreviation, ident_attribute in \
+                        self._connection.execute("SELECT * FROM objects ORDER BY rowid"):
+                    obj = builder.create_object(name, None, parent=parent, uuid=uuid, description=description,
+                                                optional=bool(optional), abbreviation=abbreviation,
+                                                ifc_mapping=ifc_mappings.get(uuid, set()),
+                                                filter_matrix=self._filter_matrixes[filter_matrix])
+                    self._objects[uuid] = obj
+                    self._pending_objects[obj] = ident_attribute
+
+            aggregation_parents = list()
+            for uuid, object_uuid, parent, connection, identity_text, description, optional, filter_matrix in \
+                    self._connection.execute("SELECT * FROM aggregations ORDER BY rowid"):
+                aggregation = SOMcreator.Aggregation(self._objects[object_uuid], connection, uuid, description,
+                                                     bool(optional), self._filter_matrixes[filter_matrix],
+                                                     identity_text)
+                aggregation_parents.append((aggregation, parent, connection))
+            for aggregation, parent, connection in aggregation_parents:
+                parent = proj.get_element_by_uuid(parent)
+                if parent is not None:
+                    parent.add_child(aggregation, connection)
+
+        proj._lazy_store = self
+        self._load_property_sets("p.object IS NULL", [])
+        if not self._pending_objects:
+            self.close()
+
+    def _load_property_sets(self, condition: str, parameters: list,
+                            objects: set[SOMcreator.Object] | None = None) -> None:
+        """creates the PropertySets and Attributes matching the condition. objects filters the rows if given"""
+        proj = self._project
+        filter_matrixes = self._filter_matrixes
+        parent_links: list[tuple[Hirarchy, str]] = list()
+        was_loading, self._loading = self._loading, True
+        try:
+            values: dict[str, list] = dict()
+            for attribute_uuid, value in self._connection.execute(VALUE_QUERY.format(condition), parameters):
+                values.setdefault(attribute_uuid, list()).append(json.loads(value))
+
+            property_sets: dict[str, SOMcreator.PropertySet] = dict()
+            with proj._muted():
+                with proj.bulk() as builder:
+                    for uuid, object_uuid, name, description, optional, filter_matrix, parent in \
+                            self._connection.execute(PROPERTY_SET_QUERY.format(condition), parameters):
+                        obj = None if object_uuid is None else self._objects[object_uuid]
+                        if objects is not None and obj not in objects:
+                            continue
+                        property_sets[uuid] = builder.create_property_set(
+                            name, obj, uuid=uuid, description=description, optional=bool(optional),
+                            filter_matrix=filter_matrixes[filter_matrix])
+                        if parent is not None:
+                            parent_links.append((property_sets[uuid], parent))
+
+                    for (uuid, property_set_uuid, name, description, optional, filter_matrix, parent, data_type,
+                         value_type, child_inherits_value, revit_mapping) in \
+                            self._connection.execute(ATTRIBUTE_QUERY.format(condition), parameters):
+                        property_set = property_sets.get(property_set_uuid)
+                        if property_set is None:
+                            continue
+                        attribute = builder.create_attribute(property_set, name, values.get(uuid, list()),
+                                                             uuid=uuid, description=description,
+                                                             optional=bool(optional), value_type=value_type,
+                                                             data_type=data_type,
+                                                             child_inherits_values=bool(child_inherits_value),
+                                                             revit_mapping=revit_mapping,
+                                                             filter_matrix=filter_matrixes[filter_matrix])
+                        if parent is not None:
+                            parent_links.append((attribute, parent))
+        finally:
+            self._loading = was_loading
+        self._link_parents(parent_links)
+
+    def _link_parents(self, parent_links: list[tuple[Hirarchy, str]]) -> None:
+        """
+        gets called after loading finished, so parents in Objects that aren't loaded yet get loaded by their uuid.
+        PropertySets are linked before their Attributes
+        """
+        proj = self._project
+        with proj._muted():
+            for entity, parent_uuid in parent_links:
+                parent = proj.get_element_by_uuid(parent_uuid)
+                if parent is not None and entity.parent is not parent:
+                    parent.add_child(entity)
+
+    def load_objects(self, objects: Iterable[SOMcreator.Object]) -> None:
+        """creates the PropertySets and Attributes of the given Objects if they aren't loaded yet"""
+        objects = [obj for obj in objects if obj in self._pending_objects]
+        if not objects:
+            return
+        ident_attributes = {obj: self._pending_objects.pop(obj) for obj in objects}
+        if not self._pending_objects:
+            self._load_property_sets("p.object IS NOT NULL", [], set(objects))
+        else:
+            for index in range(0, len(objects), CHUNK_SIZE):
+                chunk = objects[index:index + CHUNK_SIZE]
+                condition = f"p.object IN ({', '.join('?' * len(chunk))})"
+                self._load_property_sets(condition, [obj.uuid for obj in chunk])
+
+        proj = self._project
+        with proj._muted():
+            for obj, ident_attribute in ident_attributes.items():
+                if ident_attribute is not None:
+                    ident_attrib = proj.get_element_by_uuid(ident_attribute)
+                    obj.ident_attrib = ident_attrib if isinstance(ident_attrib, SOMcreator.Attribute) else None
+        if not self._pending_objects:
+            self.close()
+
+    def load_object(self, obj: SOMcreator.Object) -> None:
+        if obj in self._pending_objects:
+            self.load_objects([obj])
+
+    def load_children(self, entity: Hirarchy) -> None:
+        """loads the Objects that contain children of the entity"""
+        if self._loading or not isinstance(entity, (SOMcreator.PropertySet, SOMcreator.Attribute)):
+            return
+        if entity.uuid in self._loaded_children:
+            return
+        self._loaded_children.add(entity.uuid)
+        rows = self._connection.execute(CHILD_OWNER_QUERY, (entity.uuid, entity.uuid)).fetchall()
+        self.load_objects(self._objects[object_uuid] for (object_uuid,) in rows)
+
+    def load_uuid(self, uuid: str) -> None:
+        """loads the Object that contains the PropertySet or Attribute with the given uuid"""
+        if self._loading:
+            return
+        rows = self._connection.execute(OWNER_QUERY, (uuid, uuid)).fetchall()
+        self.load_objects(self._objects[object_uuid] for (object_uuid,) in rows if object_uuid is not None)
+
+    def load_all(self) -> None:
+        self.load_objects(list(self._pending_objects))
+
+    def close(self) -> None:
+        """everything is loaded, the Project doesn't need the database anymore"""
+        if self._project._lazy_store is self:
+            self._project._lazy_store = None
+        self._connection.close()
+        logging.debug(f"Lazy loading finished")
@@ -53,7 +53,7 @@ def create_structure_dict(ifc_file: ifcopenshell.file, project: SOMcreator.Proje
                           attribute_bundle: tuple[str, str, str, str, str, str]) -> dict:
     """Iterate over all Entities, build the targeted Datastructure"""
     targeted_group_structure = {GROUP: {}, ELEMENT: {}, IFC_REP: None}
-    bk_dict = {obj.ident_value: obj for obj in project.get_objects(filter=True)}
+    bk_dict = {ident: obj for ident, obj in project.get_ident_dict().items() if obj.is_active()}
 
     for index, el in enumerate(list(ifc_file.by_type("IfcElement"))):
         attrib, gruppe, identity = get_ifc_el_info(el, attribute_bundle)
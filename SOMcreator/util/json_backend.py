@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+import logging
+import re
+from typing import Any
+
+try:
+    import orjson
+except ModuleNotFoundError:
+    orjson = None
+
+try:
+    import ujson
+except ModuleNotFoundError:
+    ujson = None
+
+ORJSON = "orjson"
+UJSON = "ujson"
+STDLIB = "json"
+
+_NON_ASCII = re.compile(r"[^\x00-\x7f]")
+
+
+def get_available_backends() -> list[str]:
+    backends = [ORJSON] if orjson is not None else []
+    if ujson is not None:
+        backends.append(UJSON)
+    backends.append(STDLIB)
+    return backends
+
+
+# orjson and ujson are faster but write compact separators and reject NaN, they have to be chosen with set_backend
+backend = STDLIB
+
+
+def set_backend(name: str) -> None:
+    global backend
+    if name not in get_available_backends():
+        raise ValueError(f"JSON backend '{name}' is not installed. Available: {get_available_backends()}")
+    backend = name
+    logging.debug(f"JSON backend: {name}")
+
+
+def _escape_non_ascii(match: re.Match) -> str:
+    code = ord(match.group())
+    if code < 0x10000:
+        return f"\\u{code:04x}"
+    code -= 0x10000
+    return f"\\u{0xd800 | (code >> 10):04x}\\u{0xdc00 | (code & 0x3ff):04x}"
+
+
+def dumps(data: Any) -> bytes:
+    """
+    encodes data as ASCII JSON like json.dump does with its defaults,
+    so files stay readable independent of the encoding the reader assumes
+    """
+    if backend == ORJSON:
+        text = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+        if text.isascii():
+            return text
+        # non ASCII characters can only occur inside of strings
+        return _NON_ASCII.sub(_escape_non_ascii, text.decode("utf-8")).encode("ascii")
+    if backend == UJSON:
+        return ujson.dumps(data, ensure_ascii=True, escape_forward_slashes=False).encode("ascii")
+    return json.dumps(data).encode("ascii")
+
+
+def get_separators() -> tuple[bytes, bytes]:
+    """item and key separator that dumps uses, needed to write a document in parts"""
+    if backend == STDLIB:
+        return b", ", b": "
+    return b",", b":"
+
+
+def loads(data: bytes | str) -> Any:
+    if backend == ORJSON:
+        return orjson.loads(data)
+    if backend == UJSON:
+        return ujson.loads(data)
+    return json.loads(data)
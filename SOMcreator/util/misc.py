@@ -1,5 +1,17 @@
 from __future__ import annotations
 
+import gc
+import os
+import threading
+
+_gc_lock = threading.Lock()
+_gc_pause_count = 0
+_gc_was_enabled = False
+
+# the umask can only be read by setting it, this is done once on import instead of while other threads create files
+_umask = os.umask(0)
+os.umask(_umask)
+
 
 def merge_list(range_list, start_index=0):
     for i in range(start_index, len(range_list) - 1):
@@ -16,3 +28,33 @@ def check_size_eq(lst: list[list[bool]], master_list: list[list[bool]]):
     phase_len = len(lst)
     usecase_len = len(lst[0])
     return phase_len == len(master_list) and usecase_len == len(master_list[0])
+
+
+def pause_gc() -> None:
+    """
+    disables the garbage collector until resume_gc gets called.
+    Pauses are counted, so parallel or nested callers don't enable the collector while another one still needs the
+    pause. The collector is only enabled again if it was enabled before the first pause
+    """
+    global _gc_pause_count, _gc_was_enabled
+    with _gc_lock:
+        if _gc_pause_count == 0:
+            _gc_was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_pause_count += 1
+
+
+def resume_gc() -> None:
+    """ends a pause started by pause_gc"""
+    global _gc_pause_count
+    with _gc_lock:
+        _gc_pause_count -= 1
+        if _gc_pause_count == 0 and _gc_was_enabled:
+            gc.enable()
+
+
+def get_file_mode(path: str | os.PathLike) -> int:
+    """permissions for a file written to path: the permissions of the existing file or the default of new files"""
+    if os.path.exists(path):
+        return os.stat(path).st_mode & 0o777
+    return 0o666 & ~_umask
@@ -1,7 +1,6 @@
-import copy
-
 import SOMcreator
 from SOMcreator import Project, UseCase, Phase
+from SOMcreator.datastructure import events
 
 
 def merge_projects(existing_project: Project, import_project: Project, phase_mapping: dict[Phase, Phase],
@@ -18,20 +17,22 @@ def merge_projects(existing_project: Project, import_project: Project, phase_map
     import_predef_pset_dict = {p: p for p in import_project.get_predefined_psets(filter=False)}
     existing_predefined_pset_name_dict = {p.name: p for p in existing_project.get_predefined_psets(filter=False)}
 
-    for import_predef_pset in import_predef_pset_dict.keys():
-        new_pset = existing_predefined_pset_name_dict.get(import_predef_pset.name)
-        if not new_pset:
-            _add_item(existing_project, import_project, import_predef_pset, phase_mapping, use_case_mapping)
-        else:
-            import_predef_pset_dict[import_predef_pset] = new_pset
+    with existing_project.batch():
+        for import_predef_pset in import_predef_pset_dict.keys():
+            new_pset = existing_predefined_pset_name_dict.get(import_predef_pset.name)
+            if not new_pset:
+                _add_item(existing_project, import_project, import_predef_pset, phase_mapping, use_case_mapping)
+            else:
+                import_predef_pset_dict[import_predef_pset] = new_pset
 
-    for obj in import_project.get_objects(filter=False):
-        if obj.ident_value not in existing_identifiers:
-            _import_object(existing_project, import_project, obj, import_predef_pset_dict, phase_mapping,
-                           use_case_mapping)
+        for obj in import_project.get_objects(filter=False):
+            if obj.ident_value not in existing_identifiers:
+                _import_object(existing_project, import_project, obj, import_predef_pset_dict, phase_mapping,
+                               use_case_mapping)
 
-    existing_project.plugin_dict = _merge_dicts(existing_project.plugin_dict, import_project.plugin_dict)
-    existing_project.import_dict = _merge_dicts(existing_project.import_dict, import_project.import_dict)
+        existing_project.plugin_dict = _merge_dicts(existing_project.plugin_dict, import_project.plugin_dict)
+        existing_project.import_dict = _merge_dicts(existing_project.import_dict, import_project.import_dict)
+        existing_project.notify(events.MODIFIED)
 
 
 def _calculate_new_filter_matrix(filter_matrix, existing_project: Project, import_project: Project, item,
@@ -66,9 +67,13 @@ def _add_item(existing_project: SOMcreator.Project, import_project: SOMcreator.P
     new_filter_matrix = existing_project.create_filter_matrix(True)
     _calculate_new_filter_matrix(new_filter_matrix, existing_project, import_project, item, phase_mapping,
                                  use_case_mapping)
+    # the filter slot belongs to the import project
+    import_project._release_filter_slot(item._filter_slot)
+    item._filter_slot = existing_project._use_filter_slot(new_filter_matrix)
     existing_project.add_item(item)
     item._project = existing_project
-    item._filter_matrix = copy.deepcopy(new_filter_matrix)
+    item._dirty = False  # dirty state of the import project, the item is new in the existing project
+    existing_project.notify(events.CREATED, item)
 
 
 def _import_object(existing_project: SOMcreator.Project, import_project: SOMcreator.Project, obj: SOMcreator.Object,
@@ -0,0 +1,205 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+import sys
+import tempfile
+import time
+from typing import Type, TYPE_CHECKING
+
+import SOMcreator
+from SOMcreator.datastructure.base import Hirarchy
+from SOMcreator.datastructure.som_json import JOURNAL_SUFFIX
+from SOMcreator.util.misc import pause_gc, resume_gc
+
+if TYPE_CHECKING:
+    from SOMcreator import Project
+
+# Imported Projects are pickled to the cache directory, keyed by the content of the SOM JSON file (and its journal),
+# the SOMcreator version and the Project class. The cache is disabled until set_cache_dir gets called.
+# Only use cache directories that aren't writable by others, unpickling can execute code.
+
+CACHE_VERSION = 3
+SUFFIX = ".somcache"
+HASH_CHUNK_SIZE = 1024 * 1024
+
+cache_dir: str | None = None
+max_size = 2 * 1024 ** 3  # bytes, the least recently used entries get removed first
+
+# Project attributes that belong to the running session
+_TRANSIENT_PROJECT_VALUES = {
+    "_listeners":            list,
+    "_batch_depth":          int,
+    "_mute_depth":           int,
+    "_pending_events":       dict,
+    "_snapshot_history":     lambda: None,
+    "_stale_snapshot_items": set,
+    "_lazy_store":           lambda: None,
+    "_pending_items":        lambda: None,
+    "_sorted_items":         dict,
+}
+
+_slot_names: dict[type, tuple[str, ...]] = dict()
+
+
+def set_cache_dir(path: str | os.PathLike | None, size: int | None = None) -> None:
+    """None disables the cache"""
+    global cache_dir, max_size
+    cache_dir = None if path is None else os.fspath(path)
+    if size is not None:
+        max_size = size
+    if cache_dir is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+
+
+def is_enabled() -> bool:
+    return cache_dir is not None
+
+
+def get_key(cls: Type[Project], path: str | os.PathLike) -> str:
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(f"{CACHE_VERSION};{SOMcreator.__version__};{sys.version_info[:2]};{cls.__module__}.{cls.__qualname__}"
+                  .encode())
+    for file_path in (os.fspath(path), f"{os.fspath(path)}{JOURNAL_SUFFIX}"):
+        if not os.path.exists(file_path):
+            continue
+        with open(file_path, "rb") as file:
+            while chunk := file.read(HASH_CHUNK_SIZE):
+                digest.update(chunk)
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+def _get_cache_path(key: str) -> str:
+    return os.path.join(cache_dir, f"{key}{SUFFIX}")
+
+
+def _get_slot_names(cls: type) -> tuple[str, ...]:
+    names = _slot_names.get(cls)
+    if names is None:
+        names = tuple(name for klass in cls.__mro__ for name in klass.__dict__.get("__slots__", ())
+                      if name not in ("__dict__", "__weakref__"))
+        _slot_names[cls] = names
+    return names
+
+
+def _get_entity_state(entity: Hirarchy) -> dict:
+    # caches are rebuilt on demand, attributes the GUI attached to __dict__ aren't stored
+    return {name: None if name.endswith("_cache") else getattr(entity, name, None) for name in
+            _get_slot_names(type(entity))}
+
+
+def _restore(element: Hirarchy | Project) -> Hirarchy | Project:
+    """the element was created before, pickle sets the state on the returned object"""
+    return element
+
+
+class _State(object):
+    __slots__ = ("element", "state")
+
+    def __init__(self, element: Hirarchy | Project, state: dict | None = None):
+        self.element = element
+        self.state = state
+
+
+class _CachePickler(pickle.Pickler):
+    """
+    The Project and its entities are pickled as empty objects first and get their state afterward.
+    Pickling them with their state would recurse along the references through the whole Project
+    """
+
+    def __init__(self, file, proj: Project):
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self._project = proj
+
+    def reducer_override(self, obj):
+        if isinstance(obj, Hirarchy) or obj is self._project:
+            return object.__new__, (type(obj),)
+        if type(obj) is _State:
+            state = obj.state if obj.state is not None else (None, _get_entity_state(obj.element))
+            return _restore, (obj.element,), state
+        return NotImplemented
+
+
+def store(proj: Project, key: str) -> None:
+    if proj._lazy_store is not None:
+        return
+    start_time = time.time()
+    project_state = dict(proj.__dict__)
+    project_state.update({name: factory() for name, factory in _TRANSIENT_PROJECT_VALUES.items()})
+    entities = list(proj._items)
+    cache_path = _get_cache_path(key)
+    # unique temporary file, the same file can be stored by parallel imports
+    file_descriptor, temp_path = tempfile.mkstemp(suffix=".tmp", dir=cache_dir)
+    try:
+        with os.fdopen(file_descriptor, "wb") as file:
+            _CachePickler(file, proj).dump(
+                (_State(proj, project_state), [_State(entity) for entity in entities]))
+        os.replace(temp_path, cache_path)
+    except (OSError, pickle.PicklingError, TypeError, AttributeError) as error:
+        # e.g. plugins stored values that can't be pickled
+        logging.warning(f"Project couldn't be cached: {error}")
+        _remove(temp_path)
+        return
+    logging.info(f"Project cached. Time: {time.time() - start_time}")
+    _evict()
+
+
+def load(cls: Type[Project], key: str) -> Project | None:
+    cache_path = _get_cache_path(key)
+    if not os.path.exists(cache_path):
+        return None
+    start_time = time.time()
+    pause_gc()  # the garbage collector would scan the growing graph repeatedly
+    try:
+        with open(cache_path, "rb") as file:
+            proj, _ = pickle.load(file)
+    except Exception as error:
+        logging.warning(f"Cached Project '{cache_path}' couldn't be loaded: {error}")
+        _remove(cache_path)
+        return None
+    finally:
+        resume_gc()
+    if type(proj) is not cls:
+        return None
+    try:
+        os.utime(cache_path)  # mark as recently used
+    except FileNotFoundError:  # evicted by a parallel call
+        pass
+    logging.info(f"Project loaded from cache. Time: {time.time() - start_time}")
+    return proj
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:  # removed by a parallel call
+        pass
+
+
+def _evict() -> None:
+    """removes the least recently used entries until the cache fits into max_size"""
+    entries = list()
+    for name in os.listdir(cache_dir):
+        if name.endswith(SUFFIX):
+            try:
+                stat = os.stat(os.path.join(cache_dir, name))
+            except FileNotFoundError:  # removed by a parallel call
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, name in sorted(entries):
+        if total_size <= max_size:
+            break
+        _remove(os.path.join(cache_dir, name))
+        total_size -= size
+
+
+def clear() -> None:
+    if cache_dir is None:
+        return
+    for name in os.listdir(cache_dir):
+        if name.endswith(SUFFIX):
+            _remove(os.path.join(cache_dir, name))
@@ -0,0 +1,31 @@
+"""
+Creates 500 Objects with 5 PropertySets of 40 Attributes each, once with the constructors and once with Project.bulk()
+
+    python benchmarks/compare.py benchmarks/bulk_builder.py <revision>
+"""
+import time
+
+import SOMcreator
+from common import build_project
+
+OBJECT_COUNT, PROPERTY_SET_COUNT, ATTRIBUTE_COUNT = 500, 5, 40
+
+start_time = time.perf_counter()
+build_project(OBJECT_COUNT, PROPERTY_SET_COUNT, ATTRIBUTE_COUNT)
+print(f"constructors: {time.perf_counter() - start_time:.2f} s")
+
+if hasattr(SOMcreator.Project, "bulk"):  # older revisions have no bulk builder
+    start_time = time.perf_counter()
+    proj = SOMcreator.Project("Bulk")
+    with proj.bulk() as builder:
+        for object_index in range(OBJECT_COUNT):
+            obj = builder.create_object(f"Object {object_index}")
+            for pset_index in range(PROPERTY_SET_COUNT):
+                pset = builder.create_property_set(f"Pset {pset_index}", obj)
+                attributes = builder.create_attributes(
+                    {"property_set": pset, "name": f"Attribute {index}", "value": [f"{object_index}.{index}"]}
+                    for index in range(ATTRIBUTE_COUNT))
+                if obj.is_concept:
+                    obj.ident_attrib = attributes[0]
+            SOMcreator.Aggregation(obj)
+    print(f"bulk builder: {time.perf_counter() - start_time:.2f} s")
@@ -0,0 +1,78 @@
+"""
+Helpers of the benchmark scripts. SOMcreator has to be importable (pip install -e .).
+Scripts that compare revisions only use API that the older revision has as well
+"""
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable
+
+import SOMcreator
+
+DATA_DIR = os.path.join(tempfile.gettempdir(), "som_benchmarks")
+
+
+def build_project(object_count: int = 400, property_set_count: int = 5,
+                  attribute_count: int = 20) -> SOMcreator.Project:
+    """every Object gets an Aggregation and is identified by the first Attribute of its first PropertySet"""
+    proj = SOMcreator.Project("Benchmark")
+    for object_index in range(object_count):
+        obj = SOMcreator.Object(f"Object {object_index}", None, project=proj)
+        for pset_index in range(property_set_count):
+            pset = SOMcreator.PropertySet(f"Pset {pset_index}", obj, project=proj)
+            for attribute_index in range(attribute_count):
+                attribute = SOMcreator.Attribute(pset, f"Attribute {attribute_index}",
+                                                 [f"{object_index}.{attribute_index}"], project=proj)
+                if obj.is_concept:
+                    obj.ident_attrib = attribute
+        SOMcreator.Aggregation(obj)
+    return proj
+
+
+def get_data_path(name: str) -> str:
+    os.makedirs(DATA_DIR, exist_ok=True)
+    return os.path.join(DATA_DIR, name)
+
+
+def get_som_file(path: str | None = None, object_count: int = 400, property_set_count: int = 6,
+                 attribute_count: int = 50) -> str:
+    """returns path, a SOM JSON file with the given size is created if it doesn't exist"""
+    if path is None:
+        path = get_data_path(f"som_{object_count}_{property_set_count}_{attribute_count}.SOMjson")
+    if not os.path.exists(path):
+        print(f"create {path}")
+        build_project(object_count, property_set_count, attribute_count).save(path)
+    return path
+
+
+def timeit(label: str, func: Callable, repeat: int = 20) -> float:
+    """prints and returns the mean duration in seconds"""
+    start_time = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    duration = (time.perf_counter() - start_time) / repeat
+    print(f"{label}: {duration * 1000:.2f} ms")
+    return duration
+
+
+def get_peak_rss() -> float:
+    """peak resident set size of the running process in MB. Unix only"""
+    try:
+        # ru_maxrss on Linux keeps the peak of the parent process across exec, VmHWM doesn't
+        with open("/proc/self/status") as file:
+            for line in file:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    import resource
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_isolated(script: str, *args: str) -> None:
+    """runs script in a new interpreter, so the peak memory of every run is measured separately"""
+    subprocess.run([sys.executable, script, *args], check=True)
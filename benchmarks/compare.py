@@ -0,0 +1,32 @@
+"""
+Runs a benchmark script against an older revision and against the working tree
+
+    python benchmarks/compare.py benchmarks/item_sets.py HEAD~1 [arguments of the script]
+
+The revision is checked out into a temporary git worktree. Both runs execute the script of the working tree,
+only SOMcreator gets imported from the revision.
+"""
+import os
+import subprocess
+import sys
+import tempfile
+
+REPOSITORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run(label: str, source_dir: str, script: str, args: list[str]) -> None:
+    print(f"--- {label}", flush=True)
+    subprocess.run([sys.executable, script, *args], check=True, env=dict(os.environ, PYTHONPATH=source_dir))
+
+
+if len(sys.argv) < 3:
+    sys.exit(__doc__)
+script, revision, script_args = os.path.abspath(sys.argv[1]), sys.argv[2], sys.argv[3:]
+with tempfile.TemporaryDirectory() as directory:
+    worktree = os.path.join(directory, "revision")
+    subprocess.run(["git", "-C", REPOSITORY, "worktree", "add", "--quiet", "--detach", worktree, revision], check=True)
+    try:
+        run(revision, worktree, script, script_args)
+    finally:
+        subprocess.run(["git", "-C", REPOSITORY, "worktree", "remove", "--force", worktree], check=True)
+run("working tree", REPOSITORY, script, script_args)
@@ -0,0 +1,52 @@
+"""
+Opens a SOM JSON file in which half of the Attributes reference a parent that doesn't exist (about 6000 of 12000)
+
+    python benchmarks/compare.py benchmarks/dangling_parents.py <revision>
+"""
+import json
+import os
+import random
+import time
+
+import SOMcreator
+from common import get_data_path
+
+
+def create_file(path: str) -> None:
+    """Objects with children of a predefined PropertySet, the parent uuids of random Attributes get replaced"""
+    proj = SOMcreator.Project("Dangling Parents")
+    predefined_pset = SOMcreator.PropertySet("Predefined", None, project=proj)
+    for index in range(100):
+        SOMcreator.Attribute(predefined_pset, f"Attribute {index}", [f"{index}"], project=proj)
+    for index in range(60):
+        obj = SOMcreator.Object(f"Object {index}", None, project=proj)
+        for _ in range(2):
+            obj.add_property_set(predefined_pset.create_child("Predefined"))
+        obj.ident_attrib = next(iter(obj.get_attributes(filter=False)))
+    proj.save(path)
+
+    with open(path) as file:
+        main_dict = json.load(file)
+    random.seed(1)
+    dangling_count = 0
+    for object_dict in main_dict["Objects"].values():
+        for pset_dict in object_dict["PropertySets"].values():
+            for attribute_dict in pset_dict["Attributes"].values():
+                if random.random() < 0.5:
+                    attribute_dict["parent"] = f"missing-{dangling_count}"
+                    dangling_count += 1
+    with open(path, "w") as file:
+        json.dump(main_dict, file)
+    print(f"created {path} with {dangling_count} dangling parents")
+
+
+path = get_data_path("dangling_parents.SOMjson")
+if not os.path.exists(path):
+    create_file(path)
+
+start_time = time.perf_counter()
+proj = SOMcreator.Project.open(path)
+duration = time.perf_counter() - start_time
+attributes = list(proj.get_attributes(filter=False))
+with_parent = sum(1 for attribute in attributes if attribute.parent is not None)
+print(f"open: {duration:.2f} s, attributes: {len(attributes)}, with parent: {with_parent}")
@@ -0,0 +1,31 @@
+"""
+Memory retained by the entities of a SOM JSON file opened with Project.open (traced by tracemalloc)
+
+    python benchmarks/compare.py benchmarks/entity_memory.py <revision> [path]
+
+Without path a synthetic file with about 123k entities is used.
+"""
+import gc
+import sys
+import time
+import tracemalloc
+
+import SOMcreator
+from common import get_som_file
+
+path = get_som_file(sys.argv[1] if len(sys.argv) > 1 else None)
+gc.collect()
+tracemalloc.start()
+start_time = time.perf_counter()
+proj = SOMcreator.Project.open(path)
+duration = time.perf_counter() - start_time
+# the sections that aren't entities are kept for plugins, they don't count
+proj.import_dict = None
+proj.plugin_dict = None
+gc.collect()
+retained = tracemalloc.get_traced_memory()[0]
+tracemalloc.stop()
+
+entity_count = sum(1 for _ in proj.get_hirarchy_items(filter=False))
+print(f"entities: {entity_count}, open: {duration:.2f} s")
+print(f"retained: {retained / 1024 ** 2:.1f} MB, {retained / entity_count:.0f} B per entity")
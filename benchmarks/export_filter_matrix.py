@@ -0,0 +1,30 @@
+"""
+Export of a project whose 42.8k entities use many distinct filter matrices
+
+    python benchmarks/compare.py benchmarks/export_filter_matrix.py <revision>
+"""
+import random
+import time
+
+import SOMcreator
+import SOMcreator.exporter.som_json as som_json
+from common import build_project
+
+proj = build_project()
+for index in range(4):
+    proj.add_phase(SOMcreator.Phase(f"Phase {index}", "", ""))
+    proj.add_usecase(SOMcreator.UseCase(f"UseCase {index}", "", ""))
+random.seed(0)
+phases, usecases = proj.get_phases(), proj.get_usecases()
+items = list(proj.get_hirarchy_items(filter=False))
+for item in items:
+    if random.random() < 0.5:
+        item.set_filter_state(random.choice(phases), random.choice(usecases), False)
+print(f"entities: {len(items)}, distinct filter matrices: {len({item.get_filter_matrix() for item in items})}")
+
+durations = list()
+for _ in range(5):
+    start_time = time.perf_counter()
+    som_json.create_export_dict(proj)
+    durations.append(time.perf_counter() - start_time)
+print(f"create_export_dict (best of 5): {min(durations) * 1000:.0f} ms")
@@ -0,0 +1,38 @@
+"""
+Construction time and memory of 100k Attributes with a 4x5 filter matrix, and the cost of reading their matrices
+
+    python benchmarks/compare.py benchmarks/filter_matrix.py <revision>
+"""
+import time
+import tracemalloc
+
+import SOMcreator
+from common import timeit
+
+ATTRIBUTE_COUNT = 100000
+
+
+def create_project() -> SOMcreator.Project:
+    proj = SOMcreator.Project("Filter Matrix")
+    for index in range(3):
+        proj.add_phase(SOMcreator.Phase(f"Phase {index}", "", ""))
+    for index in range(4):
+        proj.add_usecase(SOMcreator.UseCase(f"UseCase {index}", "", ""))
+    matrix = proj.create_filter_matrix(True)
+    for _ in range(ATTRIBUTE_COUNT):
+        SOMcreator.Attribute(None, "Attribute", ["Value"], project=proj, filter_matrix=matrix)
+    return proj
+
+
+# tracemalloc slows the construction down, time and memory are measured separately
+start_time = time.perf_counter()
+proj = create_project()
+print(f"construction: {time.perf_counter() - start_time:.2f} s")
+
+tracemalloc.start()
+create_project()
+print(f"memory: {tracemalloc.get_traced_memory()[0] / ATTRIBUTE_COUNT:.0f} B per attribute")
+tracemalloc.stop()
+
+attributes = list(proj.get_attributes(filter=False))
+timeit(f"get_filter_matrix x{len(attributes)}", lambda: [a.get_filter_matrix() for a in attributes], repeat=1)
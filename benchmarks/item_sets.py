@@ -0,0 +1,13 @@
+"""
+Project getters on a synthetic project (400 Objects, 2000 PropertySets, 40000 Attributes, 400 Aggregations)
+
+    python benchmarks/compare.py benchmarks/item_sets.py <revision>
+"""
+from common import build_project, timeit
+
+proj = build_project()
+timeit("get_objects", lambda: list(proj.get_objects(filter=False)))
+timeit("get_root_objects", lambda: list(proj.get_root_objects(filter=False)))
+timeit("get_predefined_psets", lambda: list(proj.get_predefined_psets(filter=False)))
+timeit("get_aggregations", lambda: list(proj.get_aggregations(filter=False)))
+timeit("get_attributes", lambda: list(proj.get_attributes(filter=False)))
@@ -0,0 +1,32 @@
+"""
+Open and save of a SOM JSON file with every installed JSON backend
+
+    python benchmarks/compare.py benchmarks/json_backend.py <revision> [path]
+
+Without path a synthetic 31 MB file is used.
+"""
+import sys
+import time
+
+import SOMcreator
+from common import get_data_path, get_som_file
+
+try:
+    from SOMcreator.util import json_backend
+    backends = json_backend.get_available_backends()
+except ImportError:  # older revisions only use the json module
+    json_backend, backends = None, ["json"]
+
+path = get_som_file(sys.argv[1] if len(sys.argv) > 1 else None)
+export_path = get_data_path("json_backend_export.SOMjson")
+for backend in backends:
+    if json_backend is not None:
+        json_backend.set_backend(backend)
+    start_time = time.perf_counter()
+    proj = SOMcreator.Project.open(path)
+    open_time = time.perf_counter() - start_time
+
+    start_time = time.perf_counter()
+    proj.save(export_path)
+    save_time = time.perf_counter() - start_time
+    print(f"{backend:8s} open {open_time * 1000:6.0f} ms  save {save_time * 1000:6.0f} ms")
@@ -0,0 +1,39 @@
+"""
+Opens a project from SOM JSON, from SQLite eagerly and from SQLite lazily, each in its own process to measure its
+peak memory
+
+    python benchmarks/sqlite_store.py [path]
+
+path is a SOM JSON file, the SQLite database is written next to it.
+Without path a synthetic file with 2800 Objects (about 862k entities, 224 MB) is used.
+"""
+import os
+import sys
+import time
+
+import SOMcreator
+from SOMcreator.importer import som_sqlite
+from common import get_peak_rss, get_som_file, run_isolated
+
+if len(sys.argv) < 3:
+    path = get_som_file(sys.argv[1] if len(sys.argv) > 1 else None, object_count=2800)
+    database_path = f"{os.path.splitext(path)[0]}.somdb"
+    if not os.path.exists(database_path):
+        print(f"create {database_path}")
+        SOMcreator.Project.open(path, stream=True).save(database_path)
+    run_isolated(__file__, path, "json")
+    for mode in ("eager", "lazy"):
+        run_isolated(__file__, database_path, mode)
+else:
+    path, mode = sys.argv[1:3]
+    start_time = time.perf_counter()
+    if mode == "json":
+        proj = SOMcreator.Project.open(path)
+    else:
+        proj = som_sqlite.open_sqlite(SOMcreator.Project, path, lazy=mode == "lazy")
+    print(f"{mode:5s} open: {time.perf_counter() - start_time:.2f} s, peak RSS: {get_peak_rss():.0f} MB")
+    if mode == "lazy":
+        obj = next(iter(proj.get_objects(filter=False)))
+        start_time = time.perf_counter()
+        list(obj.get_property_sets(filter=False))
+        print(f"first Object access: {(time.perf_counter() - start_time) * 1000:.0f} ms")
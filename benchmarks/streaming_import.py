@@ -0,0 +1,24 @@
+"""
+Opens a SOM JSON file as a whole and with stream=True, each in its own process to measure its peak memory
+
+    python benchmarks/streaming_import.py [path]
+
+Without path a synthetic file with 2800 Objects (about 862k entities, 224 MB) is used.
+"""
+import sys
+import time
+
+import SOMcreator
+from common import get_peak_rss, get_som_file, run_isolated
+
+if len(sys.argv) < 3:
+    path = get_som_file(sys.argv[1] if len(sys.argv) > 1 else None, object_count=2800)
+    for mode in ("load", "stream"):
+        run_isolated(__file__, path, mode)
+else:
+    path, mode = sys.argv[1:3]
+    start_time = time.perf_counter()
+    proj = SOMcreator.Project.open(path, stream=mode == "stream")
+    duration = time.perf_counter() - start_time
+    entity_count = sum(1 for _ in proj.get_hirarchy_items(filter=False))
+    print(f"{mode:6s} entities: {entity_count}, open: {duration:.2f} s, peak RSS: {get_peak_rss():.0f} MB")
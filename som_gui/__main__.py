@@ -27,6 +27,7 @@ def main(initial_file: PathLike | None = None, log_level=None, open_last_project
         tool.Logging.set_log_level(log_level)
 
     som_gui.register()
+    core.project.init_project_cache(tool.Appdata)
 
     #Create UI
     app = QApplication(sys.argv)
@@ -253,11 +253,11 @@ def update_identifier_combobox(attribute_import_results: Type[tool.AttributeImpo
         return
     combobox = attribute_import_results.get_somtype_combo_box()
     ifc_type = attribute_import_results.get_ifctype_combo_box().currentText()
-    object_list = list(project.get().get_objects(filter=False))
+    object_dict = project.get().get_ident_dict()
 
     wanted_som_types = set(
         attribute_import_sql.get_identifier_types(ifc_type, attribute_import_results.get_all_keyword()))
-    attribute_import_results.update_som_combobox(combobox, wanted_som_types, object_list)
+    attribute_import_results.update_som_combobox(combobox, wanted_som_types, object_dict)
 
 
 def update_object_count(attribute_import_results: Type[tool.AttributeImportResults],
@@ -402,12 +402,12 @@ def import_values_to_som(attribute_import_results: Type[tool.AttributeImportResu
         if attribute.value_type in [value_constants.FORMAT, value_constants.RANGE]:
             continue
         if value not in attribute.value:
-            attribute.value.append(value)
+            attribute.value = attribute.value + [value]
 
     removed_values = attribute_import_sql.get_removed_attribute_values()
     for identifier, property_set_name, attribute_name, value in removed_values:
         attribute = attribute_dict[identifier][property_set_name][attribute_name]
-        attribute.value.remove(value)
+        attribute.value = [v for v in attribute.value if v != value]
     window = attribute_import_results.get_results_window()
     window.close()
     attribute_import_results.remove_results_window()
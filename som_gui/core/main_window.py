@@ -52,12 +52,14 @@ def create_main_window(application: QApplication, main_window: Type[tool.MainWin
     main_window.hide_console()
 
 
-def close_event(event: QCloseEvent, main_window: Type[tool.MainWindow], popups_tool: Type[tool.Popups]):
+def close_event(event: QCloseEvent, main_window: Type[tool.MainWindow], popups_tool: Type[tool.Popups],
+                project_tool: Type[tool.Project]):
     """
-    Overwrites Close Event of MainWindow. Asks Save before exiting the main window
+    Overwrites Close Event of MainWindow. Asks Save before exiting the main window and waits for running saves
     :param event:
     :param main_window:
     :param popups_tool:
+    :param project_tool:
     :return:
     """
     reply = popups_tool.request_save_before_exit()
@@ -69,6 +71,10 @@ def close_event(event: QCloseEvent, main_window: Type[tool.MainWindow], popups_t
         #Save before Closing
         from som_gui.module.project import trigger
         trigger.save()
+    # saves run in the background, keep the window open if one failed so the user can retry
+    if not project_tool.finish_saves():
+        event.ignore()
+        return
     #Close Windows
     main_window.get_app().closeAllWindows()
     event.accept()
@@ -28,7 +28,7 @@ def check_file(runner:ModelcheckRunner, modelcheck: Type[tool.Modelcheck],
     modelcheck.connect_to_data_base(modelcheck.get_database_path())
     modelcheck.remove_existing_issues(datetime.today())
 
-    modelcheck.build_data_dict(modelcheck_window.get_item_checkstate_dict())
+    modelcheck.build_data_dict(modelcheck_window.get_item_checkstate_dict(), modelcheck.get_snapshot())
 
     modelcheck.set_object_checked_count(0)
     modelcheck.set_object_count(modelcheck.get_element_count())
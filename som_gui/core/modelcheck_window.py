@@ -110,6 +110,7 @@ def run_modelcheck(modelcheck_window: Type[tool.ModelcheckWindow],
     pool.setMaxThreadCount(3)
     modelcheck.init_sql_database(util.create_tempfile(".db"))
     modelcheck.reset_guids()
+    modelcheck.create_snapshot(project.get())
     modelcheck.build_ident_dict(set(project.get().get_objects(filter=True)))
 
 
@@ -8,10 +8,12 @@ from typing import Type
 from PySide6.QtCore import QCoreApplication
 
 import som_gui
-from som_gui.module.project.constants import FILETYPE, OPEN_PATH, SAVE_PATH
+from SOMcreator.util import project_cache
+from som_gui.module.project.constants import CACHE_ENABLED, CACHE_SECTION, CACHE_SIZE, FILETYPE, OPEN_PATH, SAVE_PATH
 
 if TYPE_CHECKING:
     from som_gui.tool import Project, Popups, Appdata
+    from som_gui.tool.project import SaveRunner
     from som_gui import tool
     from som_gui.module.project import ui
 
@@ -66,7 +68,7 @@ def save(project_tool: Type[Project], popup_tool: Type[Popups], appdata: Type[Ap
     if not os.path.exists(save_path) or not save_path.endswith("json"):
         save_as(project_tool, popup_tool, appdata, main_window)
     else:
-        save_project(save_path, project_tool, appdata)
+        save_project(save_path, project_tool, appdata, main_window)
 
 
 def save_as(project_tool: Type[Project], popup_tool: Type[Popups], appdata: Type[Appdata],
@@ -75,7 +77,7 @@ def save_as(project_tool: Type[Project], popup_tool: Type[Popups], appdata: Type
     title = QCoreApplication.translate("Project", "Save Project")
     path = popup_tool.get_save_path(FILETYPE, main_window.get(), path, title)
     if path:
-        save_project(path, project_tool, appdata)
+        save_project(path, project_tool, appdata, main_window)
 
 
 def open_file_clicked(project_tool: Type[Project], appdata: Type[Appdata], main_window: Type[tool.MainWindow],
@@ -103,14 +105,65 @@ def new_file_clicked(project_tool: Type[Project], popup_tool: Type[Popups]):
         project_tool.get().name = name
 
 
-def save_project(path: str, project_tool: Type[Project], appdata: Type[Appdata]):
-    for plugin_function in project_tool.get_plugin_functions():
-        plugin_function()
-    project = project_tool.get()
-    project.save(path)
+def save_project(path: str, project_tool: Type[Project], appdata: Type[Appdata], main_window: Type[tool.MainWindow]):
+    """
+    saves in the background. Saves requested while a save is running are combined into one save,
+    which starts with the latest state once the running save finished
+    """
     appdata.set_path(OPEN_PATH, path)
     appdata.set_path(SAVE_PATH, path)
-    logging.info(f"Save Done!")
+    if project_tool.is_save_running():
+        project_tool.set_pending_save_path(path)
+        return
+    start_save(path, project_tool, main_window)
+
+
+def start_save(path: str, project_tool: Type[Project], main_window: Type[tool.MainWindow]):
+    for plugin_function in project_tool.get_plugin_functions():
+        plugin_function()
+    runner = project_tool.create_save_runner(path)
+    project_tool.connect_save_runner(runner)
+    project_tool.set_save_progress(main_window.get_statusbar(), project_tool.get_save_text(runner), 0)
+    project_tool.get_save_threadpool().start(runner)
+
+
+def save_progress(runner: SaveRunner, value: int, project_tool: Type[Project], main_window: Type[tool.MainWindow]):
+    if runner is project_tool.get_save_runner():
+        project_tool.set_save_progress(main_window.get_statusbar(), project_tool.get_save_text(runner), value)
+
+
+def save_finished(runner: SaveRunner, project_tool: Type[Project], popup_tool: Type[Popups],
+                  main_window: Type[tool.MainWindow]):
+    if runner is not project_tool.get_save_runner():
+        return  # already handled by finish_saves
+    project_tool.remove_save_runner()
+    project_tool.hide_save_progress(main_window.get_statusbar())
+    if runner.error is not None:
+        text = QCoreApplication.translate("Project", "Saving '{}' failed: {}").format(runner.path, runner.error)
+        popup_tool.create_warning_popup(text)
+    else:
+        # changes made while saving keep the Project dirty
+        runner.project.mark_saved(runner.snapshot)
+        logging.info(f"Save Done!")
+
+    path = project_tool.get_pending_save_path()
+    if path is not None:
+        project_tool.set_pending_save_path(None)
+        start_save(path, project_tool, main_window)
+
+
+def finish_saves(project_tool: Type[Project], popup_tool: Type[Popups], main_window: Type[tool.MainWindow]) -> bool:
+    """
+    waits for the running and the pending save. Gets called before the application closes
+    :return: False if a save failed
+    """
+    succeeded = True
+    while project_tool.is_save_running():
+        project_tool.get_save_threadpool().waitForDone()
+        runner = project_tool.get_save_runner()
+        succeeded = succeeded and runner.error is None
+        save_finished(runner, project_tool, popup_tool, main_window)
+    return succeeded
 
 
 def create_project(project_tool: Type[Project]):
@@ -118,6 +171,15 @@ def create_project(project_tool: Type[Project]):
     project_tool.create_project()
 
 
+def init_project_cache(appdata: Type[Appdata]):
+    """reopened SOM JSON files are restored from the cache instead of being imported again"""
+    if not appdata.get_bool_setting(CACHE_SECTION, CACHE_ENABLED, True):
+        project_cache.set_cache_dir(None)
+        return
+    size = appdata.get_int_setting(CACHE_SECTION, CACHE_SIZE, project_cache.max_size // 1024 ** 2)
+    project_cache.set_cache_dir(os.path.join(appdata.get_cache_dir(), "projects"), size * 1024 ** 2)
+
+
 def open_project(path, project_tool: Type[Project]):
     proj = project_tool.load_project(path)
     project_tool.set_active_project(proj)
@@ -6,6 +6,8 @@ class Appdata:
 
     def get_bool_setting(self, section, path, default): pass
 
+    def get_cache_dir(self, ): pass
+
     def get_float_setting(self, section, path, default): pass
 
     def get_int_setting(self, section, path, default): pass
@@ -290,7 +292,7 @@ class AttributeImportResults:
 
     def update_results_window(self, ): pass
 
-    def update_som_combobox(self, combobox, allowed_values, object_list): pass
+    def update_som_combobox(self, combobox, allowed_values, object_dict): pass
 
     def update_table_widget(self, allowed_values, table_widget, datatypes): pass
 
@@ -896,7 +898,7 @@ class Modelcheck:
 
     def attribute_issue(self, guid, pset_name, attribute_name, element_type): pass
 
-    def build_data_dict(self, check_state_dict): pass
+    def build_data_dict(self, check_state_dict, project): pass
 
     def build_ident_dict(self, objects): pass
 
@@ -918,6 +920,8 @@ class Modelcheck:
 
     def create_modelcheck_runner(self, runner): pass
 
+    def create_snapshot(self, project): pass
+
     def create_tables(self, ): pass
 
     def datatype_issue(self, guid, attribute, element_type, datatype, value): pass
@@ -972,6 +976,8 @@ class Modelcheck:
 
     def get_properties(self, ): pass
 
+    def get_snapshot(self, ): pass
+
     def guid_issue(self, guid, file1, file2): pass
 
     def ident_issue(self, guid, pset_name, attribute_name): pass
@@ -1456,14 +1462,20 @@ class PredefinedPropertySetCompare:
 class Project:
     def add_plugin_save_function(self, func): pass
 
+    def connect_save_runner(self, runner): pass
+
     def create_combobox(self, filter_1): pass
 
     def create_mapping_window(self, title, filter_1, filter_2): pass
 
     def create_project(self, ): pass
 
+    def create_save_runner(self, path): pass
+
     def fill_mapping_table(self, table, filter_1, filter_2): pass
 
+    def finish_saves(self, ): pass
+
     def get(self, ): pass
 
     def get_action(self, name): pass
@@ -1480,8 +1492,18 @@ class Project:
 
     def get_properties(self, ): pass
 
+    def get_pending_save_path(self, ): pass
+
     def get_root_objects(self, filter_objects, proj): pass
 
+    def get_save_progress_bar(self, statusbar): pass
+
+    def get_save_runner(self, ): pass
+
+    def get_save_text(self, runner): pass
+
+    def get_save_threadpool(self, ): pass
+
     def get_settings_general_widget(self, ): pass
 
     def get_settings_path_widget(self, ): pass
@@ -1490,14 +1512,24 @@ class Project:
 
     def get_use_cases(self, ): pass
 
+    def hide_save_progress(self, statusbar): pass
+
+    def is_save_running(self, ): pass
+
     def load_project(self, path): pass
 
     def merge_projects(self, title, project_1, project_2): pass
 
+    def remove_save_runner(self, ): pass
+
     def set_action(self, name, action): pass
 
     def set_active_project(self, proj): pass
 
+    def set_pending_save_path(self, path): pass
+
+    def set_save_progress(self, statusbar, text, value): pass
+
     def set_settings_general_widget(self, widget): pass
 
     def set_settings_path_widget(self, widget): pass
@@ -40,7 +40,8 @@ class ProjectView(QTableView):
 
     def enterEvent(self, event):
         super().enterEvent(event)
-        self.model().update()
+        if self.model().outdated:
+            self.model().update()
 
     def model(self) -> ProjectModel:
         return super().model()
@@ -135,7 +136,8 @@ class ObjectTreeView(FilterTreeView):
 
     def enterEvent(self, event):
         super().enterEvent(event)
-        trigger.update_object_tree()
+        if self.model().outdated:
+            trigger.update_object_tree()
 
     def model(self) -> ObjectModel:
         return super().model()
@@ -147,7 +149,8 @@ class PsetTreeView(FilterTreeView):
 
     def enterEvent(self, event):
         super().enterEvent(event)
-        trigger.update_pset_tree()
+        if self.model().outdated:
+            trigger.update_pset_tree()
 
     def model(self) -> PsetModel:
         return super().model()
@@ -161,9 +164,15 @@ class ProjectModel(QAbstractTableModel):
         self.check_column_index = 0
         self.last_col_count = self.columnCount()
         self.last_row_count = self.rowCount()
+        self.outdated = True
+        self.project.add_listener(self.project_changed)
+
+    def project_changed(self, change_events):
+        self.outdated = True
 
     def update(self):
         logging.debug(f"Update FilterView rowCount: {self.rowCount()} columnCount: {self.columnCount()}")
+        self.outdated = False
         self.dataChanged.emit(self.createIndex(0, 0), self.createIndex(self.rowCount(), self.columnCount()))
 
         if self.last_col_count != self.columnCount() or self.last_row_count != self.rowCount():
@@ -227,8 +236,14 @@ class TreeModel(QAbstractItemModel):
         self.allowed_combinations = self.get_allowed_combinations()
         self.check_column_index = check_column_index  # index of first column with checkdata
         self.column_titles = column_titles
+        self.outdated = True
+        self.project.add_listener(self.project_changed)
+
+    def project_changed(self, change_events):
+        self.outdated = True
 
     def update(self):
+        self.outdated = False
         self.allowed_combinations = self.get_allowed_combinations()
         self.dataChanged.emit(self.createIndex(0, 0), self.createIndex(self.rowCount(), self.columnCount()))
 
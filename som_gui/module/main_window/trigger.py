@@ -20,7 +20,7 @@ def toggle_console():
 
 
 def close_event(event):
-    return core.close_event(event,tool.MainWindow, tool.Popups)
+    return core.close_event(event,tool.MainWindow, tool.Popups, tool.Project)
 
 
 def paint_event():
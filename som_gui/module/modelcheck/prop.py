@@ -8,6 +8,7 @@ if TYPE_CHECKING:
     from som_gui.tool.modelcheck import ModelcheckRunner
     from PySide6.QtWidgets import QLabel, QProgressBar
     from sqlite3 import Connection
+    from SOMcreator.datastructure.snapshot import ProjectSnapshot
 
 
 class ModelcheckProperties:
@@ -18,6 +19,7 @@ class ModelcheckProperties:
     ifc_name: str = None
     ident_dict: dict = dict()
     data_dict: dict = dict()
+    snapshot: ProjectSnapshot = None
     active_element: ifcopenshell.entity_instance = None
     active_element_type: str = None
     status_label: QLabel = None
@@ -5,3 +5,6 @@ UMLAUT_DICT = {ord('ä'): 'ae', ord('ü'): 'ue', ord('ö'): 'oe', ord('ß'): 'ss
 FILETYPE = "SOM Project  (*.SOMjson);;all (*.*)"
 OPEN_PATH = "open_path"
 SAVE_PATH = "save_path"
+CACHE_SECTION = "project_cache"
+CACHE_ENABLED = "enabled"
+CACHE_SIZE = "max_size_mb"
@@ -7,6 +7,9 @@ from SOMcreator import Project
 if TYPE_CHECKING:
     from . import ui
     from PySide6.QtGui import QAction
+    from PySide6.QtCore import QThreadPool
+    from PySide6.QtWidgets import QProgressBar
+    from som_gui.tool.project import SaveRunner
 
 
 class ProjectProperties:
@@ -16,3 +19,7 @@ class ProjectProperties:
     settings_general_widget: ui.SettingsGeneral = None
     settings_path_widget: ui.SettingsPath = None
     actions: dict[str, QAction] = dict()
+    save_runner: SaveRunner | None = None
+    save_thread_pool: QThreadPool = None
+    pending_save_path: str | None = None  # save requested while another save was running
+    save_progress_bar: QProgressBar = None
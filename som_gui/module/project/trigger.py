@@ -23,6 +23,15 @@ def add_clicked():
     core.add_project(tool.Project, tool.Appdata, tool.Popups, tool.MainWindow, tool.Util)
 
 
+def connect_save_runner(runner):
+    runner.signaller.progress.connect(lambda p: core.save_progress(runner, p, tool.Project, tool.MainWindow))
+    runner.signaller.finished.connect(lambda: core.save_finished(runner, tool.Project, tool.Popups, tool.MainWindow))
+
+
+def finish_saves() -> bool:
+    return core.finish_saves(tool.Project, tool.Popups, tool.MainWindow)
+
+
 def save():
     core.save(tool.Project, tool.Popups, tool.Appdata, tool.MainWindow)
 
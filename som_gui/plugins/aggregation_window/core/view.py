@@ -318,7 +318,7 @@ def context_menu_requested(
     menu_list.append(
         [
             QCoreApplication.translate("Aggregation", "Rearange"),
-            lambda: rearange(buchheim, view, node,connection),
+            lambda: rearange(buchheim, view, node,connection, project),
         ]
     )
 
@@ -329,14 +329,15 @@ def context_menu_requested(
     paint_event(view, node, connection, project)
 
 def rearange(
-    buchheim: Type[aw_tool.Buchheim], view: Type[aw_tool.View], node: Type[aw_tool.Node],connection:Type[aw_tool.Connection]
+    buchheim: Type[aw_tool.Buchheim], view: Type[aw_tool.View], node: Type[aw_tool.Node],connection:Type[aw_tool.Connection],
+    project: Type[tool.Project],
 ):
     scene = view.get_active_scene()
     all_nodes = view.get_nodes_in_scene(scene)
     root_nodes = [n for n in all_nodes if node.is_root(n)]
 
     #create helper to structure multiple root nodes
-    helper_obj = SOMcreator.Object("INV",None)
+    helper_obj = SOMcreator.Object("INV",None, project=project.get())
     helper_aggregation = SOMcreator.Aggregation(helper_obj)
     helper_node = node.create_node(helper_aggregation)    
     for root_node in root_nodes:
@@ -140,10 +140,6 @@ class View(som_gui.plugins.aggregation_window.core.tool.View):
         if not plugin_dict:
             return
 
-        aggregation_ref = {
-            aggregation.uuid: aggregation
-            for aggregation in proj.get_aggregations(filter=False)
-        }
         import_scene_dict = plugin_dict.get(AGGREGATIONSCENES)
 
         if import_scene_dict is None:
@@ -169,7 +165,10 @@ class View(som_gui.plugins.aggregation_window.core.tool.View):
             for aggregation_uuid, pos in node_dict["Nodes"].items():
                 x = SCENE_SIZE[0] / 2 + pos[0] - x_min
                 y = SCENE_SIZE[1] / 2 + pos[1] - y_min
-                aggregation_tuple = (aggregation_ref[aggregation_uuid], QPointF(x, y))
+                aggregation = proj.get_element_by_uuid(aggregation_uuid)
+                if not isinstance(aggregation, SOMcreator.Aggregation):
+                    continue
+                aggregation_tuple = (aggregation, QPointF(x, y))
                 cls.get_properties().import_list[scene_id].append(aggregation_tuple)
 
     @classmethod
@@ -44,6 +44,10 @@ class Appdata(som_gui.core.tool.Appdata):
     def get_settings_path(cls):
         return os.path.join(appdirs.user_config_dir(som_gui.__name__), "config.ini")
 
+    @classmethod
+    def get_cache_dir(cls) -> str:
+        return appdirs.user_cache_dir(som_gui.__name__)
+
     @classmethod
     def _write_config(cls, config_parser) -> None:
         with open(cls.get_settings_path(), "w") as f:
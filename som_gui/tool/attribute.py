@@ -81,7 +81,7 @@ class Attribute(som_gui.core.tool.Attribute):
         :param attribute_data: dictionary {Data_name:{'getter':Callable, 'setter':Callable},...}
         :return:
         """
-        attribute = SOMcreator.Attribute()
+        attribute = SOMcreator.Attribute(project=tool.Project.get())
         cls.set_attribute_data_by_dict(attribute, attribute_data)
         return attribute
 
@@ -864,16 +864,14 @@ class AttributeCompare(som_gui.core.tool.AttributeCompare):
     def get_uuid_dict(cls, index=1) -> dict:
         if cls.get_properties().uuid_dicts[index] is None:
             project = cls.get_project(index)
-            d = {hi.uuid: hi for hi in project.get_hirarchy_items(filter=False)}
-            cls.get_properties().uuid_dicts[index] = d
+            cls.get_properties().uuid_dicts[index] = project.get_uuid_dict()
         return cls.get_properties().uuid_dicts[index]
 
     @classmethod
     def get_ident_dict(cls, index=1) -> dict:
         if cls.get_properties().ident_dicts[index] is None:
             project = cls.get_project(index)
-            d = {obj.ident_value: obj for obj in project.get_objects(filter=False)}
-            cls.get_properties().ident_dicts[index] = d
+            cls.get_properties().ident_dicts[index] = dict(project.get_ident_dict())
         return cls.get_properties().ident_dicts[index]
 
     @classmethod
@@ -94,10 +94,10 @@ class AttributeImportResults(som_gui.core.tool.AttributeImport):
         cls.unlock_updating()
 
     @classmethod
-    def update_som_combobox(cls, combobox: QComboBox, allowed_values: set[str], object_list: list[SOMcreator.Object]):
+    def update_som_combobox(cls, combobox: QComboBox, allowed_values: set[str],
+                            object_dict: dict[str, SOMcreator.Object]):
         cls.lock_updating("SOM ComboBox")
         all_keyword = cls.get_all_keyword()
-        object_dict = {obj.ident_value: obj for obj in object_list}
         allowed_objects = set(object_dict.get(v) for v in allowed_values)
         existing_objects = {combobox.itemData(index, Qt.ItemDataRole.UserRole) for index in range(combobox.count()) if
                             combobox.itemText(index) != all_keyword}
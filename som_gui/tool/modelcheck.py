@@ -9,6 +9,7 @@ from som_gui.tool.ifc_importer import IfcImportRunner
 
 if TYPE_CHECKING:
     from som_gui.module.modelcheck.prop import ModelcheckProperties
+    from SOMcreator.datastructure.snapshot import ProjectSnapshot
     from som_gui.module.util.ui import Progressbar
 import som_gui.core.tool
 import SOMcreator
@@ -107,23 +108,39 @@ class Modelcheck(som_gui.core.tool.Modelcheck):
         identifier = cls.get_ident_value(entity)
         return cls.get_ident_dict().get(identifier)
 
+    @classmethod
+    def create_snapshot(cls, project: SOMcreator.Project):
+        """the modelcheck runs in a background thread and reads a frozen snapshot instead of the live project"""
+        cls.get_properties().snapshot = project.snapshot()
+
+    @classmethod
+    def get_snapshot(cls) -> ProjectSnapshot:
+        return cls.get_properties().snapshot
+
     @classmethod
     def build_ident_dict(cls, objects: set[SOMcreator.Object]):
-        cls.get_properties().ident_dict = {o.ident_value: o for o in objects}
+        ident_dict = cls.get_snapshot().get_ident_dict()
+        cls.get_properties().ident_dict = {ident: o for ident, o in ident_dict.items() if o.entity in objects}
 
     @classmethod
     def build_data_dict(cls, check_state_dict: dict[
-        SOMcreator.Object | SOMcreator.PropertySet | SOMcreator.Attribute, bool]):
+        SOMcreator.Object | SOMcreator.PropertySet | SOMcreator.Attribute, bool],
+                        project: SOMcreator.Project | ProjectSnapshot | None = None):
+        """project defaults to the live project. The entities of a snapshot are looked up by their live entity"""
+
+        def is_checked(entity) -> bool:
+            return bool(check_state_dict.get(entity.entity if is_snapshot else entity))
+
         def iter_objects(objects: Iterator[SOMcreator.Object]):
             for obj in objects:
-                if not check_state_dict.get(obj):
+                if not is_checked(obj):
                     continue
                 for property_set in obj.get_property_sets(filter=False):
-                    if not check_state_dict.get(property_set):
+                    if not is_checked(property_set):
                         continue
                     attribute_list = list()
                     for attribute in property_set.get_attributes(filter=False):
-                        if not check_state_dict.get(attribute):
+                        if not is_checked(attribute):
                             continue
                         attribute_list.append(attribute)
 
@@ -135,8 +152,11 @@ class Modelcheck(som_gui.core.tool.Modelcheck):
                         output_data_dict[obj][property_set] = attribute_list
                 iter_objects(obj.get_children(filter=True))
 
+        if project is None:
+            project = tool.Project.get()
+        is_snapshot = not isinstance(project, SOMcreator.Project)
         output_data_dict = dict()
-        iter_objects(tool.Project.get_root_objects())
+        iter_objects(project.get_root_objects(filter=True))
         cls.set_data_dict(output_data_dict)
         return output_data_dict
 
@@ -348,21 +348,15 @@ class Object(som_gui.core.tool.Object):
     @classmethod
     def get_existing_ident_values(cls) -> set[str]:
         proj = tool.Project.get()
-        ident_values = set()
-        for obj in proj.get_objects(filter=False):
-            if obj.ident_value:
-                ident_values.add(obj.ident_value)
-        return ident_values
+        return {ident_value for ident_value in proj.get_ident_dict() if ident_value}
 
     @classmethod
     def is_identifier_allowed(cls, identifier, ignore=None):
-        identifiers = cls.get_existing_ident_values()
-        if ignore is not None:
-            identifiers = list(filter(lambda i: i != ignore, identifiers))
-        if identifier in identifiers or not identifier:
+        if not identifier:
             return False
-        else:
+        if ignore is not None and identifier == ignore:
             return True
+        return tool.Project.get().get_object_by_identifier(identifier) is None
 
     @classmethod
     def oi_create_dialog(cls) -> ObjectInfoWidget:
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import logging
+import os
 from typing import Callable, TYPE_CHECKING
 
-from PySide6.QtWidgets import QComboBox, QTableWidget, QTableWidgetItem
+from PySide6.QtCore import QCoreApplication, QObject, QRunnable, QThreadPool, Signal
+from PySide6.QtWidgets import QComboBox, QProgressBar, QStatusBar, QTableWidget, QTableWidgetItem
 
 import SOMcreator
+import SOMcreator.exporter.som_json
 import SOMcreator.util.project
 import som_gui
 import som_gui.core.tool
@@ -16,6 +19,35 @@ from som_gui.module.project.ui import MergeDialog
 if TYPE_CHECKING:
     from som_gui.module.project import ui
     from PySide6.QtGui import QAction
+    from SOMcreator.datastructure.snapshot import ProjectSnapshot
+
+
+class SaveSignaller(QObject):
+    finished = Signal()
+    progress = Signal(int)
+
+
+class SaveRunner(QRunnable):
+    """writes a snapshot of the Project to a SOM JSON file, the GUI keeps working on the Project meanwhile"""
+
+    def __init__(self, proj: SOMcreator.Project, snapshot: ProjectSnapshot, path: str):
+        super(SaveRunner, self).__init__()
+        self.project = proj
+        self.snapshot = snapshot
+        self.path = path
+        self.signaller = SaveSignaller()
+        self.error: Exception | None = None
+
+    def run(self):
+        try:
+            # writes to a temporary file first and replaces the existing file afterward
+            SOMcreator.exporter.som_json.export_json(self.snapshot, self.path, stream=True,
+                                                     progress=self.signaller.progress.emit)
+            SOMcreator.exporter.som_json.journal.remove_journal(self.path)
+        except Exception as error:
+            logging.exception(f"Saving '{self.path}' failed")
+            self.error = error
+        self.signaller.finished.emit()
 
 
 class Project(som_gui.core.tool.Project):
@@ -164,3 +196,75 @@ class Project(som_gui.core.tool.Project):
     @classmethod
     def get_settings_path_widget(cls, ) -> ui.SettingsPath:
         return cls.get_properties().settings_path_widget
+
+    @classmethod
+    def create_save_runner(cls, path: str) -> SaveRunner:
+        """the snapshot has to be taken on the GUI thread, after the plugin save functions were called"""
+        proj = cls.get()
+        runner = SaveRunner(proj, proj.snapshot(), path)
+        cls.get_properties().save_runner = runner
+        return runner
+
+    @classmethod
+    def connect_save_runner(cls, runner: SaveRunner):
+        from som_gui.module.project import trigger
+        trigger.connect_save_runner(runner)
+
+    @classmethod
+    def finish_saves(cls) -> bool:
+        """waits for the running and the pending save. Returns False if one of them failed"""
+        from som_gui.module.project import trigger
+        return trigger.finish_saves()
+
+    @classmethod
+    def get_save_runner(cls) -> SaveRunner | None:
+        return cls.get_properties().save_runner
+
+    @classmethod
+    def remove_save_runner(cls):
+        cls.get_properties().save_runner = None
+
+    @classmethod
+    def is_save_running(cls) -> bool:
+        return cls.get_properties().save_runner is not None
+
+    @classmethod
+    def get_save_threadpool(cls) -> QThreadPool:
+        if cls.get_properties().save_thread_pool is None:
+            tp = QThreadPool()
+            tp.setMaxThreadCount(1)
+            cls.get_properties().save_thread_pool = tp
+        return cls.get_properties().save_thread_pool
+
+    @classmethod
+    def set_pending_save_path(cls, path: str | None):
+        cls.get_properties().pending_save_path = path
+
+    @classmethod
+    def get_pending_save_path(cls) -> str | None:
+        return cls.get_properties().pending_save_path
+
+    @classmethod
+    def get_save_progress_bar(cls, statusbar: QStatusBar) -> QProgressBar:
+        prop = cls.get_properties()
+        if prop.save_progress_bar is None:
+            prop.save_progress_bar = QProgressBar()
+            prop.save_progress_bar.setMaximumWidth(250)
+            prop.save_progress_bar.setVisible(False)
+            statusbar.addPermanentWidget(prop.save_progress_bar)
+        return prop.save_progress_bar
+
+    @classmethod
+    def set_save_progress(cls, statusbar: QStatusBar, text: str, value: int):
+        progress_bar = cls.get_save_progress_bar(statusbar)
+        progress_bar.setFormat(f"{text} %p%")
+        progress_bar.setValue(value)
+        progress_bar.setVisible(True)
+
+    @classmethod
+    def hide_save_progress(cls, statusbar: QStatusBar):
+        cls.get_save_progress_bar(statusbar).setVisible(False)
+
+    @classmethod
+    def get_save_text(cls, runner: SaveRunner) -> str:
+        return QCoreApplication.translate("Project", "Save '{}'").format(os.path.basename(runner.path))
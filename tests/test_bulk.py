@@ -0,0 +1,59 @@
+import gc
+
+import pytest
+
+import SOMcreator
+
+
+def test_bulk_commit():
+    proj = SOMcreator.Project("Bulk")
+    with proj.bulk() as builder:
+        obj = builder.create_object("Wall", abbreviation="W")
+        pset = builder.create_property_set("Pset_WallCommon", obj=obj)
+        builder.create_attribute(pset, "LoadBearing", ["True"])
+        child = builder.create_object("Child", parent=obj.uuid)
+    assert gc.isenabled()
+    assert set(proj.get_objects(filter=False)) == {obj, child}
+    assert child.parent is obj
+    assert proj.get_element_by_uuid(pset.uuid) is pset
+
+
+def test_bulk_rollback_on_exception():
+    proj = SOMcreator.Project("Bulk")
+    existing_object = SOMcreator.Object("Existing", None, project=proj)
+    existing_pset = SOMcreator.PropertySet("Existing", existing_object)
+
+    with pytest.raises(RuntimeError):
+        with proj.bulk() as builder:
+            obj = builder.create_object("Wall", parent=existing_object)
+            pset = builder.create_property_set("Pset_WallCommon", obj=existing_object)
+            attribute = builder.create_attribute(existing_pset, "LoadBearing", ["True"],
+                                                 filter_matrix=[[False]])
+            raise RuntimeError()
+
+    assert gc.isenabled()
+    assert list(proj.get_objects(filter=False)) == [existing_object]
+    assert list(existing_object.get_property_sets(filter=False)) == [existing_pset]
+    assert list(existing_pset.get_attributes(filter=False)) == []
+    assert list(existing_object.get_children(filter=False)) == []
+    for item in (obj, pset, attribute):
+        assert proj.get_element_by_uuid(item.uuid) is None
+
+
+def test_overlapping_bulk_contexts_keep_gc_paused():
+    first_project, second_project = SOMcreator.Project("First"), SOMcreator.Project("Second")
+    first_bulk, second_bulk = first_project.bulk(), second_project.bulk()
+    first_bulk.__enter__()
+    second_bulk.__enter__()
+    first_bulk.__exit__(None, None, None)
+    assert not gc.isenabled()
+    second_bulk.__exit__(None, None, None)
+    assert gc.isenabled()
+
+    gc.disable()
+    try:
+        with first_project.bulk():
+            pass
+        assert not gc.isenabled()
+    finally:
+        gc.enable()
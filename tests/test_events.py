@@ -0,0 +1,64 @@
+import SOMcreator
+from SOMcreator.datastructure import events
+
+
+class Recorder:
+    def __init__(self):
+        self.calls: list[list[events.ChangeEvent]] = list()
+
+    def __call__(self, change_events):
+        self.calls.append(list(change_events))
+
+    @property
+    def events(self) -> list[events.ChangeEvent]:
+        return [event for call in self.calls for event in call]
+
+
+def test_listener_gets_created_and_changed_entities():
+    proj = SOMcreator.Project("Events")
+    recorder = Recorder()
+    proj.add_listener(recorder)
+    obj = SOMcreator.Object("Wall", None, project=proj)
+    obj.name = "Slab"
+    obj.description = "Floor"
+
+    assert events.ChangeEvent(events.CREATED, obj) in recorder.events
+    assert events.ChangeEvent(events.RENAMED, obj) in recorder.events
+    assert events.ChangeEvent(events.MODIFIED, obj) in recorder.events
+
+    call_count = len(recorder.calls)
+    proj.remove_listener(recorder)
+    obj.name = "Roof"
+    assert len(recorder.calls) == call_count
+
+
+def test_batch_delivers_merged_events_once():
+    proj = SOMcreator.Project("Events")
+    obj = SOMcreator.Object("Wall", None, project=proj)
+    recorder = Recorder()
+    proj.add_listener(recorder)
+    with proj.batch():
+        for name in ("A", "B", "C"):
+            obj.name = name
+    assert recorder.calls == [[events.ChangeEvent(events.RENAMED, obj)]]
+
+
+def test_dirty_state_is_reset_by_save_and_open(tmp_path):
+    proj = SOMcreator.Project("Events")
+    obj = SOMcreator.Object("Wall", None, project=proj)
+    assert proj.is_dirty()
+    assert obj in proj.get_dirty_items()
+
+    path = str(tmp_path / "events.SOMjson")
+    proj.save(path)
+    assert not proj.is_dirty()
+    assert not obj.is_dirty
+
+    opened = SOMcreator.Project.open(path)
+    assert not opened.is_dirty()
+    opened_object = opened.get_element_by_uuid(obj.uuid)
+    opened_object.description = "changed"
+    assert opened.is_dirty()
+    assert opened.get_dirty_items() == {opened_object}
+    opened_object.delete()
+    assert opened_object in opened.get_deleted_items()
@@ -0,0 +1,101 @@
+import itertools
+
+import pytest
+
+import SOMcreator
+
+NAMES = ("A", "B", "C")
+
+
+def _create_project() -> tuple[SOMcreator.Project, dict[str, list[list[bool]]]]:
+    """every Object gets another filter matrix, the project has three Phases and three UseCases"""
+    phases = [SOMcreator.Phase(name, name, "") for name in NAMES]
+    usecases = [SOMcreator.UseCase(name, name, "") for name in NAMES]
+    proj = SOMcreator.Project("Filter", phases=phases, usecase=usecases)
+    matrices = dict()
+    for index, states in enumerate(itertools.product((True, False), repeat=3)):
+        # vary row and column so every removal leaves distinct and equal matrices
+        matrix = [[states[(phase + usecase) % 3] for usecase in range(3)] for phase in range(3)]
+        obj = SOMcreator.Object(f"Object {index}", None, project=proj, filter_matrix=matrix)
+        matrices[obj.uuid] = matrix
+    return proj, matrices
+
+
+def _remove_phase(matrix: list[list[bool]], index: int) -> list[list[bool]]:
+    return matrix[:index] + matrix[index + 1:]
+
+
+def _remove_usecase(matrix: list[list[bool]], index: int) -> list[list[bool]]:
+    return [row[:index] + row[index + 1:] for row in matrix]
+
+
+def _check_project(proj: SOMcreator.Project, expected: dict[str, list[list[bool]]]) -> None:
+    for uuid, matrix in expected.items():
+        obj = proj.get_element_by_uuid(uuid)
+        assert [list(row) for row in obj.get_filter_matrix()] == matrix
+    for phase, usecase in itertools.product(range(len(proj.get_phases())), range(len(proj.get_usecases()))):
+        proj.active_phases = [phase]
+        proj.active_usecases = [usecase]
+        for uuid, matrix in expected.items():
+            assert proj.get_element_by_uuid(uuid).is_active() == matrix[phase][usecase]
+
+
+def test_equal_matrices_are_shared():
+    proj, matrices = _create_project()
+    first, second = (proj.get_element_by_uuid(uuid) for uuid in list(matrices)[:2])
+    second.set_filter_matrix([list(row) for row in first.get_filter_matrix()])
+    assert second.get_filter_matrix() is first.get_filter_matrix()
+
+
+def test_add_phase_and_usecase():
+    proj, matrices = _create_project()
+    proj.add_phase(SOMcreator.Phase("D", "D", ""))
+    proj.add_usecase(SOMcreator.UseCase("D", "D", ""))
+    expected = {uuid: [row + [True] for row in matrix] + [[True] * 4] for uuid, matrix in matrices.items()}
+    _check_project(proj, expected)
+
+
+@pytest.mark.parametrize("remove", ["phase", "usecase"])
+def test_remove_middle_column(tmp_path, remove):
+    proj, matrices = _create_project()
+    if remove == "phase":
+        proj.remove_phase(proj.get_phase_by_index(1))
+        expected = {uuid: _remove_phase(matrix, 1) for uuid, matrix in matrices.items()}
+        assert [phase.name for phase in proj.get_phases()] == ["A", "C"]
+    else:
+        proj.remove_usecase(proj.get_usecase_by_index(1))
+        expected = {uuid: _remove_usecase(matrix, 1) for uuid, matrix in matrices.items()}
+        assert [usecase.name for usecase in proj.get_usecases()] == ["A", "C"]
+    _check_project(proj, expected)
+
+    path = str(tmp_path / "filter.SOMjson")
+    proj.save(path)
+    imported_project = SOMcreator.Project.open(path)
+    assert [phase.name for phase in imported_project.get_phases()] == [p.name for p in proj.get_phases()]
+    assert [usecase.name for usecase in imported_project.get_usecases()] == [u.name for u in proj.get_usecases()]
+    _check_project(imported_project, expected)
+
+
+def test_filter_slot_gets_reused():
+    proj, matrices = _create_project()
+    obj = proj.get_element_by_uuid(next(iter(matrices)))
+    slot = proj.get_filter_slot(obj.get_filter_matrix())
+    obj.delete()
+
+    matrix = [[False, True, False], [True, False, True], [False, False, True]]
+    assert proj.get_filter_slot(matrix) == slot
+    new_object = SOMcreator.Object("New", None, project=proj, filter_matrix=matrix)
+    assert [list(row) for row in new_object.get_filter_matrix()] == matrix
+    proj.active_phases = [2]
+    proj.active_usecases = [2]
+    assert new_object.is_active()
+
+
+def test_filter_slot_stays_while_used():
+    proj, matrices = _create_project()
+    first, second = (proj.get_element_by_uuid(uuid) for uuid in list(matrices)[:2])
+    second.set_filter_matrix(first.get_filter_matrix())
+    slot = proj.get_filter_slot(first.get_filter_matrix())
+    first.delete()
+    assert proj.get_filter_slot(second.get_filter_matrix()) == slot
+    assert [list(row) for row in second.get_filter_matrix()] == matrices[first.uuid]
@@ -0,0 +1,50 @@
+import SOMcreator
+
+
+def _create_project() -> tuple[SOMcreator.Project, list[SOMcreator.Object]]:
+    proj = SOMcreator.Project("Identifier")
+    objects = list()
+    for index in range(3):
+        obj = SOMcreator.Object(f"Object {index}", None, project=proj)
+        pset = SOMcreator.PropertySet("Pset", obj, project=proj)
+        obj.ident_attrib = SOMcreator.Attribute(pset, "Ident", [f"{index}"], project=proj)
+        SOMcreator.Attribute(pset, "Other", ["x"], project=proj)
+        objects.append(obj)
+    return proj, objects
+
+
+def test_identifier_index_follows_edits():
+    proj, objects = _create_project()
+    assert proj.get_object_by_identifier("1") is objects[1]
+
+    objects[1].ident_attrib.value = ["changed"]
+    assert proj.get_object_by_identifier("1") is None
+    assert proj.get_object_by_identifier("changed") is objects[1]
+
+    objects[2].ident_attrib = objects[2].get_property_set_by_name("Pset").get_attribute_by_name("Other")
+    assert proj.get_object_by_identifier("x") is objects[2]
+    assert proj.get_object_by_identifier("2") is None
+
+
+def test_other_attributes_keep_the_index():
+    proj, objects = _create_project()
+    ident_dict = proj.get_ident_dict()
+    objects[0].get_property_set_by_name("Pset").get_attribute_by_name("Other").value = ["y"]
+    assert proj.get_ident_dict() is ident_dict
+    objects[0].ident_attrib.value = ["new"]
+    assert proj.get_ident_dict() is not ident_dict
+
+
+def test_inherited_identifier_values():
+    proj = SOMcreator.Project("Identifier")
+    predefined_pset = SOMcreator.PropertySet("Predefined", None, project=proj)
+    parent_attribute = SOMcreator.Attribute(predefined_pset, "Ident", ["a"], child_inherits_values=True,
+                                            project=proj)
+    obj = SOMcreator.Object("Object", None, project=proj)
+    pset = predefined_pset.create_child("Predefined")
+    obj.add_property_set(pset)
+    obj.ident_attrib = pset.get_attribute_by_name("Ident")
+    assert proj.get_object_by_identifier("a") is obj
+
+    parent_attribute.value = ["a", "b"]
+    assert proj.get_object_by_identifier("a;b") is obj
@@ -0,0 +1,56 @@
+import SOMcreator
+
+
+def _create_chain(depth: int) -> tuple[SOMcreator.Project, list[SOMcreator.Object]]:
+    proj = SOMcreator.Project("Inheritance")
+    objects = list()
+    for index in range(depth):
+        obj = SOMcreator.Object(f"Object {index}", None, project=proj)
+        if objects:
+            objects[-1].add_child(obj)
+        objects.append(obj)
+    return proj, objects
+
+
+def test_description_and_optional_follow_the_parent():
+    proj, objects = _create_chain(4)
+    root, leaf = objects[0], objects[-1]
+    root.description = "root"
+    root.set_optional(True)
+    assert leaf.description == "root"
+    assert leaf.is_optional()
+
+    root.description = "changed"
+    root.set_optional(False)
+    assert leaf.description == "changed"
+    assert not leaf.is_optional()
+
+    objects[1].description = "own"
+    assert leaf.description == "own"
+    assert root.description == "changed"
+
+
+def test_reparenting_resets_inherited_values():
+    proj, objects = _create_chain(3)
+    other = SOMcreator.Object("Other", None, project=proj)
+    other.description = "other"
+    objects[0].description = "root"
+    leaf = objects[-1]
+    assert leaf.description == "root"
+
+    other.add_child(objects[1])
+    assert leaf.description == "other"
+    assert list(leaf.inherited_property_sets) == []
+
+
+def test_inherited_property_sets():
+    proj, objects = _create_chain(3)
+    root, middle, leaf = objects
+    root_pset = SOMcreator.PropertySet("Root", root)
+    assert leaf.inherited_property_sets == {root: [root_pset]}
+
+    middle_pset = SOMcreator.PropertySet("Middle", middle)
+    assert leaf.inherited_property_sets == {middle: [middle_pset], root: [root_pset]}
+
+    root.remove_property_set(root_pset)
+    assert leaf.inherited_property_sets == {middle: [middle_pset]}
@@ -0,0 +1,136 @@
+import json
+import os
+
+import pytest
+
+import SOMcreator
+
+
+def _create_project() -> SOMcreator.Project:
+    """big enough that a few saves don't trigger the compaction"""
+    proj = SOMcreator.Project("Journal")
+    for index in range(50):
+        obj = SOMcreator.Object(f"Object {index:02d}", None, project=proj)
+        pset = SOMcreator.PropertySet("Pset", obj, project=proj)
+        obj.ident_attrib = SOMcreator.Attribute(pset, "Ident", [str(index)], project=proj)
+        for attribute_index in range(10):
+            SOMcreator.Attribute(pset, f"Attribute {attribute_index}", [str(attribute_index)], project=proj)
+        SOMcreator.Aggregation(obj)
+    return proj
+
+
+def _normalize(export_dict: dict) -> dict:
+    """replaces the filter matrix indices by the matrices, their order depends on the order of creation"""
+    export_dict = json.loads(json.dumps(export_dict))
+    matrices = export_dict.pop("FilterMatrixes")
+
+    def walk(value):
+        if isinstance(value, dict):
+            return {k: matrices[v] if k == "filter_matrix" and isinstance(v, int) else walk(v)
+                    for k, v in value.items()}
+        if isinstance(value, list):
+            return [walk(v) for v in value]
+        return value
+
+    return walk(export_dict)
+
+
+def _edit(proj: SOMcreator.Project, step: int) -> None:
+    objects = sorted(proj.get_objects(filter=False), key=lambda o: o.name)
+    objects[0].name = f"Renamed {step}"
+    objects[1].ident_attrib.value = [f"changed {step}"]
+    objects[-1].delete()
+    new_object = SOMcreator.Object(f"New {step}", None, project=proj)
+    pset = SOMcreator.PropertySet("Pset", new_object, project=proj)
+    new_object.ident_attrib = SOMcreator.Attribute(pset, "Ident", [f"new {step}"], project=proj)
+    objects[1].add_child(new_object)
+    proj.plugin_dict["Plugin"] = {"step": step}
+
+
+def test_journal_replay(tmp_path):
+    path = str(tmp_path / "project.SOMjson")
+    proj = _create_project()
+    proj.save(path)
+    for step in range(3):
+        _edit(proj, step)
+        assert proj.save_changes(path)
+    assert os.path.exists(f"{path}.journal")
+    assert not proj.is_dirty()
+
+    reopened_project = SOMcreator.Project.open(path)
+    expected = _normalize(proj.save(str(tmp_path / "expected.SOMjson")))
+    assert _normalize(reopened_project.save(str(tmp_path / "reopened.SOMjson"))) == expected
+
+
+def test_journal_gets_compacted(tmp_path):
+    path = str(tmp_path / "project.SOMjson")
+    proj = _create_project()
+    proj.save(path)
+    _edit(proj, 0)
+    assert proj.save_changes(path)
+
+    proj.add_phase(SOMcreator.Phase("New Phase", "New Phase", ""))
+    assert not proj.save_changes(path)
+    assert not os.path.exists(f"{path}.journal")
+    reopened_project = SOMcreator.Project.open(path)
+    assert [phase.name for phase in reopened_project.get_phases()] == [phase.name for phase in proj.get_phases()]
+    assert {obj.name for obj in reopened_project.get_objects(filter=False)} == \
+           {obj.name for obj in proj.get_objects(filter=False)}
+
+    proj.get_phases()[0].name = "Renamed Phase"
+    assert proj.save_changes(path)
+    proj.save(path)
+    assert not os.path.exists(f"{path}.journal")
+
+
+def test_journal_of_other_file_content_raises(tmp_path):
+    path = str(tmp_path / "project.SOMjson")
+    proj = _create_project()
+    proj.save(path)
+    _edit(proj, 0)
+    assert proj.save_changes(path)
+
+    _create_project().save(str(tmp_path / "other.SOMjson"))
+    os.replace(str(tmp_path / "other.SOMjson"), path)
+    with pytest.raises(ValueError):
+        SOMcreator.Project.open(path)
+
+    # the Project doesn't append to a journal of a file it didn't write
+    _edit(proj, 1)
+    assert not proj.save_changes(path)
+    assert not os.path.exists(f"{path}.journal")
+
+
+def test_save_changes_to_another_path_saves_fully(tmp_path):
+    path, other_path = str(tmp_path / "project.SOMjson"), str(tmp_path / "other.SOMjson")
+    proj = _create_project()
+    proj.save(path)
+    _create_project().save(other_path)
+    _edit(proj, 0)
+    assert not proj.save_changes(other_path)
+    assert proj.source_path == os.path.abspath(other_path)
+    assert not os.path.exists(f"{other_path}.journal")
+    reopened_project = SOMcreator.Project.open(other_path)
+    assert {obj.name for obj in reopened_project.get_objects(filter=False)} == \
+           {obj.name for obj in proj.get_objects(filter=False)}
+
+
+def test_plugin_sections_are_only_written_when_changed(tmp_path):
+    path = str(tmp_path / "project.SOMjson")
+    proj = _create_project()
+    proj.plugin_dict["Plugin"] = {"step": 0}
+    proj.save(path)
+    objects = sorted(proj.get_objects(filter=False), key=lambda o: o.name)
+    objects[0].name = "Renamed"
+    assert proj.save_changes(path)
+    proj.plugin_dict["Plugin"] = {"step": 1}
+    assert proj.save_changes(path)
+    objects[0].name = "Renamed again"
+    assert proj.save_changes(path)
+
+    with open(f"{path}.journal", "rb") as file:
+        blocks = [json.loads(line) for line in file.read().splitlines()[1:]]
+    assert ["Plugins" in block for block in blocks] == [False, True, False]
+    reopened_project = SOMcreator.Project.open(path)
+    assert reopened_project.plugin_dict["Plugin"] == {"step": 1}
+    assert reopened_project.get_element_by_uuid(objects[0].uuid).name == "Renamed again"
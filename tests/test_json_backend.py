@@ -0,0 +1,66 @@
+import itertools
+import json
+
+import pytest
+
+import SOMcreator
+from SOMcreator.util import json_backend
+
+BACKENDS = json_backend.get_available_backends()
+DATA = {
+    "name": "Äußeres Bauteil \U0001f3d7",
+    "values": [1, -2.5, 1e-07, True, None, "a/b", "tab\tquote\""],
+    "nested": {"empty": {}, "list": [[], [{}]]},
+}
+
+
+@pytest.fixture
+def restore_backend():
+    old_backend = json_backend.backend
+    yield
+    json_backend.set_backend(old_backend)
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_dumps_is_ascii_json(restore_backend, backend):
+    json_backend.set_backend(backend)
+    data = json_backend.dumps(DATA)
+    assert data.isascii()
+    assert json.loads(data) == DATA
+    assert json_backend.loads(data) == DATA
+    assert json_backend.loads(data.decode("ascii")) == DATA
+
+
+def test_unknown_backend(restore_backend):
+    with pytest.raises(ValueError):
+        json_backend.set_backend("unknown")
+
+
+@pytest.mark.parametrize("save_backend,open_backend", list(itertools.product(BACKENDS, repeat=2)))
+def test_save_and_open(tmp_path, restore_backend, save_backend, open_backend):
+    proj = SOMcreator.Project("Übersicht")
+    obj = SOMcreator.Object("Tür", None, project=proj)
+    pset = SOMcreator.PropertySet("Pset", obj, project=proj)
+    obj.ident_attrib = SOMcreator.Attribute(pset, "Ident", ["ä"], project=proj)
+    path = str(tmp_path / "project.SOMjson")
+    json_backend.set_backend(save_backend)
+    proj.save(path)
+
+    json_backend.set_backend(open_backend)
+    imported_project = SOMcreator.Project.open(path)
+    assert imported_project.name == proj.name
+    imported_object = imported_project.get_element_by_uuid(obj.uuid)
+    assert imported_object.name == "Tür"
+    assert imported_object.ident_value == "ä"
+
+
+def test_default_backend_writes_like_json_dump(tmp_path):
+    assert json_backend.backend == json_backend.STDLIB
+    data = dict(DATA, nan=float("nan"), infinity=float("inf"))
+    assert json_backend.dumps(data) == json.dumps(data).encode("ascii")
+
+    proj = SOMcreator.Project("Default")
+    path = str(tmp_path / "project.SOMjson")
+    export_dict = proj.save(path)
+    with open(path, "rb") as file:
+        assert file.read() == json.dumps(export_dict).encode("ascii")
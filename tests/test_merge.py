@@ -0,0 +1,35 @@
+import SOMcreator
+
+
+def _save_and_open(proj: SOMcreator.Project, path: str) -> SOMcreator.Project:
+    proj.save(path)
+    return SOMcreator.Project.open(path)
+
+
+def test_merged_items_get_journaled(tmp_path):
+    existing = SOMcreator.Project("Existing")
+    existing_object = SOMcreator.Object("Existing", None, project=existing)
+    existing_object.ident_attrib = SOMcreator.Attribute(SOMcreator.PropertySet("Pset", existing_object), "Value", ["0"])
+    path = str(tmp_path / "existing.SOMjson")
+    existing = _save_and_open(existing, path)
+
+    imported = SOMcreator.Project("Import")
+    obj = SOMcreator.Object("Import", None, project=imported)
+    pset = SOMcreator.PropertySet("Pset", obj)
+    attribute = SOMcreator.Attribute(pset, "Value", ["1"])
+    obj.ident_attrib = attribute
+    imported = _save_and_open(imported, str(tmp_path / "import.SOMjson"))
+    imported.get_element_by_uuid(attribute.uuid).value = ["1"]  # dirty in the import project
+
+    assert not existing.get_dirty_items()
+    phase_mapping = dict(zip(imported.get_phases(), existing.get_phases()))
+    usecase_mapping = dict(zip(imported.get_usecases(), existing.get_usecases()))
+    SOMcreator.merge_projects(existing, imported, phase_mapping, usecase_mapping)
+    assert {item.uuid for item in existing.get_dirty_items()} >= {obj.uuid, pset.uuid, attribute.uuid}
+
+    assert existing.save_changes(path)
+    reopened = SOMcreator.Project.open(path)
+    assert {o.name for o in reopened.get_objects(filter=False)} == {"Existing", "Import"}
+    merged_attribute = reopened.get_element_by_uuid(attribute.uuid)
+    assert merged_attribute.property_set.uuid == pset.uuid
+    assert merged_attribute.value == ["1"]
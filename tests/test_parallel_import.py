@@ -0,0 +1,64 @@
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+import SOMcreator
+from SOMcreator.util import project_cache
+
+FILE_COUNT = 8
+ROUNDS = 4
+
+
+def _create_project(index: int) -> SOMcreator.Project:
+    proj = SOMcreator.Project(f"Project {index}")
+    parent = None
+    for object_index in range(20):
+        obj = SOMcreator.Object(f"Object {index}.{object_index}", None, project=proj)
+        pset = SOMcreator.PropertySet("Pset", obj)
+        SOMcreator.Attribute(pset, "Value", [str(object_index)])
+        if parent is not None:
+            parent.add_child(obj)
+        parent = obj
+    return proj
+
+
+@pytest.fixture
+def switch_often():
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)  # switch threads as often as possible
+    yield
+    sys.setswitchinterval(interval)
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    project_cache.set_cache_dir(tmp_path / "cache")
+    yield
+    project_cache.set_cache_dir(None)
+
+
+def _roundtrip(path: str, stream: bool, out: str) -> tuple[bool, dict]:
+    proj = SOMcreator.Project.open(path, stream=stream)
+    owned = all(item.project is proj for item in proj.get_uuid_dict().values())
+    proj.save(out, stream=stream)
+    with open(out) as file:
+        return owned, json.load(file)
+
+
+def test_parallel_imports(tmp_path, switch_often, cache_dir):
+    paths = list()
+    for index in range(FILE_COUNT):
+        path = str(tmp_path / f"project_{index}.SOMjson")
+        _create_project(index).save(path)
+        paths.append(path)
+
+    expected = {path: _roundtrip(path, False, f"{path}.serial")[1] for path in paths}
+    jobs = [(path, bool(index % 2), f"{path}.{index}.out") for index in range(ROUNDS) for path in paths]
+    with ThreadPoolExecutor(16) as pool:
+        results = list(pool.map(lambda job: _roundtrip(*job), jobs))
+
+    for (path, _, _), (owned, main_dict) in zip(jobs, results):
+        assert owned
+        assert main_dict == expected[path]
@@ -0,0 +1,104 @@
+import gc
+import json
+import os
+
+import pytest
+
+import SOMcreator
+from SOMcreator.util import project_cache
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    path = tmp_path / "cache"
+    project_cache.set_cache_dir(path)
+    yield path
+    project_cache.set_cache_dir(None)
+
+
+def _create_project() -> SOMcreator.Project:
+    proj = SOMcreator.Project("Cache")
+    for index in range(20):
+        obj = SOMcreator.Object(f"Object {index:02d}", None, project=proj)
+        pset = SOMcreator.PropertySet("Pset", obj, project=proj)
+        obj.ident_attrib = SOMcreator.Attribute(pset, "Ident", [str(index)], project=proj)
+        for attribute_index in range(10):
+            SOMcreator.Attribute(pset, f"Attribute {attribute_index}", [str(attribute_index)], project=proj)
+        SOMcreator.Aggregation(obj)
+    return proj
+
+
+def _get_entries(path) -> list[str]:
+    return [name for name in os.listdir(path) if name.endswith(project_cache.SUFFIX)]
+
+
+def _dump(proj: SOMcreator.Project, path: str) -> dict:
+    """without the filter matrix indices, their order depends on the order of creation"""
+    export_dict = json.loads(json.dumps(proj.save(path)))
+    matrices = export_dict.pop("FilterMatrixes")
+
+    def walk(value):
+        if isinstance(value, dict):
+            return {k: matrices[v] if k == "filter_matrix" and isinstance(v, int) else walk(v)
+                    for k, v in value.items()}
+        if isinstance(value, list):
+            return [walk(v) for v in value]
+        return value
+
+    return walk(export_dict)
+
+
+def test_cached_project_equals_import(tmp_path, cache_dir):
+    path = str(tmp_path / "project.SOMjson")
+    _create_project().save(path)
+    imported_project = SOMcreator.Project.open(path)
+    assert len(_get_entries(cache_dir)) == 1
+
+    cached_project = SOMcreator.Project.open(path)
+    assert cached_project is not imported_project
+    assert not cached_project.is_dirty()
+    assert len(_get_entries(cache_dir)) == 1
+    expected = _dump(imported_project, str(tmp_path / "imported.SOMjson"))
+    assert _dump(cached_project, str(tmp_path / "cached.SOMjson")) == expected
+
+    # the restored project is fully usable
+    obj = cached_project.get_element_by_uuid(next(iter(cached_project.get_objects(filter=False))).uuid)
+    obj.name = "Renamed"
+    assert cached_project.is_dirty()
+    assert cached_project.get_object_by_identifier(obj.ident_value) is obj
+
+
+def test_changed_file_is_imported_again(tmp_path, cache_dir):
+    path = str(tmp_path / "project.SOMjson")
+    proj = _create_project()
+    proj.save(path)
+    SOMcreator.Project.open(path)
+
+    obj = next(iter(proj.get_objects(filter=False)))
+    obj.name = "Saved"
+    proj.save(path)
+    assert SOMcreator.Project.open(path).get_element_by_uuid(obj.uuid).name == "Saved"
+
+    obj.name = "Journaled"
+    assert proj.save_changes(path)
+    assert SOMcreator.Project.open(path).get_element_by_uuid(obj.uuid).name == "Journaled"
+    assert len(_get_entries(cache_dir)) == 3
+
+
+def test_disabled_cache(tmp_path):
+    path = str(tmp_path / "project.SOMjson")
+    _create_project().save(path)
+    assert not project_cache.is_enabled()
+    assert SOMcreator.Project.open(path).name == "Cache"
+
+
+def test_cached_open_keeps_gc_paused_by_bulk(tmp_path, cache_dir):
+    path = str(tmp_path / "project.SOMjson")
+    _create_project().save(path)
+    SOMcreator.Project.open(path)
+    assert _get_entries(cache_dir)
+
+    with SOMcreator.Project("Bulk").bulk():
+        SOMcreator.Project.open(path)
+        assert not gc.isenabled()
+    assert gc.isenabled()
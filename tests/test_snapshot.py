@@ -0,0 +1,75 @@
+import SOMcreator
+
+
+def _create_project() -> tuple[SOMcreator.Project, SOMcreator.Object, SOMcreator.Attribute]:
+    proj = SOMcreator.Project("Snapshot")
+    parent = SOMcreator.Object("Parent", None, project=proj, description="Parent Description")
+    parent_pset = SOMcreator.PropertySet("Pset", parent, project=proj)
+    parent_attribute = SOMcreator.Attribute(parent_pset, "Attribute", ["A"], project=proj)
+    parent_attribute.child_inherits_values = True
+    child = SOMcreator.Object("Child", None, project=proj)
+    parent.add_child(child)
+    child_pset = parent_pset.create_child("Pset")
+    child.add_property_set(child_pset)
+    return proj, parent, parent_attribute
+
+
+def test_snapshot_keeps_state_while_editing():
+    proj, parent, parent_attribute = _create_project()
+    child = next(iter(parent.get_children(filter=False)))
+    child_attribute = child.get_property_set_by_name("Pset").get_attribute_by_name("Attribute")
+    snapshot = proj.snapshot()
+
+    parent.name = "Renamed"
+    parent.description = "New Description"
+    parent_attribute.value = ["A", "B"]
+    new_object = SOMcreator.Object("New", None, project=proj)
+    child.delete()
+
+    old_parent = snapshot.get_element_by_uuid(parent.uuid)
+    old_child = snapshot.get_element_by_uuid(child.uuid)
+    assert old_parent.name == "Parent"
+    assert old_child.parent is old_parent
+    assert old_child.description == "Parent Description"
+    assert snapshot.get_view(child_attribute).value == ["A"]
+    assert snapshot.get_element_by_uuid(new_object.uuid) is None
+
+    new_snapshot = proj.snapshot()
+    assert new_snapshot.get_element_by_uuid(parent.uuid).name == "Renamed"
+    assert new_snapshot.get_view(parent_attribute).value == ["A", "B"]
+    assert new_snapshot.get_element_by_uuid(child.uuid) is None
+    assert new_snapshot.get_element_by_uuid(new_object.uuid).name == "New"
+    assert {view.entity for view in new_snapshot.get_objects(filter=False)} == {parent, new_object}
+
+
+def test_snapshot_matches_the_project():
+    proj, parent, parent_attribute = _create_project()
+    proj.snapshot()
+    parent_attribute.value = ["C"]
+    snapshot = proj.snapshot()
+    for item in proj.get_hirarchy_items(filter=False):
+        view = snapshot.get_view(item)
+        assert view.name == item.name
+        assert view.description == item.description
+        assert view.is_optional() == item.is_optional()
+        assert snapshot.get_view(item.parent) is (None if item.parent is None else snapshot.get_view(item.parent))
+        if isinstance(item, SOMcreator.Attribute):
+            assert view.value == item.value
+
+
+def test_older_snapshots_keep_their_version():
+    proj, parent, parent_attribute = _create_project()
+    child = next(iter(parent.get_children(filter=False)))
+    snapshots = list()
+    for index in range(3):
+        parent_attribute.value = [str(index)]
+        snapshots.append(proj.snapshot())
+    child.delete()
+    latest = proj.snapshot()
+
+    for index, snapshot in enumerate(snapshots):
+        assert snapshot.get_view(parent_attribute).value == [str(index)]
+        assert snapshot.get_element_by_uuid(child.uuid).parent.entity is parent
+    assert latest.get_view(parent_attribute).value == ["2"]
+    assert latest.get_element_by_uuid(child.uuid) is None
+    assert not list(latest.get_view(parent).get_children(filter=False))
@@ -0,0 +1,113 @@
+import json
+import os
+
+import pytest
+
+import SOMcreator
+from SOMcreator.constants import value_constants
+from SOMcreator.exporter import som_json
+from SOMcreator.util import json_backend
+
+SECTION_ORDERS = [
+    ["FilterMatrixes", "Project", "PredefinedPropertySets", "Objects", "Aggregations"],
+    ["Aggregations", "Objects", "PredefinedPropertySets", "Project", "FilterMatrixes"],
+]
+
+
+def _create_project() -> SOMcreator.Project:
+    proj = SOMcreator.Project("JSON", phases=[SOMcreator.Phase("P1", "P1", ""), SOMcreator.Phase("P2", "P2", "")])
+    predefined_pset = SOMcreator.PropertySet("Predefined", None, project=proj)
+    SOMcreator.Attribute(predefined_pset, "Shared", ["a", "b"], child_inherits_values=True, project=proj)
+    objects = list()
+    for index in range(6):
+        obj = SOMcreator.Object(f"Object {index}", None, project=proj)
+        pset = SOMcreator.PropertySet("Pset", obj, project=proj)
+        obj.ident_attrib = SOMcreator.Attribute(pset, "Ident", [str(index)], project=proj)
+        obj.add_property_set(predefined_pset.create_child("Predefined"))
+        SOMcreator.Aggregation(obj)
+        objects.append(obj)
+    objects[0].add_child(objects[1])
+    objects[2].set_filter_state(proj.get_phases()[1], proj.get_usecases()[0], False)
+    aggregations = sorted(proj.get_aggregations(filter=False), key=lambda a: a.object.name)
+    aggregations[0].add_child(aggregations[1])
+    aggregations[1].add_child(aggregations[2], value_constants.INHERITANCE)
+    return proj
+
+
+def _normalize(export_dict: dict) -> dict:
+    """replaces the filter matrix indices by the matrices, their order depends on the order of creation"""
+    export_dict = json.loads(json.dumps(export_dict))
+    matrices = export_dict.pop("FilterMatrixes")
+
+    def walk(value):
+        if isinstance(value, dict):
+            return {k: matrices[v] if k == "filter_matrix" and isinstance(v, int) else walk(v)
+                    for k, v in value.items()}
+        if isinstance(value, list):
+            return [walk(v) for v in value]
+        return value
+
+    return walk(export_dict)
+
+
+@pytest.mark.parametrize("order", SECTION_ORDERS, ids=["dependencies_first", "dependencies_last"])
+def test_stream_import_equals_load(tmp_path, order):
+    path = str(tmp_path / "project.SOMjson")
+    with open(path, "w", encoding="utf-8") as file:
+        data = _create_project().save(str(tmp_path / "original.SOMjson"))
+        json.dump({key: data[key] for key in order}, file, indent=2)
+
+    expected = _normalize(SOMcreator.Project.open(path).save(str(tmp_path / "load.SOMjson")))
+    streamed_project = SOMcreator.Project.open(path, stream=True)
+    assert _normalize(streamed_project.save(str(tmp_path / "stream.SOMjson"))) == expected
+    assert len(list(streamed_project.get_objects(filter=False))) == 6
+
+
+@pytest.mark.parametrize("backend", json_backend.get_available_backends())
+def test_stream_export_equals_dict_export(tmp_path, backend):
+    old_backend = json_backend.backend
+    json_backend.set_backend(backend)
+    try:
+        proj = _create_project()
+        proj.plugin_dict["Plugin"] = {"text": "\u00e4\u00f6\u00fc \U0001f600", "values": [1, 2.5, None]}
+        dict_path, stream_path = str(tmp_path / "dict.SOMjson"), str(tmp_path / "stream.SOMjson")
+        proj.save(dict_path)
+        assert proj.save(stream_path, stream=True) is None
+        with open(dict_path, "rb") as dict_file, open(stream_path, "rb") as stream_file:
+            data = stream_file.read()
+            assert data == dict_file.read()
+        assert data == json_backend.dumps(som_json.create_export_dict(proj))
+        imported_project = SOMcreator.Project.open(stream_path)
+        assert _normalize(imported_project.save(dict_path)) == _normalize(json.loads(data))
+    finally:
+        json_backend.set_backend(old_backend)
+
+
+def test_stream_import_matches_load_for_utf8_files(tmp_path):
+    path = str(tmp_path / "project.SOMjson")
+    data = _create_project().save(str(tmp_path / "original.SOMjson"))
+    data["Plugin"] = {"text": "äöü \U0001f600"}
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(data, file, ensure_ascii=False)
+
+    loaded_project = SOMcreator.Project.open(path)
+    streamed_project = SOMcreator.Project.open(path, stream=True)
+    assert streamed_project.import_dict == loaded_project.import_dict
+    assert streamed_project.import_dict["Plugin"] == {"text": "äöü \U0001f600"}
+    assert "Objects" not in loaded_project.import_dict
+
+
+@pytest.mark.parametrize("stream", [False, True], ids=["dict", "stream"])
+def test_failed_export_keeps_the_existing_file(tmp_path, stream):
+    path = str(tmp_path / "project.SOMjson")
+    proj = _create_project()
+    proj.save(path)
+    with open(path, "rb") as file:
+        data = file.read()
+
+    proj.plugin_dict["Plugin"] = {"value": object()}
+    with pytest.raises(TypeError):
+        som_json.export_json(proj, path, stream=stream)
+    with open(path, "rb") as file:
+        assert file.read() == data
+    assert os.listdir(tmp_path) == ["project.SOMjson"]
@@ -0,0 +1,64 @@
+import json
+import os
+
+import pytest
+
+import SOMcreator
+
+
+def _create_inheriting_project():
+    """Object 'B' has a PropertySet that inherits from a PropertySet of Object 'A'"""
+    proj = SOMcreator.Project("Lazy")
+    obj_a = SOMcreator.Object("A", None, project=proj)
+    obj_b = SOMcreator.Object("B", None, project=proj)
+    parent_pset = SOMcreator.PropertySet("Pset", obj_a, project=proj)
+    SOMcreator.Attribute(parent_pset, "Value", ["1"], child_inherits_values=True, project=proj)
+    child_pset = parent_pset.create_child("Pset")
+    obj_b.add_property_set(child_pset)
+    return proj, obj_b, parent_pset, child_pset
+
+
+def test_lazy_parent_in_unloaded_object(tmp_path):
+    proj, obj_b, parent_pset, child_pset = _create_inheriting_project()
+    child_attribute = next(iter(child_pset.get_attributes(filter=False)))
+    parent_attribute = child_attribute.parent
+    path = str(tmp_path / "project.somdb")
+    proj.save(path)
+
+    lazy_proj = SOMcreator.Project.open(path)
+    assert lazy_proj.is_lazy()
+    lazy_b = lazy_proj.get_element_by_uuid(obj_b.uuid)
+    lazy_child_pset = next(iter(lazy_b.get_property_sets(filter=False)))
+    assert lazy_child_pset.parent is not None
+    assert lazy_child_pset.parent.uuid == parent_pset.uuid
+    lazy_child_attribute = next(iter(lazy_child_pset.get_attributes(filter=False)))
+    assert lazy_child_attribute.parent.uuid == parent_attribute.uuid
+
+    json_path = tmp_path / "project.SOMjson"
+    lazy_proj.save(str(json_path))
+    main_dict = json.loads(json_path.read_text())
+    pset_dict = main_dict["Objects"][obj_b.uuid]["PropertySets"][child_pset.uuid]
+    assert pset_dict["parent"] == parent_pset.uuid
+    assert pset_dict["Attributes"][child_attribute.uuid]["parent"] == parent_attribute.uuid
+
+
+def test_lazy_get_property_set_by_name(tmp_path):
+    proj, obj_b, parent_pset, child_pset = _create_inheriting_project()
+    path = str(tmp_path / "project.somdb")
+    proj.save(path)
+
+    lazy_proj = SOMcreator.Project.open(path)
+    lazy_b = lazy_proj.get_element_by_uuid(obj_b.uuid)
+    assert lazy_b.get_property_set_by_name("Pset").uuid == child_pset.uuid
+
+
+def test_failed_save_keeps_the_existing_database(tmp_path):
+    proj, obj_b, parent_pset, child_pset = _create_inheriting_project()
+    path = str(tmp_path / "project.somdb")
+    proj.save(path)
+
+    proj.plugin_dict["Plugin"] = {"value": object()}
+    with pytest.raises(TypeError):
+        proj.save(path)
+    assert os.listdir(tmp_path) == ["project.somdb"]
+    assert SOMcreator.Project.open(path).get_element_by_uuid(obj_b.uuid).name == "B"